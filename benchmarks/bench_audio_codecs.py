@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# ABOUTME: Benchmark of bytes per minute of synthesized speech for each TTS audio encoding
+"""
+Synthesizes the same text with every supported encoding and reports the size
+per minute of speech. Speech duration is measured once from the LINEAR16
+output, since all encodings carry the same audio.
+
+Usage (from the project root, with config.yaml and credentials in place):
+    python benchmarks/bench_audio_codecs.py [--text-file summary.txt]
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import Config
+from src.tts import TextToSpeech
+from src.audio_formats import AUDIO_FORMATS, wav_duration
+
+SAMPLE_TEXT = (
+    "Channel: Example Channel. Video: Building a home lab on a budget. "
+    "The presenter walks through choosing second-hand enterprise hardware, explaining why "
+    "low idle power matters more than peak performance for machines that run all day. "
+    "They compare three small form factor PCs, install a hypervisor, and set up automated "
+    "backups to an off-site target. Key takeaways include labelling every cable, keeping a "
+    "written inventory, and testing restores rather than trusting that backups work. "
+) * 4
+
+
+def synthesize(config, encoding, text, output_path):
+    config.tts_audio_encoding = encoding
+    tts = TextToSpeech(config)
+    start = time.perf_counter()
+    tts.synthesize_text_to_audio(text, output_path)
+    return time.perf_counter() - start, os.path.getsize(output_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare TTS audio encodings")
+    parser.add_argument("--text-file", help="Text to synthesize (defaults to a built-in sample)")
+    parser.add_argument("--output-dir", default="logs/bench_audio", help="Where to keep the generated files")
+    args = parser.parse_args()
+
+    text = SAMPLE_TEXT
+    if args.text_file:
+        with open(args.text_file, "r", encoding="utf-8") as f:
+            text = f.read()
+
+    config = Config()
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    # Reference duration from uncompressed PCM
+    reference_path = os.path.join(args.output_dir, "reference.wav")
+    synthesize(config, "LINEAR16", text, reference_path)
+    with open(reference_path, "rb") as f:
+        minutes = wav_duration(f.read()) / 60.0
+
+    print(f"Speech duration: {minutes * 60:.1f}s for {len(text)} characters\n")
+    print(f"{'Encoding':<10} {'Bytes':>10} {'KB/min':>10} {'vs MP3':>8} {'Synth s':>8}")
+
+    results = {}
+    for encoding, (extension, _) in AUDIO_FORMATS.items():
+        output_path = os.path.join(args.output_dir, f"sample_{encoding.lower()}{extension}")
+        elapsed, size = synthesize(config, encoding, text, output_path)
+        results[encoding] = (size, elapsed)
+
+    mp3_size = results["MP3"][0]
+    for encoding, (size, elapsed) in results.items():
+        print(
+            f"{encoding:<10} {size:>10,} {size / minutes / 1024:>10.1f} "
+            f"{size / mp3_size:>7.2f}x {elapsed:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
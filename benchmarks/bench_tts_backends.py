@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# ABOUTME: Benchmark of wall time and real-time factor for the Google and local TTS engines
+"""
+Synthesizes the same batch of summaries with each TTS engine and reports wall
+time, characters per second and real-time factor (seconds of speech produced
+per second of wall time). Output is LINEAR16 so speech duration can be read
+from the files without extra tooling.
+
+Usage (from the project root, with config.yaml in place; the google engine also
+needs credentials):
+    python benchmarks/bench_tts_backends.py [--backends google local] [--videos 8]
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import Config
+from src.tts import TextToSpeech
+from src.audio_formats import wav_duration
+
+SAMPLE_TEXT = (
+    "Channel: Example Channel. Video: Building a home lab on a budget. "
+    "The presenter walks through choosing second-hand enterprise hardware, explaining why "
+    "low idle power matters more than peak performance for machines that run all day. "
+    "They compare three small form factor PCs, install a hypervisor, and set up automated "
+    "backups to an off-site target. Key takeaways include labelling every cable, keeping a "
+    "written inventory, and testing restores rather than trusting that backups work. "
+) * 2
+
+
+def run_backend(config, backend, texts, output_dir):
+    config.tts_backend = backend
+    config.tts_audio_encoding = "LINEAR16"
+    tts = TextToSpeech(config)
+
+    jobs = [
+        (text, os.path.join(output_dir, f"{backend}_{idx:02d}.wav"))
+        for idx, text in enumerate(texts)
+    ]
+    start = time.perf_counter()
+    if tts.batch_size > 1:
+        tts.synthesize_batch(jobs)
+    else:
+        for text, path in jobs:
+            tts.synthesize_text_to_audio(text, path)
+    elapsed = time.perf_counter() - start
+
+    speech_seconds = 0.0
+    for _, path in jobs:
+        with open(path, "rb") as f:
+            speech_seconds += wav_duration(f.read())
+    return elapsed, speech_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare TTS engines")
+    parser.add_argument("--backends", nargs="+", default=["google", "local"], help="Engines to benchmark")
+    parser.add_argument("--videos", type=int, default=8, help="Number of summaries to synthesize")
+    parser.add_argument("--text-file", help="Summary text to synthesize (defaults to a built-in sample)")
+    parser.add_argument("--output-dir", default="logs/bench_tts", help="Where to keep the generated files")
+    args = parser.parse_args()
+
+    text = SAMPLE_TEXT
+    if args.text_file:
+        with open(args.text_file, "r", encoding="utf-8") as f:
+            text = f.read()
+    # Vary each summary slightly so no engine can serve repeats from a cache
+    texts = [f"Summary {idx + 1}. {text}" for idx in range(args.videos)]
+    total_chars = sum(len(t) for t in texts)
+
+    config = Config()
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    print(f"{args.videos} summaries, {total_chars:,} characters\n")
+    print(f"{'Engine':<8} {'Wall s':>8} {'Chars/s':>10} {'Speech s':>9} {'RTF':>7}")
+    for backend in args.backends:
+        try:
+            elapsed, speech_seconds = run_backend(config, backend, texts, args.output_dir)
+        except Exception as e:
+            print(f"{backend:<8} failed: {e}")
+            continue
+        print(
+            f"{backend:<8} {elapsed:>8.2f} {total_chars / elapsed:>10,.0f} "
+            f"{speech_seconds:>9.1f} {speech_seconds / elapsed:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # ABOUTME: Main entry point for YouTube Transcript Processor - orchestrates video processing pipeline
-import os
 import logging
+import argparse
 import warnings
 import time
 from pathlib import Path
@@ -26,110 +26,579 @@ from src.youtube_processor import YouTubeProcessor
 from src.summarizer import Summarizer
 from src.tts import TextToSpeech
 from src.drive_uploader import DriveUploader
-from src.utils import sanitize_name, save_text_file
+from src.upload_pool import UploadPool
+from src.search_index import SearchIndex
+from src.dedup import DuplicateDetector
+from src.budget import RunBudget
+from src.backfill import BackfillWindow
+from src.journal import RunJournal
+from src.tracing import tracer
+from src.resilience import resilience, CircuitOpenError, StageUnavailable, is_upstream_failure
+from src.artifact_store import artifacts
+from src.audio_formats import audio_extension, audio_mimetype
+from src.transcript_store import (
+    read_transcript_text,
+    TRANSCRIPT_STORE_SUFFIX,
+    TRANSCRIPT_STORE_MIMETYPE,
+)
+from src.utils import sanitize_name
 
 
 def process_channel_complete(
-    channel_username, output_folder, youtube_processor, summarizer, tts, config
+    channel_username, output_folder, youtube_processor, summarizer, tts, config,
+    search_index=None, duplicate_detector=None, deferred=None,
 ):
     """
     Process a single channel completely: extract transcripts, generate summaries,
     create audio files.
-    """
-    # Step 1: Get transcripts
-    channel_folder = youtube_processor.process_channel(channel_username, output_folder)
 
-    if not channel_folder:
+    Videos are streamed through the pipeline one at a time: each transcript is
+    summarized and voiced as soon as it is saved, and only running counters are kept.
+    Videos blocked by an open circuit are added to the deferred list.
+    """
+    try:
+        channel_folder = youtube_processor.prepare_channel_folder(channel_username, output_folder)
+    except OSError as e:
+        print(f"❌ Error preparing folder for channel '{channel_username}': {e}")
+        logging.error(f"Error preparing folder for channel {channel_username}: {e}")
         return None
 
-    # Step 2: Process each video for summaries and audio
-    channel_name = sanitize_name(channel_username)
-    transcripts_folder = channel_folder / config.drive_transcripts_folder
+    completed = 0
+    queues = new_output_queues(summarizer, tts, config, deferred=deferred)
+
+    # Step 1: Finish transcripts left over from earlier runs
+    for record in youtube_processor.iter_pending_transcripts(channel_folder):
+        completed += process_queued_outputs(
+            record, channel_username, channel_folder, summarizer, tts, config, queues,
+            search_index=search_index, duplicate_detector=duplicate_detector,
+        )
+
+    # Step 2: Stream new videos from transcript extraction into summaries and audio
+    for record in youtube_processor.iter_channel_videos(channel_username, channel_folder):
+        if record["status"] != "SUCCESS":
+            continue
+        completed += process_queued_outputs(
+            record, channel_username, channel_folder, summarizer, tts, config, queues,
+            search_index=search_index, duplicate_detector=duplicate_detector,
+        )
+
+    completed += flush_output_queues(
+        summarizer, tts, config, queues, search_index=search_index, duplicate_detector=duplicate_detector,
+    )
+    if duplicate_detector:
+        duplicate_detector.save()
+
+    logging.info(f"Channel {channel_username}: {completed} video(s) with summary and audio ready")
+    return channel_folder
+
+
+def split_transcript_stem(transcript_file):
+    """Extract video title and date suffix from a transcript filename"""
+    parts = transcript_file.stem.rsplit("_", 1)
+    if len(parts) == 2:
+        return parts[0], parts[1]
+    return transcript_file.stem, ""
+
+
+def artifact_paths(transcript_file, channel_folder, config):
+    """Return the (summary, audio, duplicate link) paths belonging to a transcript"""
+    file_stem = transcript_file.stem
     summaries_folder = channel_folder / config.drive_summaries_folder
     audio_folder = channel_folder / config.drive_audio_folder
+    return (
+        summaries_folder / f"{file_stem}_summary.txt",
+        audio_folder / f"{file_stem}{audio_extension(config.tts_audio_encoding)}",
+        summaries_folder / f"{file_stem}_duplicate.txt",
+    )
 
-    # Read channel data CSV to get list of successfully processed videos
-    csv_path = channel_folder / "channel_data.csv"
-    if not csv_path.exists():
-        logging.info(f"No channel data CSV found for {channel_username}")
-        return channel_folder
-
-    import pandas as pd
-
-    df = pd.read_csv(csv_path)
-    successful_videos = df[df["Status"] == "SUCCESS"]
-
-    for _, row in successful_videos.iterrows():
-        video_id = row["Video ID"]
-        video_url = row["Video URL"]
-
-        # Find corresponding transcript file
-        transcript_files = list(transcripts_folder.glob(f"*{video_id[:8]}*.txt"))
-        if not transcript_files:
-            # Try to match by any file in the transcripts folder
-            transcript_files = list(transcripts_folder.glob("*.txt"))
-
-        for transcript_file in transcript_files:
-            # Read transcript
-            with open(transcript_file, "r", encoding="utf-8") as f:
-                transcript_text = f.read()
-
-            # Extract video title and date from filename
-            file_stem = transcript_file.stem
-            parts = file_stem.rsplit("_", 1)
-            if len(parts) == 2:
-                video_title = parts[0]
-                date_suffix = parts[1]
+
+def collect_channel_work(channel_username, output_folder, youtube_processor, config, run_budget):
+    """
+    Run the transcript stage for a channel and register every video that still
+    needs a summary or audio with the run budget. Returns the channel folder.
+    """
+    try:
+        channel_folder = youtube_processor.prepare_channel_folder(channel_username, output_folder)
+    except OSError as e:
+        print(f"❌ Error preparing folder for channel '{channel_username}': {e}")
+        logging.error(f"Error preparing folder for channel {channel_username}: {e}")
+        return None
+
+    new_records = (
+        record
+        for record in youtube_processor.iter_channel_videos(channel_username, channel_folder)
+        if record["status"] == "SUCCESS"
+    )
+    journal = RunJournal.for_folder(channel_folder)
+    for records in (youtube_processor.iter_pending_transcripts(channel_folder), new_records):
+        for record in records:
+            transcript_file = record["transcript_path"]
+            summary_file, audio_file, duplicate_file = artifact_paths(transcript_file, channel_folder, config)
+            if journal.is_complete(duplicate_file) or journal.is_complete(audio_file):
+                continue
+
+            summary_chars = journal.size(summary_file) if journal.is_complete(summary_file) else None
+            transcript_chars = len(read_transcript_text(transcript_file))
+            _, date_suffix = split_transcript_stem(transcript_file)
+            run_budget.add_candidate(
+                channel_username,
+                record,
+                date_suffix,
+                run_budget.estimate(transcript_chars, summary_chars),
+                artifacts=(summary_file, audio_file, duplicate_file),
+            )
+
+    return channel_folder
+
+
+def process_video_outputs(
+    record, channel_username, channel_folder, summarizer, tts, config,
+    search_index=None, duplicate_detector=None, audio_jobs=None,
+    summary_batch=None, prepared_summary=None,
+):
+    """
+    Generate the summary and audio for one transcript record.
+    Returns True when both artifacts exist (or the video was linked as a duplicate).
+
+    If audio_jobs is a list, the audio is queued on it instead of synthesized;
+    flush_audio_jobs() then writes it and counts it as completed. Likewise, if
+    summary_batch is a list, short transcripts are queued on it to be packed
+    into one request by flush_summary_batch(), which calls back here with the
+    resulting (summary, engine) as prepared_summary.
+    """
+    started = time.monotonic()
+    with tracer.trace(record["video_id"], "video.outputs", channel=channel_username):
+        completed = _generate_video_outputs(
+            record, channel_username, channel_folder, summarizer, tts, config,
+            search_index=search_index, duplicate_detector=duplicate_detector,
+            audio_jobs=audio_jobs, summary_batch=summary_batch, prepared_summary=prepared_summary,
+        )
+    if completed:
+        resilience.observe("video.outputs", time.monotonic() - started)
+    return completed
+
+
+def _generate_video_outputs(
+    record, channel_username, channel_folder, summarizer, tts, config,
+    search_index=None, duplicate_detector=None, audio_jobs=None,
+    summary_batch=None, prepared_summary=None,
+):
+    video_id = record["video_id"]
+    video_url = record["video_url"]
+    transcript_file = record["transcript_path"]
+    video_title, date_suffix = split_transcript_stem(transcript_file)
+
+    # Check if summary already exists
+    summary_file, audio_file, duplicate_file = artifact_paths(transcript_file, channel_folder, config)
+    summary_filename = summary_file.name
+    audio_filename = audio_file.name
+    journal = RunJournal.for_folder(channel_folder)
+    summary_text = None
+
+    if journal.is_complete(duplicate_file):
+        return True
+
+    # Generate summary if it doesn't exist
+    if not journal.is_complete(summary_file):
+        # Read transcript (derives plain text from segment stores)
+        transcript_text = read_transcript_text(transcript_file)
+
+        signature = None
+        if duplicate_detector:
+            signature = duplicate_detector.signature(transcript_text)
+            # A prepared summary was already checked for duplicates before it was queued
+            match = None if prepared_summary else duplicate_detector.find_duplicate(signature, exclude_video_id=video_id)
+            if match:
+                entry, similarity = match
+                artifacts.save(
+                    "duplicate",
+                    duplicate_file,
+                    f"This video is a near-duplicate ({similarity:.0%} similar) of "
+                    f"'{entry['title']}' from channel {entry['channel']} "
+                    f"(https://www.youtube.com/watch?v={entry['video_id']}).\n"
+                    f"Summary: {entry['summary_file']}\n"
+                    f"Audio: {entry['audio_file']}\n",
+                    journal,
+                    channel_username,
+                    video_id=video_id,
+                )
+                duplicate_detector.record_skip(len(transcript_text), entry)
+                print(f"♻️  Near-duplicate of {entry['video_id']} ({similarity:.0%}) - linked existing summary")
+                logging.info(
+                    f"Video {video_id} is a near-duplicate of {entry['video_id']} "
+                    f"({similarity:.2f}); skipped summary and audio"
+                )
+                return True
+
+        if config.summary_timestamps:
+            # Segment stores keep timing, so the summary can point to key moments
+            transcript_text = read_transcript_text(transcript_file, timestamps=True)
+
+        channel_details = f"Channel: {channel_username}"
+        video_details = f"Title: {video_title}, URL: {video_url}"
+        if summary_batch is not None and prepared_summary is None and summarizer.packable(transcript_text):
+            summary_batch.append({
+                "key": video_id,
+                "record": record,
+                "channel": channel_username,
+                "channel_folder": channel_folder,
+                "transcript_text": transcript_text,
+                "signature": signature,
+                "channel_details": channel_details,
+                "video_details": video_details,
+            })
+            return False
+
+        try:
+            journal.start("summary", summary_file)
+            if prepared_summary:
+                summary_text, engine = prepared_summary
             else:
-                video_title = file_stem
-                date_suffix = ""
+                summary_text = summarizer.generate_summary(
+                    transcript_text, channel_details, video_details
+                )
+                engine = summarizer.last_engine
+
+            # Save summary
+            artifacts.save(
+                "summary", summary_file, summary_text, journal, channel_username, video_id=video_id, engine=engine,
+            )
+            logging.info(f"Summary generated: {summary_file}")
+
+            if duplicate_detector:
+                duplicate_detector.add(
+                    video_id,
+                    signature,
+                    channel=channel_username,
+                    title=video_title,
+                    summary_file=summary_filename,
+                    audio_file=audio_filename,
+                    summary_chars=len(summary_text),
+                )
+
+            if search_index:
+                search_index.add_document(
+                    video_id,
+                    "summary",
+                    summary_text,
+                    channel=channel_username,
+                    title=video_title,
+                    published=date_suffix,
+                    path=summary_filename,
+                )
+        except StageUnavailable:
+            # OpenAI is paused; the caller defers the video instead of failing it
+            raise
+        except Exception as e:
+            if is_upstream_failure(e):
+                # An outage, even before the circuit trips: keep the video for a retry
+                raise StageUnavailable("openai", e) from e
+            logging.error(f"Error generating summary for {video_title}: {e}")
+            return False
+
+    # Generate audio if it doesn't exist
+    if not journal.is_complete(audio_file):
+        try:
+            # Read summary for audio generation (from Drive if it was uploaded directly)
+            if summary_text is None:
+                summary_text = artifacts.read_text(summary_file, journal)
+
+            if audio_jobs is not None:
+                audio_jobs.append({
+                    "text": summary_text,
+                    "path": audio_file,
+                    "video_id": video_id,
+                    "title": video_title,
+                    "journal": journal,
+                    "record": record,
+                    "channel": channel_username,
+                    "channel_folder": channel_folder,
+                })
+                return False
+
+            journal.start("audio", audio_file)
+            audio_content = tts.render_batch([summary_text])[0]
+            artifacts.save("audio", audio_file, audio_content, journal, channel_username, video_id=video_id)
+            logging.info(f"Audio generated: {audio_file}")
+        except StageUnavailable:
+            raise
+        except Exception as e:
+            if is_upstream_failure(e):
+                raise StageUnavailable("tts", e) from e
+            logging.error(f"Error generating audio for {video_title}: {e}")
+            return False
+
+    return True
+
+
+def new_output_queues(summarizer, tts, config, deferred=None):
+    """
+    Queues for work that is cheaper done several videos at a time: short
+    transcripts packed into one summary request, and summaries synthesized
+    together by a local TTS engine. A queue is None when batching is off.
+
+    "deferred" collects (record, channel, channel_folder, stage) for videos
+    whose next stage hit an open circuit or an outage (StageUnavailable);
+    requeue_deferred() retries them.
+    """
+    return {
+        "summaries": [] if config.openai_pack_enabled else None,
+        "audio": [] if tts.batch_size > 1 else None,
+        "deferred": deferred if deferred is not None else [],
+    }
+
+
+def defer_video_outputs(deferred, record, channel_username, channel_folder, stage):
+    """Park a video whose summary or audio is blocked by an unavailable upstream"""
+    deferred.append((record, channel_username, channel_folder, stage))
+    print(f"⏸️  {stage} paused - deferred outputs for {record['video_id']}")
+    logging.info(f"Deferred outputs for video {record['video_id']} ({channel_username}): {stage} unavailable")
+
+
+def deferred_output_paths(deferred, config):
+    """
+    Transcripts and any finished outputs (e.g. the summary of a video paused at
+    the tts stage) of deferred videos, which must stay on disk until the video
+    is done; otherwise the requeue would not find them and redo them.
+    """
+    paths = set()
+    for record, _, channel_folder, _ in deferred:
+        paths.add(record["transcript_path"])
+        paths.update(artifact_paths(record["transcript_path"], channel_folder, config))
+    return paths
+
+
+def process_queued_outputs(
+    record, channel_username, channel_folder, summarizer, tts, config, queues,
+    search_index=None, duplicate_detector=None,
+):
+    """process_video_outputs() through the output queues, flushing any that are full.
+    Returns the number of videos completed."""
+    completed = 0
+    try:
+        if process_video_outputs(
+            record, channel_username, channel_folder, summarizer, tts, config,
+            search_index=search_index, duplicate_detector=duplicate_detector,
+            audio_jobs=queues["audio"], summary_batch=queues["summaries"],
+        ):
+            completed += 1
+    except StageUnavailable as e:
+        defer_video_outputs(queues["deferred"], record, channel_username, channel_folder, e.stage)
+    if queues["summaries"] and len(queues["summaries"]) >= config.openai_pack_max_videos:
+        completed += flush_summary_batch(
+            queues["summaries"], summarizer, tts, config,
+            search_index=search_index, duplicate_detector=duplicate_detector,
+            audio_jobs=queues["audio"], deferred=queues["deferred"],
+        )
+    if queues["audio"] and len(queues["audio"]) >= tts.batch_size:
+        completed += flush_audio_jobs(queues["audio"], tts, deferred=queues["deferred"])
+    return completed
 
-            # Check if summary already exists
-            summary_filename = f"{file_stem}_summary.txt"
-            summary_file = summaries_folder / summary_filename
-            audio_filename = f"{file_stem}.mp3"
-            audio_file = audio_folder / audio_filename
 
-            # Generate summary if it doesn't exist
-            if not summary_file.exists():
+def flush_output_queues(summarizer, tts, config, queues, search_index=None, duplicate_detector=None):
+    """Drain both output queues. Returns the number of videos completed."""
+    completed = flush_summary_batch(
+        queues["summaries"], summarizer, tts, config,
+        search_index=search_index, duplicate_detector=duplicate_detector,
+        audio_jobs=queues["audio"], deferred=queues["deferred"],
+    )
+    return completed + flush_audio_jobs(queues["audio"], tts, deferred=queues["deferred"])
+
+
+def flush_summary_batch(
+    summary_batch, summarizer, tts, config,
+    search_index=None, duplicate_detector=None, audio_jobs=None, deferred=None,
+):
+    """
+    Summarize queued short transcripts in packed requests, then finish each
+    video (save, index, audio) as usual. Empties the queue and returns the
+    number of videos completed. With a deferred list, videos left without a
+    summary because the openai circuit opened are parked there. Near-duplicates
+    within the batch are held back and linked once the first of them is indexed.
+    """
+    if not summary_batch:
+        return 0
+    items = []
+    held = []
+    for item in summary_batch:
+        # Near-duplicates queued together: summarize the first, link the others to it afterwards
+        if duplicate_detector and any(
+            duplicate_detector.is_duplicate(item["signature"], kept["signature"]) for kept in items
+        ):
+            held.append(item)
+        else:
+            items.append(item)
+    summary_batch.clear()
+
+    with tracer.trace(items[0]["key"], "video.summary_batch", videos=len(items)):
+        summaries = summarizer.summarize_packed(items)
+
+    completed = 0
+    for item in items:
+        if item["key"] not in summaries:
+            if item["key"] in summarizer.unavailable_keys and deferred is not None:
+                defer_video_outputs(deferred, item["record"], item["channel"], item["channel_folder"], "openai")
+            continue
+        try:
+            if process_video_outputs(
+                item["record"], item["channel"], item["channel_folder"], summarizer, tts, config,
+                search_index=search_index, duplicate_detector=duplicate_detector,
+                audio_jobs=audio_jobs, prepared_summary=summaries[item["key"]],
+            ):
+                completed += 1
+        except StageUnavailable as e:
+            if deferred is None:
+                raise
+            defer_video_outputs(deferred, item["record"], item["channel"], item["channel_folder"], e.stage)
+        if audio_jobs and len(audio_jobs) >= tts.batch_size:
+            completed += flush_audio_jobs(audio_jobs, tts, deferred=deferred)
+
+    # The index now holds the batch, so held videos are linked (or summarized alone if theirs failed)
+    for item in held:
+        try:
+            if process_video_outputs(
+                item["record"], item["channel"], item["channel_folder"], summarizer, tts, config,
+                search_index=search_index, duplicate_detector=duplicate_detector, audio_jobs=audio_jobs,
+            ):
+                completed += 1
+        except StageUnavailable as e:
+            if deferred is None:
+                raise
+            defer_video_outputs(deferred, item["record"], item["channel"], item["channel_folder"], e.stage)
+    if duplicate_detector:
+        duplicate_detector.save()
+    return completed
+
+
+def flush_audio_jobs(audio_jobs, tts, deferred=None):
+    """
+    Synthesize queued summaries as one batch and empty the queue.
+    Returns the number of audio files written. With a deferred list, jobs
+    blocked by an open tts circuit or a tts outage are parked there.
+    """
+    if not audio_jobs:
+        return 0
+    jobs = list(audio_jobs)
+    audio_jobs.clear()
+
+    for job in jobs:
+        job["journal"].start("audio", job["path"])
+
+    paused = []
+    with tracer.trace(jobs[0]["video_id"], "video.audio_batch", videos=len(jobs)):
+        try:
+            audio = dict(zip((str(job["path"]) for job in jobs), tts.render_batch([job["text"] for job in jobs])))
+        except CircuitOpenError:
+            audio = {}
+            paused = jobs
+        except Exception as e:
+            # One bad summary should not cost the whole batch; retry each on its own
+            logging.warning(f"Batch audio synthesis of {len(jobs)} summaries failed ({e}); retrying individually")
+            audio = {}
+            for job in jobs:
                 try:
-                    channel_details = f"Channel: {channel_username}"
-                    video_details = f"Title: {video_title}, URL: {video_url}"
-                    summary_text = summarizer.generate_summary(
-                        transcript_text, channel_details, video_details
-                    )
-
-                    # Save summary
-                    with open(summary_file, "w", encoding="utf-8") as f:
-                        f.write(summary_text)
-                    logging.info(f"Summary generated: {summary_file}")
+                    audio[str(job["path"])] = tts.render_batch([job["text"]])[0]
                 except Exception as e:
-                    logging.error(f"Error generating summary for {video_title}: {e}")
-                    continue
+                    if isinstance(e, CircuitOpenError) or is_upstream_failure(e):
+                        paused.append(job)
+                    else:
+                        logging.error(f"Error generating audio for {job['title']}: {e}")
+
+    for job in paused:
+        if deferred is not None:
+            defer_video_outputs(deferred, job["record"], job["channel"], job["channel_folder"], "tts")
+        else:
+            logging.error(f"Error generating audio for {job['title']}: tts unavailable")
+
+    written = 0
+    for job in jobs:
+        audio_content = audio.pop(str(job["path"]), None)
+        if audio_content is None:
+            continue
+        try:
+            artifacts.save(
+                "audio", job["path"], audio_content, job["journal"], job["channel"], video_id=job["video_id"],
+            )
+        except OSError as e:
+            logging.error(f"Error saving audio for {job['title']}: {e}")
+            continue
+        logging.info(f"Audio generated: {job['path']}")
+        written += 1
+    return written
 
-            # Generate audio if it doesn't exist
-            if not audio_file.exists() and summary_file.exists():
-                try:
-                    # Read summary for audio generation
-                    with open(summary_file, "r", encoding="utf-8") as f:
-                        summary_text = f.read()
 
-                    tts.synthesize_text_to_audio(summary_text, str(audio_file))
-                    logging.info(f"Audio generated: {audio_file}")
-                except Exception as e:
-                    logging.error(f"Error generating audio for {video_title}: {e}")
+def requeue_deferred(
+    queues, youtube_processor, summarizer, tts, config,
+    search_index=None, duplicate_detector=None, retry_transcripts=True,
+):
+    """
+    Retry work paused by open circuits once the upstream accepts requests
+    again: transcript fetches first, then summaries and audio. Waits at most
+    circuit_requeue_wait seconds per stage; anything still blocked stays in
+    queues["deferred"] (and on disk) for the next run.
+    Returns the usernames of channels that got new files.
+    """
+    touched = set()
+    if retry_transcripts and youtube_processor.deferred_videos:
+        if resilience.wait_for_circuits(["transcripts"], config.circuit_requeue_wait):
+            print(f"\n🔁 Retrying {len(youtube_processor.deferred_videos)} deferred transcript(s)")
+            for username, channel_folder, record in youtube_processor.retry_deferred():
+                if record["status"] != "SUCCESS":
                     continue
+                touched.add(username)
+                process_queued_outputs(
+                    record, username, channel_folder, summarizer, tts, config, queues,
+                    search_index=search_index, duplicate_detector=duplicate_detector,
+                )
+            flush_output_queues(
+                summarizer, tts, config, queues, search_index=search_index, duplicate_detector=duplicate_detector,
+            )
 
-    return channel_folder
+    deferred = queues["deferred"]
+    stages = sorted({stage for _, _, _, stage in deferred})
+    if deferred and resilience.wait_for_circuits(stages, config.circuit_requeue_wait):
+        retry = list(deferred)
+        deferred.clear()
+        print(f"\n🔁 Retrying outputs for {len(retry)} deferred video(s)")
+        for record, username, channel_folder, _ in retry:
+            touched.add(username)
+            process_queued_outputs(
+                record, username, channel_folder, summarizer, tts, config, queues,
+                search_index=search_index, duplicate_detector=duplicate_detector,
+            )
+        flush_output_queues(
+            summarizer, tts, config, queues, search_index=search_index, duplicate_detector=duplicate_detector,
+        )
+
+    still_deferred = len(deferred) + len(youtube_processor.deferred_videos)
+    if still_deferred:
+        print(f"⏸️  {still_deferred} video(s) still blocked by open circuits - left for the next run")
+        logging.warning(f"{still_deferred} video(s) left deferred by open circuits")
+    return touched
+
+
+def upload_channel_files(channel_folder, channel_username, drive_uploader, config, keep_files=None):
+    """
+    Upload all files from a channel folder to Google Drive.
+    Paths in keep_files (e.g. transcripts deferred by the budget) stay local.
+    While the drive circuit is open nothing is uploaded and all files stay local.
+    """
+    with tracer.trace(f"upload:{channel_username}", "drive.upload_channel", channel=channel_username):
+        try:
+            _upload_channel_files(channel_folder, channel_username, drive_uploader, config, keep_files)
+        except CircuitOpenError:
+            print(f"⏸️  Google Drive paused - files for {channel_username} kept locally")
+            logging.warning(f"Drive circuit open; uploads for channel {channel_username} deferred")
 
 
-def upload_channel_files(channel_folder, channel_username, drive_uploader, config):
-    """Upload all files from a channel folder to Google Drive"""
+def _upload_channel_files(channel_folder, channel_username, drive_uploader, config, keep_files=None):
+    keep_files = keep_files or set()
     if not channel_folder or not channel_folder.exists():
         logging.info(f"Channel folder does not exist for {channel_username}")
         return
 
     channel_name = sanitize_name(channel_username)
+    journal = RunJournal.for_folder(channel_folder)
 
     # Create base folder structure in Drive
     base_folder_id = drive_uploader.get_or_create_folder(config.drive_base_folder)
@@ -152,9 +621,10 @@ def upload_channel_files(channel_folder, channel_username, drive_uploader, confi
     upload_configs = [
         (config.drive_transcripts_folder, transcripts_folder_id, "text/plain"),
         (config.drive_summaries_folder, summaries_folder_id, "text/plain"),
-        (config.drive_audio_folder, audio_folder_id, "audio/mpeg"),
+        (config.drive_audio_folder, audio_folder_id, None),
     ]
 
+    jobs = []
     for subfolder_name, drive_folder_id, mimetype in upload_configs:
         local_subfolder = channel_folder / subfolder_name
         if not local_subfolder.exists():
@@ -164,63 +634,236 @@ def upload_channel_files(channel_folder, channel_username, drive_uploader, confi
             continue
 
         for file in local_subfolder.iterdir():
-            if file.is_file():
-                file_id = drive_uploader.upload_file(
-                    str(file), folder_id=drive_folder_id, mimetype=mimetype
-                )
-                # Delete local file after successful upload
-                if file_id:
-                    try:
-                        os.remove(file)
-                        logging.info(f"Deleted local file: {file}")
-                    except Exception as e:
-                        logging.error(f"Error deleting local file {file}: {e}")
+            # Dotfiles are in-progress temp files from atomic writes
+            # Local copies of directly uploaded artifacts are already in Drive
+            if (
+                file.is_file()
+                and not file.name.startswith(".")
+                and file not in keep_files
+                and not journal.remote_file_id(file)
+            ):
+                if file.suffix == TRANSCRIPT_STORE_SUFFIX:
+                    jobs.append((file, drive_folder_id, TRANSCRIPT_STORE_MIMETYPE))
+                elif mimetype is None:
+                    # Audio mimetype follows the file's codec (.mp3, .ogg, .wav)
+                    jobs.append((file, drive_folder_id, audio_mimetype(file)))
+                else:
+                    jobs.append((file, drive_folder_id, mimetype))
+
+    if not jobs:
+        return
 
+    # Upload concurrently; each local file is deleted once its own upload is confirmed
+    upload_pool = UploadPool(
+        drive_uploader,
+        max_workers=config.drive_upload_workers,
+        max_inflight_bytes=config.drive_max_inflight_mb * 1024 * 1024,
+    )
+    uploaded = upload_pool.upload_all(jobs)
+    print(f"☁️  Uploaded {uploaded}/{len(jobs)} files for channel: {channel_username}")
+    logging.info(f"Uploaded {uploaded}/{len(jobs)} files for channel {channel_username}")
 
-def main():
-    """Main application entry point"""
-    # Initialize configuration
-    config = Config()
 
+def retry_paused_uploads(channel_folders, drive_uploader, config, keep_files=None, usernames=()):
+    """
+    Upload again for channels in usernames, or for every channel if the drive
+    circuit tripped during the run (files it blocked are still on disk).
+    """
+    if resilience.breaker("drive").trips:
+        usernames = set(channel_folders)
+    if not usernames:
+        return
+    if not resilience.wait_for_circuits(["drive"], config.circuit_requeue_wait):
+        print("⏸️  Google Drive still paused - remaining files will be uploaded by the next run")
+        return
+    for username in usernames:
+        if channel_folders.get(username):
+            print(f"\nUploading remaining files to Google Drive for channel: {username}")
+            upload_channel_files(channel_folders[username], username, drive_uploader, config, keep_files=keep_files)
+
+
+def run_budgeted(
+    output_folder, youtube_processor, summarizer, tts, drive_uploader, config,
+    search_index=None, duplicate_detector=None,
+):
+    """
+    Budgeted run: extract transcripts for every channel first, then spend the
+    OpenAI/TTS/Drive budget on the highest-priority, most recent videos.
+    Deferred transcripts stay on disk for the next run.
+    """
+    run_budget = RunBudget(config)
+
+    # Phase 1: transcripts for all channels
+    channel_folders = {}
+    for idx, username in enumerate(config.channels):
+        print(f"\n{'='*60}")
+        print(f"Extracting transcripts for channel: {username}")
+        print(f"{'='*60}\n")
+        channel_folders[username] = collect_channel_work(
+            username, output_folder, youtube_processor, config, run_budget
+        )
+
+        if idx < len(config.channels) - 1 and config.delay_between_channels > 0:
+            print(f"\n⏱️  Waiting {config.delay_between_channels}s before processing next channel...\n")
+            time.sleep(config.delay_between_channels)
+
+    # Phase 2: plan, then summaries and audio in priority order
+    scheduled = run_budget.plan()
+    queues = new_output_queues(summarizer, tts, config)
+    for username, records in scheduled.items():
+        for record in records:
+            process_queued_outputs(
+                record, username, channel_folders[username], summarizer, tts, config, queues,
+                search_index=search_index, duplicate_detector=duplicate_detector,
+            )
+        # Packed summary requests group videos from one channel
+        flush_summary_batch(
+            queues["summaries"], summarizer, tts, config,
+            search_index=search_index, duplicate_detector=duplicate_detector,
+            audio_jobs=queues["audio"], deferred=queues["deferred"],
+        )
+    flush_audio_jobs(queues["audio"], tts, deferred=queues["deferred"])
+
+    # Videos paused by an open circuit were already paid for in the plan; transcripts
+    # deferred in phase 1 were not, so they wait for the next run's plan
+    requeue_deferred(
+        queues, youtube_processor, summarizer, tts, config,
+        search_index=search_index, duplicate_detector=duplicate_detector, retry_transcripts=False,
+    )
+
+    # Phase 3: upload everything except deferred transcripts
+    keep_files = run_budget.deferred_paths() | deferred_output_paths(queues["deferred"], config)
+    for username, channel_folder in channel_folders.items():
+        if channel_folder:
+            print(f"\nUploading files to Google Drive for channel: {username}")
+            upload_channel_files(channel_folder, username, drive_uploader, config, keep_files=keep_files)
+    retry_paused_uploads(channel_folders, drive_uploader, config, keep_files)
+
+    run_budget.record_actual(
+        tokens=summarizer.tokens_used,
+        tts_chars=tts.characters_synthesized,
+        drive_bytes=drive_uploader.bytes_uploaded,
+    )
+    run_budget.report()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Turn recent YouTube videos into transcripts, summaries and audio")
+    parser.add_argument(
+        "--backfill",
+        action="store_true",
+        help="Archive each channel's whole history (sharded and resumable) instead of the last days_back days",
+    )
+    parser.add_argument(
+        "--since", type=BackfillWindow.parse_date, help="With --backfill: oldest publish date to include (YYYY-MM-DD)"
+    )
+    parser.add_argument(
+        "--until", type=BackfillWindow.parse_date, help="With --backfill: newest publish date to include (YYYY-MM-DD)"
+    )
+    args = parser.parse_args()
+    if (args.since or args.until) and not args.backfill:
+        parser.error("--since and --until require --backfill")
+    return args
+
+
+def run_pipeline(args, config):
+    """Process every configured channel and print the run reports"""
     if not config.channels:
         logging.error("No channels found in the configuration file.")
         exit(1)
 
     # Initialize components
-    youtube_processor = YouTubeProcessor(config)
+    search_index = SearchIndex(config.search_index_path) if config.search_index_enabled else None
+    backfill = BackfillWindow(args.since, args.until) if args.backfill else None
+    youtube_processor = YouTubeProcessor(config, search_index=search_index, backfill=backfill)
+    duplicate_detector = DuplicateDetector(config) if config.dedup_enabled else None
     summarizer = Summarizer(config)
     tts = TextToSpeech(config)
     drive_uploader = DriveUploader(config)
+    artifacts.configure(config, drive_uploader)
 
     # Local output folder
     output_folder = Path("channels")
     output_folder.mkdir(exist_ok=True)
 
-    # Process each channel
-    for idx, username in enumerate(config.channels):
-        print(f"\n{'='*60}")
-        print(f"Processing channel: {username}")
-        print(f"{'='*60}\n")
+    if config.budget_enabled:
+        run_budgeted(
+            output_folder, youtube_processor, summarizer, tts, drive_uploader, config,
+            search_index=search_index,
+            duplicate_detector=duplicate_detector,
+        )
+    else:
+        # Process each channel
+        channel_folders = {}
+        deferred = []
+        for idx, username in enumerate(config.channels):
+            print(f"\n{'='*60}")
+            print(f"Processing channel: {username}")
+            print(f"{'='*60}\n")
+
+            # Complete processing: transcripts, summaries, audio
+            channel_folder = process_channel_complete(
+                username, output_folder, youtube_processor, summarizer, tts, config,
+                search_index=search_index,
+                duplicate_detector=duplicate_detector,
+                deferred=deferred,
+            )
+
+            # Upload to Google Drive and clean up local files
+            if channel_folder:
+                channel_folders[username] = channel_folder
+                print(f"\nUploading files to Google Drive for channel: {username}")
+                upload_channel_files(
+                    channel_folder, username, drive_uploader, config,
+                    keep_files=deferred_output_paths(deferred, config),
+                )
+
+            # Add delay between channels (except after the last one)
+            if idx < len(config.channels) - 1 and config.delay_between_channels > 0:
+                print(f"\n⏱️  Waiting {config.delay_between_channels}s before processing next channel...\n")
+                time.sleep(config.delay_between_channels)
 
-        # Complete processing: transcripts, summaries, audio
-        channel_folder = process_channel_complete(
-            username, output_folder, youtube_processor, summarizer, tts, config
+        # Work paused by open circuits gets one more try once the upstream recovers
+        queues = new_output_queues(summarizer, tts, config, deferred=deferred)
+        touched = requeue_deferred(
+            queues, youtube_processor, summarizer, tts, config,
+            search_index=search_index, duplicate_detector=duplicate_detector,
+        )
+        retry_paused_uploads(
+            channel_folders, drive_uploader, config,
+            keep_files=deferred_output_paths(deferred, config), usernames=touched,
         )
 
-        # Upload to Google Drive and clean up local files
-        if channel_folder:
-            print(f"\nUploading files to Google Drive for channel: {username}")
-            upload_channel_files(channel_folder, username, drive_uploader, config)
+    summarizer.report()
+    artifacts.report()
+    if duplicate_detector:
+        # Entries added by requeued or budgeted videos
+        duplicate_detector.save()
+        duplicate_detector.report()
 
-        # Add delay between channels (except after the last one)
-        if idx < len(config.channels) - 1 and config.delay_between_channels > 0:
-            print(f"\n⏱️  Waiting {config.delay_between_channels}s before processing next channel...\n")
-            time.sleep(config.delay_between_channels)
+    resilience.report()
 
     print(f"\n{'='*60}")
     print("All channels processed successfully!")
     print(f"{'='*60}\n")
 
 
+def main():
+    """Main application entry point"""
+    args = parse_args()
+
+    # Initialize configuration
+    config = Config()
+    tracer.configure(config)
+    resilience.configure(config)
+
+    try:
+        run_pipeline(args, config)
+    finally:
+        # Spans of a failed or interrupted run are exported too
+        tracer.export()
+        resilience.shutdown()
+
+
 if __name__ == "__main__":
     main()
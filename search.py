@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# ABOUTME: Command-line search over the local transcript and summary index
+import os
+import sys
+import time
+import sqlite3
+import argparse
+import yaml
+
+from src.search_index import SearchIndex
+
+
+def default_index_path(config_file="config.yaml"):
+    """Read the index location from config.yaml without requiring API credentials"""
+    if os.path.exists(config_file):
+        with open(config_file, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+        return data.get("search_index", {}).get("path", "channels/search_index.db")
+    return "channels/search_index.db"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search indexed transcripts and summaries")
+    parser.add_argument("query", help='FTS5 query, e.g. "vector database" or "rust NOT python"')
+    parser.add_argument("--channel", help="Only return results from this channel")
+    parser.add_argument("--kind", choices=["transcript", "summary"], help="Only search one document type")
+    parser.add_argument("--limit", type=int, default=10, help="Maximum number of results")
+    parser.add_argument("--index", default=None, help="Path to the index database")
+    args = parser.parse_args()
+
+    index_path = args.index or default_index_path()
+    if not os.path.exists(index_path):
+        print(f"❌ Search index not found at: {index_path}")
+        sys.exit(1)
+
+    index = SearchIndex(index_path)
+    start = time.perf_counter()
+    try:
+        results = index.search(args.query, channel=args.channel, kind=args.kind, limit=args.limit)
+    except sqlite3.OperationalError as e:
+        index.close()
+        print(f"❌ Invalid search syntax: {e} (quote phrases and special characters, e.g. '\"c++\"')")
+        sys.exit(1)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    for rank, result in enumerate(results, start=1):
+        print(f"{rank}. [{result['kind']}] {result['title']} ({result['channel']}, {result['published']})")
+        print(f"   https://www.youtube.com/watch?v={result['video_id']}")
+        print(f"   {result['snippet']}")
+        print()
+
+    print(f"🔎 {len(results)} result(s) from {index.count()} documents in {elapsed_ms:.1f} ms")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# ABOUTME: Saves finished summaries and audio to local files or, in direct mode, straight to Drive
+import hashlib
+import logging
+import threading
+from pathlib import Path
+
+from .audio_formats import audio_mimetype
+from .utils import atomic_write, sanitize_name
+
+
+class ArtifactStore:
+    """
+    Where pipeline artifacts go once produced.
+
+    By default each artifact is written atomically to its local path and
+    uploaded later with the rest of the channel folder. In direct mode
+    (drive.upload.direct) the bytes are uploaded from memory as soon as they
+    exist and journaled with remote=True, so nothing is written, re-read or
+    deleted locally unless drive.upload.local_copy asks for a copy. An
+    artifact that cannot be uploaded directly is written locally instead and
+    goes out with the regular channel upload.
+    """
+
+    def __init__(self):
+        self.config = None
+        self.drive_uploader = None
+        self.direct = False
+        self.local_copy = False
+        self.uploaded = 0
+        self.fallbacks = 0
+        self._folder_ids = {}
+        self._lock = threading.Lock()
+
+    def configure(self, config, drive_uploader=None):
+        self.config = config
+        self.drive_uploader = drive_uploader
+        self.direct = bool(config.drive_direct_upload and drive_uploader)
+        self.local_copy = config.drive_local_copy
+        self._folder_ids = {}
+
+    def save(self, stage, path, data, journal, channel_username, **extra):
+        """Store one artifact and record it as complete in the channel journal"""
+        path = Path(path)
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        if self.direct:
+            try:
+                file_id = self.drive_uploader.upload_bytes(
+                    data,
+                    path.name,
+                    self._folder_id(channel_username, path.parent.name),
+                    mimetype=self._mimetype(path),
+                )
+            except Exception as e:
+                self.fallbacks += 1
+                logging.warning(f"Direct upload of {path.name} failed ({e}); keeping it for the channel upload")
+            else:
+                checksum = hashlib.sha256(data).hexdigest()
+                if self.local_copy:
+                    atomic_write(path, data)
+                journal.complete(
+                    stage, path, checksum, remote=True, drive_file_id=file_id, size=len(data), **extra
+                )
+                self.uploaded += 1
+                return checksum
+
+        checksum = atomic_write(path, data)
+        journal.complete(stage, path, checksum, **extra)
+        return checksum
+
+    def read_text(self, path, journal):
+        """Read a text artifact from disk, or from Drive if it was only uploaded directly"""
+        path = Path(path)
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        file_id = journal.remote_file_id(path)
+        if not file_id or not self.drive_uploader:
+            raise FileNotFoundError(path)
+        return self.drive_uploader.download_bytes(file_id).decode("utf-8")
+
+    def report(self):
+        if self.direct:
+            print(f"☁️  Direct uploads: {self.uploaded} artifact(s), {self.fallbacks} written locally instead")
+
+    def _mimetype(self, path):
+        if path.parent.name == self.config.drive_audio_folder:
+            return audio_mimetype(path)
+        return "text/plain"
+
+    def _folder_id(self, channel_username, subfolder):
+        """Drive folder ID for base/channel/subfolder, created on first use and cached"""
+        key = (channel_username, subfolder)
+        with self._lock:
+            if key not in self._folder_ids:
+                base_id = self.drive_uploader.get_or_create_folder(self.config.drive_base_folder)
+                channel_id = self.drive_uploader.get_or_create_folder(
+                    sanitize_name(channel_username), parent_folder_id=base_id
+                )
+                self._folder_ids[key] = self.drive_uploader.get_or_create_folder(
+                    subfolder, parent_folder_id=channel_id
+                )
+            return self._folder_ids[key]
+
+
+# Shared store used by the pipeline
+artifacts = ArtifactStore()
@@ -0,0 +1,107 @@
+# ABOUTME: Audio encoding metadata (extension, mimetype) and chunk assembly per codec
+import struct
+
+# encoding -> (file extension, Drive mimetype)
+AUDIO_FORMATS = {
+    "MP3": (".mp3", "audio/mpeg"),
+    "OGG_OPUS": (".ogg", "audio/ogg"),
+    "LINEAR16": (".wav", "audio/wav"),
+    "MULAW": (".wav", "audio/wav"),
+    "ALAW": (".wav", "audio/wav"),
+}
+
+MIMETYPES_BY_EXTENSION = {extension: mimetype for extension, mimetype in AUDIO_FORMATS.values()}
+
+# Encodings whose synthesis responses are WAV files (header + samples)
+WAV_ENCODINGS = {"LINEAR16", "MULAW", "ALAW"}
+
+
+def validate_encoding(encoding):
+    if encoding not in AUDIO_FORMATS:
+        raise ValueError(
+            f"Unsupported audio encoding '{encoding}'. Choose one of: {', '.join(AUDIO_FORMATS)}"
+        )
+    return encoding
+
+
+def audio_extension(encoding):
+    """File extension for an encoding, e.g. '.ogg' for OGG_OPUS"""
+    return AUDIO_FORMATS[validate_encoding(encoding)][0]
+
+
+def audio_mimetype(path):
+    """Drive mimetype for an audio file, based on its extension"""
+    suffix = str(path)[str(path).rfind("."):].lower()
+    return MIMETYPES_BY_EXTENSION.get(suffix, "application/octet-stream")
+
+
+def join_audio(encoding, chunks):
+    """
+    Concatenate per-chunk synthesis results into one playable file.
+
+    MP3 frames can be concatenated directly. Ogg pages carry their own stream
+    serials, so concatenated Opus responses form a valid chained Ogg stream.
+    WAV responses each carry a RIFF header, so their samples are merged under
+    a single new header.
+    """
+    if len(chunks) == 1:
+        return chunks[0]
+    if encoding in WAV_ENCODINGS:
+        return _join_wav(chunks)
+    return b"".join(chunks)
+
+
+def wav_duration(data):
+    """Duration in seconds of a WAV byte string (PCM, mu-law or A-law)"""
+    fmt, samples = _split_wav(data)
+    byte_rate = struct.unpack_from("<I", fmt, 8)[0]
+    return len(samples) / float(byte_rate)
+
+
+def wav_sample_rate(data):
+    """Sample rate in Hz of a WAV byte string"""
+    fmt, _ = _split_wav(data)
+    return struct.unpack_from("<I", fmt, 4)[0]
+
+
+def rewrap_wav(data):
+    """Rewrite a WAV file's header with correct sizes (streamed WAV output often carries placeholders)"""
+    return _join_wav([data])
+
+
+def _split_wav(data):
+    """Return the (fmt chunk body, data chunk body) of a RIFF/WAVE file"""
+    if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        raise ValueError("Not a WAV file")
+
+    fmt = None
+    samples = b""
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        size = struct.unpack_from("<I", data, offset + 4)[0]
+        body = data[offset + 8:offset + 8 + size]
+        if chunk_id == b"fmt ":
+            fmt = body
+        elif chunk_id == b"data":
+            samples = body
+        offset += 8 + size + (size & 1)
+
+    if fmt is None:
+        raise ValueError("WAV file has no fmt chunk")
+    return fmt, samples
+
+
+def _join_wav(chunks):
+    """Merge the sample data of several WAV files under one header"""
+    fmt = None
+    samples = []
+    for chunk in chunks:
+        chunk_fmt, chunk_samples = _split_wav(chunk)
+        fmt = fmt or chunk_fmt
+        samples.append(chunk_samples)
+
+    data = b"".join(samples)
+    fmt_chunk = b"fmt " + struct.pack("<I", len(fmt)) + fmt + (b"\x00" if len(fmt) & 1 else b"")
+    data_chunk = b"data" + struct.pack("<I", len(data)) + data + (b"\x00" if len(data) & 1 else b"")
+    return b"RIFF" + struct.pack("<I", 4 + len(fmt_chunk) + len(data_chunk)) + b"WAVE" + fmt_chunk + data_chunk
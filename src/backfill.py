@@ -0,0 +1,142 @@
+# ABOUTME: Historical backfill planning: saved channel listing, date-ordered shards and their checkpoints
+import json
+import logging
+from datetime import datetime
+
+from .utils import atomic_write, relative_time_range
+
+MANIFEST_FILE = "manifest.json"
+
+
+class BackfillWindow:
+    """Publish-date range for a backfill; either end may be open"""
+
+    def __init__(self, since=None, until=None):
+        self.since = since
+        self.until = until
+
+    @staticmethod
+    def parse_date(text):
+        """argparse type for --since/--until (YYYY-MM-DD)"""
+        return datetime.strptime(text, "%Y-%m-%d").date()
+
+    def contains(self, date_suffix):
+        """True if a YYYYMMDD publish date falls inside the window"""
+        published = datetime.strptime(date_suffix, "%Y%m%d").date()
+        if self.since and published < self.since:
+            return False
+        if self.until and published > self.until:
+            return False
+        return True
+
+    def may_contain(self, published_text, listed_at):
+        """
+        False only if a video's relative label ("2 years ago", as seen at
+        listed_at) rules out every date in the window, so no request is needed.
+        """
+        age = relative_time_range(published_text)
+        if age is None:
+            return True
+        newest = (listed_at - age[0]).date()
+        oldest = (listed_at - age[1]).date()
+        if self.since and newest < self.since:
+            return False
+        if self.until and oldest > self.until:
+            return False
+        return True
+
+    def describe(self):
+        return f"{self.since or 'first upload'} → {self.until or 'today'}"
+
+
+class BackfillShard:
+    """
+    A run of consecutive videos from the channel listing. The listing is
+    newest-first, so each shard covers one contiguous stretch of dates.
+
+    The checkpoint records every video whose outcome is final (transcript
+    saved, or no transcript exists); a resumed backfill only revisits the rest.
+    """
+
+    def __init__(self, index, videos, checkpoint_path):
+        self.index = index
+        self.videos = videos
+        self.checkpoint_path = checkpoint_path
+        self.done = set()
+        self.complete = False
+        self._load()
+
+    def pending(self):
+        return [video for video in self.videos if video["video_id"] not in self.done]
+
+    def mark(self, video_id):
+        """Record a final outcome for a video and persist the checkpoint"""
+        self.done.add(video_id)
+        self.complete = len(self.done) >= len(self.videos)
+        self._save()
+
+    def _load(self):
+        if not self.checkpoint_path.exists():
+            return
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable backfill checkpoint {self.checkpoint_path}: {e}")
+            return
+        self.done = set(state.get("done", []))
+        self.complete = state.get("complete", False)
+
+    def _save(self):
+        atomic_write(
+            self.checkpoint_path,
+            json.dumps({"complete": self.complete, "done": sorted(self.done)}),
+        )
+
+
+class BackfillPlan:
+    """
+    The full video listing of one channel, saved on the first backfill run and
+    reused by every resumed run so shard boundaries never move. Videos
+    uploaded after the listing was taken are covered by regular runs.
+    """
+
+    def __init__(self, folder, listed_at, videos, shard_size):
+        self.folder = folder
+        self.listed_at = listed_at
+        self.videos = videos
+        self.shards = [
+            BackfillShard(
+                idx,
+                videos[start:start + shard_size],
+                folder / f"shard_{idx:04d}.json",
+            )
+            for idx, start in enumerate(range(0, len(videos), max(1, shard_size)))
+        ]
+
+    @classmethod
+    def load_or_create(cls, folder, list_videos, shard_size):
+        """
+        Load the saved listing from folder, or build it with list_videos()
+        (returning dicts with video_id, title and published text) and save it.
+        """
+        folder.mkdir(parents=True, exist_ok=True)
+        manifest_path = folder / MANIFEST_FILE
+        if manifest_path.exists():
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("shard_size") != shard_size:
+                # Checkpoints belong to the original boundaries
+                logging.warning(
+                    f"Backfill in {folder} was planned with shard_size {manifest.get('shard_size')}; keeping it"
+                )
+                shard_size = manifest.get("shard_size", shard_size)
+            return cls(folder, datetime.fromisoformat(manifest["listed_at"]), manifest["videos"], shard_size)
+
+        listed_at = datetime.now()
+        videos = list_videos()
+        atomic_write(
+            manifest_path,
+            json.dumps({"listed_at": listed_at.isoformat(), "shard_size": shard_size, "videos": videos}),
+        )
+        return cls(folder, listed_at, videos, shard_size)
@@ -0,0 +1,140 @@
+# ABOUTME: Per-run cost and quota budgeting with recency- and channel-priority ordering
+import logging
+import threading
+
+# Rough conversion factors used for estimates
+CHARS_PER_TOKEN = 4
+PROMPT_OVERHEAD_TOKENS = 150
+
+# Audio bytes per character of speech (~15 chars/s) for each TTS encoding
+AUDIO_BYTES_PER_CHAR = {
+    "MP3": 250,
+    "OGG_OPUS": 130,
+    "LINEAR16": 3200,
+    "MULAW": 1600,
+    "ALAW": 1600,
+}
+
+
+class RunBudget:
+    """
+    Plans which videos get summarized and voiced in this run.
+
+    Candidates are ordered by channel priority, then by publish date (newest
+    first), and accepted while the estimated OpenAI tokens, TTS characters and
+    Drive bytes all fit under the configured limits. Anything that does not fit
+    is deferred: its transcript stays on disk and is picked up by the next run.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.limits = {
+            "tokens": config.budget_max_tokens,
+            "tts_chars": config.budget_max_tts_chars,
+            "drive_bytes": config.budget_max_drive_mb * 1024 * 1024 if config.budget_max_drive_mb else None,
+        }
+        self.audio_bytes_per_char = AUDIO_BYTES_PER_CHAR.get(config.tts_audio_encoding, 250)
+        self.candidates = []
+        self.estimated = {"tokens": 0, "tts_chars": 0, "drive_bytes": 0}
+        self.actual = {"tokens": 0, "tts_chars": 0, "drive_bytes": 0}
+        self.deferred = []
+        self._lock = threading.Lock()
+
+    def estimate(self, transcript_chars, summary_chars=None):
+        """
+        Estimate the spend for one video. If the summary already exists
+        (summary_chars given) only TTS and upload are counted.
+        """
+        transcript_bytes = transcript_chars
+        if summary_chars is None and transcript_chars < self.config.local_summary_threshold_chars:
+            # Summarized locally: no tokens, and roughly a fifth of the transcript is kept
+            tokens = 0
+            summary_chars = transcript_chars // 5
+        elif summary_chars is None:
+            input_tokens = transcript_chars // CHARS_PER_TOKEN + PROMPT_OVERHEAD_TOKENS
+            # Summaries scale with the transcript but never exceed max_tokens
+            output_tokens = min(self.config.max_tokens, input_tokens // 4 + 300)
+            tokens = input_tokens + output_tokens
+            summary_chars = output_tokens * CHARS_PER_TOKEN
+        else:
+            tokens = 0
+
+        return {
+            "tokens": tokens,
+            "tts_chars": summary_chars,
+            "drive_bytes": transcript_bytes + summary_chars + summary_chars * self.audio_bytes_per_char,
+        }
+
+    def add_candidate(self, channel_username, record, date_suffix, estimate, artifacts=()):
+        """
+        Register a video that still needs summary and/or audio work.
+        artifacts are its output paths (summary, audio, ...), kept local if it is deferred.
+        """
+        self.candidates.append({
+            "channel": channel_username,
+            "record": record,
+            "artifacts": tuple(artifacts),
+            "date": date_suffix or "",
+            "priority": self.config.budget_channel_priority.get(channel_username, 0),
+            "estimate": estimate,
+        })
+
+    def plan(self):
+        """
+        Choose the candidates to run now. Returns {channel: [records]} in priority order;
+        the rest are kept in self.deferred.
+        """
+        ordered = sorted(self.candidates, key=lambda c: (c["priority"], c["date"]), reverse=True)
+        scheduled = {}
+        for candidate in ordered:
+            if self._fits(candidate["estimate"]):
+                for key, value in candidate["estimate"].items():
+                    self.estimated[key] += value
+                scheduled.setdefault(candidate["channel"], []).append(candidate["record"])
+            else:
+                self.deferred.append(candidate)
+
+        self.candidates = []
+        accepted = sum(len(records) for records in scheduled.values())
+        print(f"💰 Budget plan: {accepted} video(s) scheduled, {len(self.deferred)} carried to next run")
+        logging.info(
+            f"Budget plan: {accepted} scheduled, {len(self.deferred)} deferred; estimate {self.estimated}"
+        )
+        return scheduled
+
+    def deferred_paths(self):
+        """
+        Paths that must stay on disk for the next run: each deferred video's
+        transcript and any outputs it already has (e.g. a finished summary),
+        so the next run resumes from them instead of paying for them again.
+        """
+        paths = set()
+        for candidate in self.deferred:
+            paths.add(candidate["record"]["transcript_path"])
+            paths.update(candidate["artifacts"])
+        return paths
+
+    def record_actual(self, tokens=0, tts_chars=0, drive_bytes=0):
+        """Add measured spend (called from the API clients)"""
+        with self._lock:
+            self.actual["tokens"] += tokens
+            self.actual["tts_chars"] += tts_chars
+            self.actual["drive_bytes"] += drive_bytes
+
+    def report(self):
+        """Print estimated vs actual spend for the run"""
+        print("💰 Budget report (estimate → actual):")
+        labels = {"tokens": "OpenAI tokens", "tts_chars": "TTS characters", "drive_bytes": "Drive bytes"}
+        for key, label in labels.items():
+            limit = self.limits[key]
+            limit_text = f" (limit {limit:,})" if limit else ""
+            print(f"   {label}: {self.estimated[key]:,} → {self.actual[key]:,}{limit_text}")
+        if self.deferred:
+            print(f"   Deferred to next run: {len(self.deferred)} video(s)")
+        logging.info(f"Budget estimate {self.estimated}, actual {self.actual}, deferred {len(self.deferred)}")
+
+    def _fits(self, estimate):
+        for key, limit in self.limits.items():
+            if limit and self.estimated[key] + estimate[key] > limit:
+                return False
+        return True
@@ -32,23 +32,84 @@ class Config:
         self.html_formatting = self.data.get("html_formatting", True)
         self.file_name_max_length = self.data.get("file_name_max_length", 30)
         self.file_name_timestamp = self.data.get("file_name_timestamp", True)
+        # "txt" for plain text, "segments" for the compressed timestamped store
+        self.transcript_format = self.data.get("transcript_format", "txt")
+        # Give the summarizer [hh:mm:ss] segment times (segment stores only)
+        self.summary_timestamps = self.data.get("summary_timestamps", False)
 
         # Processing settings
         processing = self.data.get("processing", {})
         self.days_back = processing.get("days_back", 3)
         self.skip_keywords = processing.get("skip_keywords", ["short", "shorts"])
         self.max_retries = processing.get("max_retries", 3)
+        # Date files by the publish date on the watch page instead of "N days ago" (one extra request per video)
+        self.exact_publish_dates = processing.get("exact_publish_dates", False)
+        self.publish_date_cache = processing.get("publish_date_cache", "channels/publish_dates.json")
 
         # Rate limiting settings
         rate_limiting = processing.get("rate_limiting", {})
         self.delay_between_videos = rate_limiting.get("delay_between_videos", 3)
         self.delay_between_channels = rate_limiting.get("delay_between_channels", 5)
 
+        # Feed pre-check settings
+        feed_config = self.data.get("feed_check", {})
+        self.feed_check_enabled = feed_config.get("enabled", False)
+        self.feed_url = feed_config.get(
+            "feed_url", "https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+        )
+        self.feed_channel_url = feed_config.get(
+            "channel_url", "https://www.youtube.com/@{username}"
+        )
+        self.feed_state_file = feed_config.get("state_file", "channels/feed_state.json")
+        self.feed_timeout = feed_config.get("timeout", 10)
+        self.feed_seen_history = feed_config.get("seen_history", 200)
+
+        # Historical backfill settings (python main.py --backfill)
+        backfill_config = self.data.get("backfill", {})
+        self.backfill_workers = backfill_config.get("workers", 2)
+        self.backfill_shard_size = backfill_config.get("shard_size", 100)
+        self.backfill_folder = backfill_config.get("folder", "backfill")
+
         # OpenAI settings
         openai_config = self.data.get("openai", {})
         self.openai_model = openai_config.get("model", "gpt-4.1-nano")
         self.max_tokens = openai_config.get("max_tokens", 4000)
         self.temperature = openai_config.get("temperature", 0.5)
+        # Pack several short transcripts from a channel into one request
+        pack_config = openai_config.get("packing", {})
+        self.openai_pack_enabled = pack_config.get("enabled", False)
+        self.openai_pack_max_chars = pack_config.get("max_transcript_chars", 6000)
+        self.openai_pack_max_tokens = pack_config.get("max_input_tokens", 12000)
+        self.openai_pack_max_videos = pack_config.get("max_videos", 8)
+        self.openai_pack_max_output_tokens = pack_config.get("max_output_tokens", 16000)
+
+        # Local extractive summaries (short transcripts, and fallback while OpenAI is down)
+        local_summary_config = self.data.get("local_summary", {})
+        self.local_summary_threshold_chars = local_summary_config.get("threshold_chars", 0)
+        self.local_summary_fallback = local_summary_config.get("fallback", False)
+        self.local_summary_max_sentences = local_summary_config.get("max_sentences", 8)
+
+        # Near-duplicate detection settings
+        dedup_config = self.data.get("dedup", {})
+        self.dedup_enabled = dedup_config.get("enabled", False)
+        self.dedup_threshold = dedup_config.get("threshold", 0.8)
+        self.dedup_shingle_size = dedup_config.get("shingle_size", 5)
+        self.dedup_num_perm = dedup_config.get("num_perm", 128)
+        self.dedup_bands = dedup_config.get("bands", 32)
+        self.dedup_index_path = dedup_config.get("index_path", "channels/dedup_index.json")
+
+        # Run budget settings (None/0 = unlimited)
+        budget_config = self.data.get("budget", {})
+        self.budget_enabled = budget_config.get("enabled", False)
+        self.budget_max_tokens = budget_config.get("max_openai_tokens")
+        self.budget_max_tts_chars = budget_config.get("max_tts_chars")
+        self.budget_max_drive_mb = budget_config.get("max_drive_mb")
+        self.budget_channel_priority = budget_config.get("channel_priority", {}) or {}
+
+        # Pricing used for cost reports (USD)
+        pricing_config = self.data.get("pricing", {})
+        self.openai_cost_per_million_tokens = pricing_config.get("openai_per_million_tokens", 0.40)
+        self.tts_cost_per_million_chars = pricing_config.get("tts_per_million_chars", 4.0)
 
         # TTS settings
         tts_config = self.data.get("tts", {})
@@ -60,6 +121,37 @@ class Config:
         tts_audio_config = tts_config.get("audio", {})
         self.tts_sample_rate = tts_audio_config.get("sample_rate", 24000)
         self.tts_volume_gain = tts_audio_config.get("volume_gain", 0.0)
+        self.tts_audio_encoding = str(tts_audio_config.get("encoding", "MP3")).upper()
+
+        # Synthesis engine: "google" (Cloud TTS) or "local" (CPU engine such as espeak-ng or Piper)
+        self.tts_backend = str(tts_config.get("backend", "google")).lower()
+        tts_local_config = tts_config.get("local", {})
+        self.tts_local_command = tts_local_config.get(
+            "command", ["espeak-ng", "--stdin", "--stdout", "-v", "en-us", "-s", "175"]
+        )
+        self.tts_local_workers = tts_local_config.get("workers", 0)
+        self.tts_local_batch_size = tts_local_config.get("batch_size", 8)
+        self.tts_local_chunk_bytes = tts_local_config.get("chunk_bytes", 1000)
+        self.tts_local_timeout = tts_local_config.get("timeout", 120)
+
+        # Upstream call settings: deadlines per stage (seconds), retries and hedging
+        resilience_config = self.data.get("resilience", {})
+        self.resilience_deadlines = resilience_config.get("deadlines", {}) or {}
+        self.resilience_max_attempts = resilience_config.get("max_attempts", 3)
+        self.resilience_backoff = resilience_config.get("backoff", 1.0)
+        self.resilience_max_workers = resilience_config.get("max_workers", 32)
+        hedging_config = resilience_config.get("hedging", {})
+        self.hedging_enabled = hedging_config.get("enabled", False)
+        self.hedging_quantile = hedging_config.get("quantile", 0.95)
+        self.hedging_min_samples = hedging_config.get("min_samples", 20)
+        circuit_config = resilience_config.get("circuit", {})
+        self.circuit_window = circuit_config.get("window", 20)
+        self.circuit_min_calls = circuit_config.get("min_calls", 5)
+        self.circuit_error_rate = circuit_config.get("error_rate", 0.5)
+        self.circuit_cooldowns = circuit_config.get("cooldowns", {}) or {}
+        self.circuit_max_cooldown = circuit_config.get("max_cooldown", 600)
+        # Longest wait at the end of a run for a paused upstream before its work is left for the next run
+        self.circuit_requeue_wait = circuit_config.get("requeue_wait", 120)
 
         # Drive settings
         drive_config = self.data.get("drive", {})
@@ -70,6 +162,29 @@ class Config:
         self.drive_summaries_folder = drive_subfolders.get("summaries", "Summaries")
         self.drive_audio_folder = drive_subfolders.get("audio", "Audio")
 
+        # Local full-text search index
+        search_config = self.data.get("search_index", {})
+        self.search_index_enabled = search_config.get("enabled", True)
+        self.search_index_path = search_config.get("path", "channels/search_index.db")
+
+        self.drive_http_timeout = drive_config.get("http_timeout", 60)
+        self.drive_discovery_document = drive_config.get("discovery_document")
+
+        drive_upload_config = drive_config.get("upload", {})
+        self.drive_upload_workers = drive_upload_config.get("workers", 4)
+        self.drive_max_inflight_mb = drive_upload_config.get("max_inflight_mb", 64)
+        # Upload summaries and audio from memory as they are produced instead of via local files
+        self.drive_direct_upload = drive_upload_config.get("direct", False)
+        # In direct mode, also keep a local copy of each uploaded artifact (e.g. as a cache)
+        self.drive_local_copy = drive_upload_config.get("local_copy", False)
+
+        # Tracing settings
+        tracing_config = self.data.get("tracing", {})
+        self.tracing_enabled = tracing_config.get("enabled", False)
+        self.tracing_sample_rate = tracing_config.get("sample_rate", 0.1)
+        self.tracing_output_dir = tracing_config.get("output_dir", "logs/traces")
+        self.tracing_max_spans = tracing_config.get("max_spans", 100000)
+
     def _setup_logging(self):
         """Set up logging configuration"""
         log_file = "logs/app.log"
@@ -0,0 +1,171 @@
+# ABOUTME: MinHash/LSH near-duplicate detection to skip redundant summaries and audio
+import re
+import json
+import random
+import hashlib
+import logging
+from pathlib import Path
+
+from .utils import atomic_write
+
+MAX_HASH = (1 << 64) - 1
+
+# Rough size of the fixed prompt text sent with every summary request, in tokens
+PROMPT_OVERHEAD_TOKENS = 150
+
+
+class DuplicateDetector:
+    """
+    Finds transcripts that are near-duplicates of ones already summarized.
+
+    Each transcript is reduced to a MinHash signature over word shingles. The
+    signature is split into LSH bands so a lookup only compares against the
+    handful of entries sharing at least one band, rather than the whole index.
+    Candidates are confirmed by their estimated Jaccard similarity.
+
+    add() only updates the index in memory; save() writes it, once per
+    channel or batch rather than once per video.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.index_path = Path(config.dedup_index_path)
+        self.threshold = config.dedup_threshold
+        self.shingle_size = config.dedup_shingle_size
+        self.num_perm = config.dedup_num_perm
+        self.bands = config.dedup_bands
+        if self.num_perm % self.bands:
+            raise ValueError("dedup num_perm must be divisible by bands")
+        self.rows = self.num_perm // self.bands
+
+        # Fixed seed so signatures stay comparable across runs
+        rng = random.Random(0x5EED)
+        self._masks = [rng.getrandbits(64) for _ in range(self.num_perm)]
+
+        self.entries = {}
+        self.buckets = {}
+        self.saved = {"summaries": 0, "audio": 0, "tokens": 0, "tts_chars": 0}
+        self._dirty = False
+        self._load()
+
+    def signature(self, text):
+        """Compute the MinHash signature of a transcript"""
+        words = re.findall(r"\w+", text.lower())
+        if len(words) < self.shingle_size:
+            shingles = {" ".join(words)}
+        else:
+            shingles = {
+                " ".join(words[i:i + self.shingle_size])
+                for i in range(len(words) - self.shingle_size + 1)
+            }
+
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+            for s in shingles
+        ]
+        return [min(h ^ mask for h in hashes) for mask in self._masks]
+
+    def find_duplicate(self, signature, exclude_video_id=None):
+        """
+        Return (entry, similarity) for the most similar indexed transcript at or
+        above the threshold, or None if there is no near-duplicate.
+        """
+        candidates = set()
+        for key in self._band_keys(signature):
+            candidates.update(self.buckets.get(key, ()))
+        candidates.discard(exclude_video_id)
+
+        best = None
+        for video_id in candidates:
+            entry = self.entries[video_id]
+            similarity = self._similarity(signature, entry["signature"])
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (entry, similarity)
+        return best
+
+    def is_duplicate(self, sig_a, sig_b):
+        """True if two signatures are near-duplicates, e.g. videos queued in the same batch"""
+        return self._similarity(sig_a, sig_b) >= self.threshold
+
+    def add(self, video_id, signature, **metadata):
+        """Index a summarized transcript so later copies can link to it"""
+        if video_id in self.entries:
+            self._remove_from_buckets(video_id)
+        self.entries[video_id] = {"video_id": video_id, "signature": signature, **metadata}
+        for key in self._band_keys(signature):
+            self.buckets.setdefault(key, []).append(video_id)
+        self._dirty = True
+
+    def save(self):
+        """Write the index if entries were added since the last save"""
+        if not self._dirty:
+            return
+        try:
+            self._save()
+            self._dirty = False
+        except OSError as e:
+            logging.warning(f"Could not save dedup index {self.index_path}: {e}")
+
+    def record_skip(self, transcript_chars, entry):
+        """Account for the summary and audio work a duplicate avoided"""
+        summary_chars = entry.get("summary_chars", 0)
+        self.saved["summaries"] += 1
+        self.saved["audio"] += 1
+        self.saved["tokens"] += transcript_chars // 4 + PROMPT_OVERHEAD_TOKENS + summary_chars // 4
+        self.saved["tts_chars"] += summary_chars
+
+    def report(self):
+        """Print a summary of API usage avoided in this run"""
+        if not self.saved["summaries"]:
+            return
+        openai_cost = self.saved["tokens"] / 1_000_000 * self.config.openai_cost_per_million_tokens
+        tts_cost = self.saved["tts_chars"] / 1_000_000 * self.config.tts_cost_per_million_chars
+        print(f"♻️  Near-duplicates linked: {self.saved['summaries']}")
+        print(f"   Saved ~{self.saved['tokens']:,} OpenAI tokens (~${openai_cost:.4f})")
+        print(f"   Saved ~{self.saved['tts_chars']:,} TTS characters (~${tts_cost:.4f})")
+        logging.info(
+            f"Dedup saved {self.saved['summaries']} summaries, ~{self.saved['tokens']} tokens, "
+            f"~{self.saved['tts_chars']} TTS chars (~${openai_cost + tts_cost:.4f})"
+        )
+
+    def _similarity(self, sig_a, sig_b):
+        return sum(a == b for a, b in zip(sig_a, sig_b)) / self.num_perm
+
+    def _band_keys(self, signature):
+        for band in range(self.bands):
+            start = band * self.rows
+            yield f"{band}:" + ",".join(str(v) for v in signature[start:start + self.rows])
+
+    def _remove_from_buckets(self, video_id):
+        for key in self._band_keys(self.entries[video_id]["signature"]):
+            bucket = self.buckets.get(key, [])
+            if video_id in bucket:
+                bucket.remove(video_id)
+
+    def _load(self):
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not read dedup index {self.index_path}: {e}")
+            return
+
+        if data.get("num_perm") != self.num_perm or data.get("shingle_size") != self.shingle_size:
+            logging.warning("Dedup index was built with different settings; starting a new one")
+            return
+
+        for entry in data.get("entries", []):
+            self.entries[entry["video_id"]] = entry
+            for key in self._band_keys(entry["signature"]):
+                self.buckets.setdefault(key, []).append(entry["video_id"])
+
+    def _save(self):
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "num_perm": self.num_perm,
+            "shingle_size": self.shingle_size,
+            "entries": list(self.entries.values()),
+        }
+        atomic_write(self.index_path, json.dumps(data))
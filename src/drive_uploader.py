@@ -1,9 +1,47 @@
 # ABOUTME: Google Drive file upload and folder management functionality
+import io
 import os
+import json
 import logging
+import threading
+import httplib2
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build_from_document
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
+
+from .resilience import resilience
+from .tracing import tracer
+
+DRIVE_SCOPES = ["https://www.googleapis.com/auth/drive.file"]
+
+# Parsed Drive v3 discovery document, shared by every client in the process
+_discovery_document = None
+_discovery_lock = threading.Lock()
+# build_from_document fills in method parameters on the shared document, so
+# every build in the process is serialized; the resulting clients are independent
+_build_lock = threading.Lock()
+
+
+def load_discovery_document(path=None):
+    """
+    Return the parsed Drive v3 discovery document, loading it at most once.
+    Uses the pinned file at `path` if given, otherwise the copy bundled with
+    google-api-python-client, so building a client never hits the network.
+    """
+    global _discovery_document
+    with _discovery_lock:
+        if _discovery_document is None:
+            if path and os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    content = f.read()
+            else:
+                content = discovery_cache.get_static_doc("drive", "v3")
+                if content is None:
+                    raise Exception("Bundled Drive v3 discovery document not found; set drive.discovery_document.")
+            _discovery_document = json.loads(content)
+        return _discovery_document
 
 
 class DriveUploader:
@@ -11,19 +49,43 @@ class DriveUploader:
 
     def __init__(self, config):
         self.config = config
-        self.drive_service = self._get_drive_service()
+        self._local = threading.local()
+        self._usage_lock = threading.Lock()
+        self.bytes_uploaded = 0
+        self.credentials = self._load_credentials()
+        self._local.drive_service = self._get_drive_service()
 
-    def _get_drive_service(self):
-        """Create a Google Drive service instance"""
+    @property
+    def drive_service(self):
+        """
+        Per-thread Drive service. httplib2 connections are not thread-safe,
+        so each upload worker lazily builds its own client with its own
+        keep-alive connection; together they form the connection pool.
+        """
+        service = getattr(self._local, "drive_service", None)
+        if service is None:
+            service = self._get_drive_service()
+            self._local.drive_service = service
+        return service
+
+    def _load_credentials(self):
+        """Load service account credentials once for all worker clients"""
         credentials_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
         if not credentials_path:
             raise Exception("GOOGLE_APPLICATION_CREDENTIALS is not set.")
 
-        scopes = ["https://www.googleapis.com/auth/drive.file"]
-        credentials = service_account.Credentials.from_service_account_file(
-            credentials_path, scopes=scopes
+        return service_account.Credentials.from_service_account_file(
+            credentials_path, scopes=DRIVE_SCOPES
+        )
+
+    def _get_drive_service(self):
+        """Create a Google Drive service instance from the cached discovery document"""
+        document = load_discovery_document(self.config.drive_discovery_document)
+        authorized_http = AuthorizedHttp(
+            self.credentials, http=httplib2.Http(timeout=self.config.drive_http_timeout)
         )
-        return build("drive", "v3", credentials=credentials)
+        with _build_lock:
+            return build_from_document(document, http=authorized_http)
 
     def get_or_create_folder(self, folder_name, parent_folder_id=None):
         """
@@ -34,11 +96,13 @@ class DriveUploader:
         if parent_folder_id:
             query += f" and '{parent_folder_id}' in parents"
 
-        results = (
-            self.drive_service.files()
-            .list(q=query, fields="files(id, name)")
-            .execute()
-        )
+        with tracer.span("drive.list", purpose="folder", name=folder_name):
+            results = resilience.call(
+                "drive",
+                lambda timeout: self.drive_service.files().list(q=query, fields="files(id, name)").execute(),
+                operation="drive.list",
+                idempotent=True,
+            )
         files = results.get("files", [])
 
         if files:
@@ -53,11 +117,12 @@ class DriveUploader:
             if parent_folder_id:
                 file_metadata["parents"] = [parent_folder_id]
 
-            folder = (
-                self.drive_service.files()
-                .create(body=file_metadata, fields="id")
-                .execute()
-            )
+            with tracer.span("drive.create_folder", name=folder_name):
+                folder = resilience.call(
+                    "drive",
+                    lambda timeout: self.drive_service.files().create(body=file_metadata, fields="id").execute(),
+                    operation="drive.create_folder",
+                )
             folder_id = folder.get("id")
             print(f"Folder '{folder_name}' created with ID: {folder_id}")
             return folder_id
@@ -69,16 +134,65 @@ class DriveUploader:
         Returns the file ID if successful, None otherwise.
         """
         file_name = os.path.basename(file_path)
+        existing_id = self._find_file(file_name, folder_id)
+        if existing_id:
+            return existing_id
+
+        # Upload new file
+        media = (
+            MediaFileUpload(file_path, mimetype=mimetype)
+            if mimetype
+            else MediaFileUpload(file_path)
+        )
+        file_id = self._create_file(file_name, folder_id, media, os.path.getsize(file_path))
+        logging.info(
+            f"Uploaded '{file_path}' to Drive folder ID: {folder_id} as file ID: {file_id}"
+        )
+        return file_id
+
+    def upload_bytes(self, data, file_name, folder_id, mimetype=None):
+        """
+        Uploads in-memory content to Google Drive as file_name, without a local file.
+        If a file with the same name already exists, it skips the upload.
+        Returns the file ID.
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        existing_id = self._find_file(file_name, folder_id)
+        if existing_id:
+            return existing_id
 
-        # Check if file already exists
+        media = MediaIoBaseUpload(io.BytesIO(data), mimetype=mimetype or "application/octet-stream")
+        file_id = self._create_file(file_name, folder_id, media, len(data))
+        logging.info(f"Uploaded '{file_name}' from memory to Drive folder ID: {folder_id} as file ID: {file_id}")
+        return file_id
+
+    def download_bytes(self, file_id):
+        """Return the content of a Drive file"""
+        with tracer.span("drive.download", file_id=file_id):
+            return resilience.call(
+                "drive",
+                lambda timeout: self.drive_service.files().get_media(fileId=file_id).execute(),
+                operation="drive.download",
+                idempotent=True,
+            )
+
+    def _find_file(self, file_name, folder_id):
+        """Return the ID of a file with this name in the folder, or None"""
         query = f"name = '{file_name}' and '{folder_id}' in parents and trashed = false"
         logging.info(f"Querying Drive with: {query}")
 
-        results = (
-            self.drive_service.files()
-            .list(q=query, spaces="drive", fields="files(id, name)")
-            .execute()
-        )
+        with tracer.span("drive.list", purpose="upload_check", name=file_name):
+            results = resilience.call(
+                "drive",
+                lambda timeout: (
+                    self.drive_service.files()
+                    .list(q=query, spaces="drive", fields="files(id, name)")
+                    .execute()
+                ),
+                operation="drive.list",
+                idempotent=True,
+            )
         existing_files = results.get("files", [])
         logging.info(
             f"Query returned {len(existing_files)} result(s) for file '{file_name}'."
@@ -89,21 +203,20 @@ class DriveUploader:
                 f"File '{file_name}' already exists in folder ID {folder_id}. Skipping upload."
             )
             return existing_files[0]["id"]
+        return None
 
-        # Upload new file
+    def _create_file(self, file_name, folder_id, media, size):
         file_metadata = {"name": file_name, "parents": [folder_id]}
-        media = (
-            MediaFileUpload(file_path, mimetype=mimetype)
-            if mimetype
-            else MediaFileUpload(file_path)
-        )
-        file = (
-            self.drive_service.files()
-            .create(body=file_metadata, media_body=media, fields="id")
-            .execute()
-        )
-        file_id = file.get("id")
-        logging.info(
-            f"Uploaded '{file_path}' to Drive folder ID: {folder_id} as file ID: {file_id}"
-        )
-        return file_id
+        with tracer.span("drive.upload", name=file_name, bytes=size):
+            file = resilience.call(
+                "drive",
+                lambda timeout: (
+                    self.drive_service.files()
+                    .create(body=file_metadata, media_body=media, fields="id")
+                    .execute()
+                ),
+                operation="drive.upload",
+            )
+        with self._usage_lock:
+            self.bytes_uploaded += size
+        return file.get("id")
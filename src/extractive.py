@@ -0,0 +1,110 @@
+# ABOUTME: Local extractive summarization (TF-IDF sentence vectors ranked with TextRank)
+import re
+import numpy as np
+
+STOPWORDS = frozenset(
+    "a about above after again all also am an and any are as at be because been before being "
+    "below between both but by can could did do does doing down during each few for from further "
+    "get got had has have having he her here hers him his how i if in into is it its itself just "
+    "know let like me more most my no nor not now of off on once only or other our out over own "
+    "really right same she should so some such than that the their them then there these they "
+    "thing things this those through to too um uh under until up very was we well were what when "
+    "where which while who whom why will with would yeah you your yours".split()
+)
+
+# Transcripts without punctuation are cut into windows of this many words
+WINDOW_WORDS = 25
+
+# Above this many sentences, neighbours are merged so the similarity matrix stays small
+MAX_UNITS = 300
+
+
+class ExtractiveSummarizer:
+    """
+    Picks the most central sentences of a transcript.
+
+    Sentences become TF-IDF vectors, their cosine similarities form a graph, and
+    PageRank over that graph (TextRank) scores each sentence. The top sentences
+    are returned in their original order. Everything after tokenizing is a few
+    NumPy matrix operations, so short transcripts take a millisecond or two.
+    """
+
+    def __init__(self, max_sentences=8, ratio=0.2, damping=0.85):
+        self.max_sentences = max_sentences
+        self.ratio = ratio
+        self.damping = damping
+
+    def summarize(self, text):
+        """Return the highest-ranked sentences of text, in transcript order"""
+        units = self._split_units(text)
+        if len(units) <= 3:
+            return " ".join(units)
+
+        vectors = self._tfidf([self._tokens(unit) for unit in units])
+        scores = self._textrank(vectors)
+
+        count = min(self.max_sentences, max(3, round(len(units) * self.ratio)))
+        chosen = np.sort(np.argsort(-scores, kind="stable")[:count])
+        return " ".join(units[i] for i in chosen)
+
+    def _split_units(self, text):
+        text = re.sub(r"\s+", " ", text).strip()
+        if not text:
+            return []
+
+        sentences = [s for s in re.split(r"(?<=[.!?])\s+", text) if s]
+        words = text.split(" ")
+        if len(words) / len(sentences) > 3 * WINDOW_WORDS:
+            # Auto-generated captions often have no punctuation at all
+            sentences = [" ".join(words[i:i + WINDOW_WORDS]) for i in range(0, len(words), WINDOW_WORDS)]
+
+        if len(sentences) > MAX_UNITS:
+            group = -(-len(sentences) // MAX_UNITS)
+            sentences = [" ".join(sentences[i:i + group]) for i in range(0, len(sentences), group)]
+        return sentences
+
+    @staticmethod
+    def _tokens(unit):
+        return [t for t in re.findall(r"[a-z0-9']+", unit.lower()) if len(t) > 2 and t not in STOPWORDS]
+
+    @staticmethod
+    def _tfidf(token_lists):
+        """Row-normalized TF-IDF matrix (units x vocabulary)"""
+        vocabulary = {}
+        rows, cols = [], []
+        for row, tokens in enumerate(token_lists):
+            for token in tokens:
+                rows.append(row)
+                cols.append(vocabulary.setdefault(token, len(vocabulary)))
+
+        n_units, n_terms = len(token_lists), max(len(vocabulary), 1)
+        counts = np.bincount(
+            np.asarray(rows, dtype=np.int64) * n_terms + np.asarray(cols, dtype=np.int64),
+            minlength=n_units * n_terms,
+        ).reshape(n_units, n_terms).astype(np.float32)
+
+        tf = np.log1p(counts)
+        df = np.count_nonzero(counts, axis=0)
+        idf = np.log((1.0 + n_units) / (1.0 + df)).astype(np.float32) + 1.0
+        vectors = tf * idf
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms > 0, norms, 1.0)
+
+    def _textrank(self, vectors, iterations=50, tolerance=1e-6):
+        """PageRank scores over the cosine-similarity graph of the units"""
+        n_units = vectors.shape[0]
+        similarity = vectors @ vectors.T
+        np.fill_diagonal(similarity, 0.0)
+
+        # Row-stochastic transitions; isolated units link uniformly to all others
+        out_weight = similarity.sum(axis=1, keepdims=True)
+        transitions = np.where(out_weight > 0, similarity / np.where(out_weight > 0, out_weight, 1.0), 1.0 / n_units)
+
+        scores = np.full(n_units, 1.0 / n_units, dtype=np.float32)
+        for _ in range(iterations):
+            updated = (1.0 - self.damping) / n_units + self.damping * (transitions.T @ scores)
+            if np.abs(updated - scores).sum() < tolerance:
+                return updated
+            scores = updated
+        return scores
@@ -0,0 +1,173 @@
+# ABOUTME: Cheap pre-check for new uploads using each channel's Atom feed with conditional requests
+import re
+import json
+import logging
+import xml.etree.ElementTree as ET
+from pathlib import Path
+import requests
+
+ATOM_NS = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "yt": "http://www.youtube.com/xml/schemas/2015",
+}
+
+CHANNEL_ID_PATTERN = re.compile(r"UC[\w-]{22}")
+
+
+class FeedChecker:
+    """
+    Decides whether a channel needs a full scrape by polling its Atom feed.
+
+    ETag and Last-Modified validators are stored per channel so that an idle
+    channel costs a single conditional GET answered with 304 Not Modified.
+    State is only committed via mark_seen() once the full scrape succeeded,
+    so a crashed or rate-limited run re-checks the same feed next time.
+    """
+
+    def __init__(self, config, state_file=None):
+        self.config = config
+        self.state_file = Path(state_file or config.feed_state_file)
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = "youtube-transcript-processor/feed-check"
+        self.state = self._load_state()
+        self._pending = {}
+
+    def _load_state(self):
+        """Load per-channel validators and seen video IDs from disk"""
+        if not self.state_file.exists():
+            return {}
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not read feed state {self.state_file}: {e}")
+            return {}
+
+    def _save_state(self):
+        """Persist feed state to disk"""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.state_file, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=2)
+
+    def resolve_channel_id(self, channel_username):
+        """
+        Return the UC... channel ID for a username or handle.
+        Channel IDs are used as-is; handles are resolved once from the
+        channel page and cached in the feed state.
+        """
+        if CHANNEL_ID_PATTERN.fullmatch(channel_username):
+            return channel_username
+
+        channel_state = self.state.get(channel_username, {})
+        if channel_state.get("channel_id"):
+            return channel_state["channel_id"]
+
+        url = self.config.feed_channel_url.format(username=channel_username)
+        response = self.session.get(url, timeout=self.config.feed_timeout)
+        response.raise_for_status()
+
+        match = re.search(r'"(?:externalId|channelId)":"(UC[\w-]{22})"', response.text)
+        if not match:
+            match = re.search(r'itemprop="identifier" content="(UC[\w-]{22})"', response.text)
+        if not match:
+            raise ValueError(f"Could not resolve channel ID for '{channel_username}'")
+
+        channel_id = match.group(1)
+        self.state.setdefault(channel_username, {})["channel_id"] = channel_id
+        self._save_state()
+        logging.info(f"Resolved channel {channel_username} to ID {channel_id}")
+        return channel_id
+
+    def has_new_videos(self, channel_username):
+        """
+        Return True if the channel's feed lists video IDs we have not seen yet.
+        Any error in the pre-check falls back to True so the full scrape runs.
+        """
+        try:
+            channel_id = self.resolve_channel_id(channel_username)
+            channel_state = self.state.setdefault(channel_username, {})
+
+            headers = {}
+            if channel_state.get("etag"):
+                headers["If-None-Match"] = channel_state["etag"]
+            if channel_state.get("last_modified"):
+                headers["If-Modified-Since"] = channel_state["last_modified"]
+
+            url = self.config.feed_url.format(channel_id=channel_id)
+            response = self.session.get(url, headers=headers, timeout=self.config.feed_timeout)
+
+            if response.status_code == 304:
+                logging.info(f"Feed for {channel_username} not modified (304)")
+                return False
+            response.raise_for_status()
+
+            feed_ids = self._parse_video_ids(response.content)
+            seen_ids = set(channel_state.get("seen_ids", []))
+            unseen_ids = [vid for vid in feed_ids if vid not in seen_ids]
+
+            validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "feed_ids": feed_ids,
+            }
+
+            if not unseen_ids:
+                # Nothing new: safe to commit the fresh validators right away
+                self._commit(channel_username, validators)
+                logging.info(f"Feed for {channel_username} changed but has no unseen videos")
+                return False
+
+            self._pending[channel_username] = validators
+            logging.info(f"Feed for {channel_username} has {len(unseen_ids)} unseen video(s)")
+            return True
+
+        except Exception as e:
+            print(f"⚠️  Feed check failed for '{channel_username}', falling back to full scrape: {e}")
+            logging.warning(f"Feed check failed for {channel_username}: {e}")
+            return True
+
+    def mark_seen(self, channel_username, failed_ids=()):
+        """
+        Commit the validators from the last feed check after a successful scrape.
+
+        Videos in failed_ids (e.g. captions not ready yet) are not marked as seen,
+        and the validators are dropped so the next check does a full GET instead
+        of getting a 304; the failed videos then show up as unseen and are retried.
+        """
+        validators = self._pending.pop(channel_username, None)
+        if not validators:
+            return
+        failed_ids = set(failed_ids)
+        if failed_ids:
+            validators = {
+                "etag": None,
+                "last_modified": None,
+                "feed_ids": [vid for vid in validators["feed_ids"] if vid not in failed_ids],
+                "failed_ids": failed_ids,
+            }
+        self._commit(channel_username, validators)
+
+    def _commit(self, channel_username, validators):
+        """Store validators and the feed's video IDs as seen"""
+        channel_state = self.state.setdefault(channel_username, {})
+        channel_state["etag"] = validators["etag"]
+        channel_state["last_modified"] = validators["last_modified"]
+
+        # Keep a bounded history so IDs that drop off the feed don't grow the file
+        failed_ids = validators.get("failed_ids", set())
+        seen_ids = validators["feed_ids"] + [
+            vid for vid in channel_state.get("seen_ids", [])
+            if vid not in validators["feed_ids"] and vid not in failed_ids
+        ]
+        channel_state["seen_ids"] = seen_ids[: self.config.feed_seen_history]
+        self._save_state()
+
+    def _parse_video_ids(self, content):
+        """Extract yt:videoId values from an Atom feed document"""
+        root = ET.fromstring(content)
+        ids = []
+        for entry in root.findall("atom:entry", ATOM_NS):
+            video_id = entry.findtext("yt:videoId", default="", namespaces=ATOM_NS)
+            if video_id:
+                ids.append(video_id)
+        return ids
@@ -0,0 +1,200 @@
+# ABOUTME: Per-channel resume journal recording in-progress and completed artifact stages
+import os
+import json
+import time
+import uuid
+import hashlib
+import logging
+import threading
+from pathlib import Path
+
+JOURNAL_FILE = "journal.jsonl"
+
+
+def file_checksum(path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class RunJournal:
+    """
+    Append-only log of artifact stages for one channel folder.
+
+    Every stage writes a "start" entry before producing its artifact and a
+    "done" entry (with checksum and size) after the atomic rename. On restart:
+    - an artifact whose latest entry is "done" and whose size still matches is
+      trusted; its checksum is verified once, when the journal is loaded, and a
+      file changed in place is redone like an unfinished one,
+    - an artifact whose latest entry is "start" is incomplete and is redone,
+    - an artifact with no entries (written before journaling existed) is
+      trusted if it exists.
+    Loading compacts the file to the latest entry per artifact still on disk,
+    plus remote-only entries of videos that still have a file on disk.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def for_folder(cls, channel_folder):
+        """Return the shared journal for a channel folder"""
+        key = str(Path(channel_folder).resolve())
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(channel_folder)
+            return cls._instances[key]
+
+    def __init__(self, channel_folder):
+        self.channel_folder = Path(channel_folder)
+        self.path = self.channel_folder / JOURNAL_FILE
+        self.run_id = uuid.uuid4().hex[:12]
+        self.entries = {}
+        self._lock = threading.Lock()
+        self._load()
+        self._remove_stale_temp_files()
+
+    def start(self, stage, artifact):
+        """Record that a stage has started producing an artifact"""
+        self._append({"event": "start", "stage": stage, "artifact": self._key(artifact)})
+
+    def complete(self, stage, artifact, checksum=None, **extra):
+        """
+        Record that an artifact was fully written. Artifacts uploaded straight
+        to Drive pass remote=True (and their size), and may have no local file.
+        """
+        artifact = Path(artifact)
+        entry = {"event": "done", "stage": stage, "artifact": self._key(artifact), **extra}
+        if artifact.exists():
+            entry["size"] = artifact.stat().st_size
+            entry["sha256"] = checksum or file_checksum(artifact)
+        elif checksum:
+            entry["sha256"] = checksum
+        self._append(entry)
+
+    def is_complete(self, artifact):
+        """Return True if the artifact can be trusted as finished"""
+        artifact = Path(artifact)
+        entry = self.entries.get(self._key(artifact))
+        if entry is None:
+            return artifact.exists()
+        if entry["event"] != "done":
+            return False
+        if not artifact.exists():
+            return bool(entry.get("remote"))
+        return entry.get("size") == artifact.stat().st_size
+
+    def size(self, artifact):
+        """Size of a finished artifact, from disk or, if it only exists in Drive, from its entry"""
+        artifact = Path(artifact)
+        if artifact.exists():
+            return artifact.stat().st_size
+        entry = self.entries.get(self._key(artifact))
+        return entry.get("size") if entry else None
+
+    def remote_file_id(self, artifact):
+        """Drive file ID of an artifact that was uploaded directly, or None"""
+        entry = self.entries.get(self._key(Path(artifact)))
+        if entry and entry["event"] == "done" and entry.get("remote"):
+            return entry.get("drive_file_id")
+        return None
+
+    def verify(self, artifact):
+        """Re-hash an artifact and compare it with the recorded checksum"""
+        entry = self.entries.get(self._key(Path(artifact)))
+        if not entry or "sha256" not in entry or not Path(artifact).exists():
+            return False
+        return file_checksum(artifact) == entry["sha256"]
+
+    def unfinished(self):
+        """Artifacts whose last recorded stage started but never completed"""
+        return [entry for entry in self.entries.values() if entry["event"] == "start"]
+
+    def _key(self, artifact):
+        try:
+            return str(Path(artifact).resolve().relative_to(self.channel_folder.resolve()))
+        except ValueError:
+            return str(artifact)
+
+    def _append(self, entry):
+        entry["run"] = self.run_id
+        entry["time"] = time.time()
+        with self._lock:
+            self.entries[entry["artifact"]] = entry
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _load(self):
+        """Replay the journal, then compact it to the latest entry per live artifact"""
+        if not self.path.exists():
+            return
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A torn last line from a crash mid-append is expected; ignore it
+                    continue
+                self.entries[entry["artifact"]] = entry
+
+        # A file damaged or edited in place keeps its size; only the checksum catches it
+        for key, entry in self.entries.items():
+            path = self.channel_folder / key
+            if (
+                entry["event"] == "done" and "sha256" in entry and path.exists()
+                and entry.get("size") == path.stat().st_size and not self.verify(path)
+            ):
+                logging.warning(f"Journal {self.path}: {key} no longer matches its checksum; redoing it")
+                self.entries[key] = dict(entry, event="start")
+
+        unfinished = self.unfinished()
+        for entry in unfinished:
+            partial = self.channel_folder / entry["artifact"]
+            if partial.exists():
+                partial.unlink()
+        if unfinished:
+            print(f"🔁 Resuming {len(unfinished)} unfinished stage(s) in {self.channel_folder.name}")
+            logging.info(
+                f"Journal {self.path}: resuming {len(unfinished)} unfinished stage(s): "
+                f"{[entry['artifact'] for entry in unfinished]}"
+            )
+
+        # Drop artifacts that were uploaded and removed locally. Entries of
+        # artifacts uploaded directly (with no local copy) only matter while their
+        # video is still being worked on, i.e. while one of its files (usually the
+        # transcript) is still on disk
+        local = {
+            key: entry
+            for key, entry in self.entries.items()
+            if entry["event"] == "start" or (self.channel_folder / key).exists()
+        }
+        live_videos = {entry["video_id"] for entry in local.values() if entry.get("video_id")}
+        self.entries = {
+            key: entry
+            for key, entry in self.entries.items()
+            if key in local or (entry.get("remote") and entry.get("video_id") in live_videos)
+        }
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in self.entries.values():
+                f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _remove_stale_temp_files(self):
+        """Delete temp files left behind by writes interrupted before their rename"""
+        if not self.channel_folder.exists():
+            return
+        for tmp in self.channel_folder.rglob(".*.tmp"):
+            try:
+                tmp.unlink()
+                logging.info(f"Removed stale temp file: {tmp}")
+            except OSError as e:
+                logging.warning(f"Could not remove stale temp file {tmp}: {e}")
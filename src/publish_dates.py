@@ -0,0 +1,111 @@
+# ABOUTME: Exact video publish dates read from watch-page metadata, cached on disk
+import re
+import json
+import logging
+import threading
+from pathlib import Path
+import requests
+
+from .resilience import resilience
+from .tracing import tracer
+from .utils import atomic_write
+
+WATCH_URL = "https://www.youtube.com/watch?v={video_id}"
+
+# Where the watch page states the publish date, most specific first
+PUBLISH_DATE_PATTERNS = (
+    re.compile(r'"publishDate"\s*:\s*(?:\{"simpleText"\s*:\s*)?"(\d{4})-(\d{2})-(\d{2})'),
+    re.compile(r'itemprop="datePublished"\s+content="(\d{4})-(\d{2})-(\d{2})'),
+    re.compile(r'"uploadDate"\s*:\s*"(\d{4})-(\d{2})-(\d{2})'),
+)
+
+# New cache entries written per save; the rest are flushed by save()
+SAVE_EVERY = 50
+
+
+class PublishDates:
+    """
+    Resolves a video's exact publish date (YYYYMMDD).
+
+    Channel listings only carry relative labels such as "2 years ago", which
+    drift from run to run and are off by up to a year. The watch page embeds
+    the real date in its metadata; each date is fetched once and kept in a
+    JSON cache shared by all channels, so re-runs and restarts are free.
+    Requests go through the transcripts stage of the resilience wrapper, so
+    they share its deadline and circuit breaker with transcript fetches, and
+    through pacer (a RequestPacer) to their spacing as well.
+    """
+
+    def __init__(self, config, cache_file=None, pacer=None):
+        self.config = config
+        self.pacer = pacer
+        self.cache_file = Path(cache_file or config.publish_date_cache)
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = "Mozilla/5.0 (compatible; youtube-transcript-processor)"
+        self.session.headers["Accept-Language"] = "en-US,en;q=0.8"
+        # Skips the EU consent interstitial, which has no metadata
+        self.session.cookies.set("CONSENT", "YES+", domain=".youtube.com")
+        self.cache = self._load_cache()
+        self.fetched = 0
+        self._unsaved = 0
+        self._lock = threading.Lock()
+
+    def get(self, video_id):
+        """Return the publish date as YYYYMMDD, or None if the page does not state one"""
+        with self._lock:
+            if video_id in self.cache:
+                return self.cache[video_id]
+
+        date_suffix = self._fetch(video_id)
+        if date_suffix is None:
+            return None
+
+        with self._lock:
+            self.cache[video_id] = date_suffix
+            self.fetched += 1
+            self._unsaved += 1
+            if self._unsaved >= SAVE_EVERY:
+                self._save_locked()
+        return date_suffix
+
+    def save(self):
+        """Write new cache entries to disk"""
+        with self._lock:
+            if self._unsaved:
+                self._save_locked()
+
+    def _fetch(self, video_id):
+        def request(timeout):
+            response = self.session.get(WATCH_URL.format(video_id=video_id), timeout=timeout)
+            response.raise_for_status()
+            return response
+
+        if self.pacer and resilience.breaker("transcripts").available():
+            self.pacer.wait()
+        with tracer.span("youtube.watch_page", video_id=video_id):
+            response = resilience.call("transcripts", request, operation="youtube.watch_page", idempotent=True)
+
+        for pattern in PUBLISH_DATE_PATTERNS:
+            match = pattern.search(response.text)
+            if match:
+                return "".join(match.groups())
+        logging.warning(f"No publish date found on watch page for video {video_id}")
+        return None
+
+    def _load_cache(self):
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not read publish date cache {self.cache_file}: {e}")
+            return {}
+
+    def _save_locked(self):
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(self.cache_file, json.dumps(self.cache, sort_keys=True))
+            self._unsaved = 0
+        except OSError as e:
+            logging.warning(f"Could not save publish date cache {self.cache_file}: {e}")
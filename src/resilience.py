@@ -0,0 +1,459 @@
+# ABOUTME: Shared wrapper for upstream calls: deadlines, retry classification, hedging, circuit breakers
+import time
+import errno
+import random
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import openai
+import requests
+from google.api_core import exceptions as google_exceptions
+from google.auth import exceptions as auth_exceptions
+from googleapiclient.errors import HttpError
+from youtube_transcript_api import RequestBlocked, YouTubeRequestFailed
+
+from .tracing import tracer
+
+# Seconds a whole call (all attempts) may take, per upstream stage
+DEFAULT_DEADLINES = {"transcripts": 60, "openai": 180, "tts": 60, "drive": 300}
+
+# Seconds an open circuit rejects calls before letting a probe through, per upstream stage
+DEFAULT_COOLDOWNS = {"transcripts": 300, "openai": 60, "tts": 60, "drive": 60}
+
+RETRYABLE_HTTP_STATUS = {408, 429, 500, 502, 503, 504}
+
+# Statuses that say the request was refused unprocessed; the others in
+# RETRYABLE_HTTP_STATUS (timeouts and other 5xx) leave the outcome unknown, like
+# transport errors, whichever client library reports them
+REJECTED_HTTP_STATUS = {429, 503}
+
+# Drive reports quota throttling as 403 with one of these reasons
+DRIVE_RATE_LIMIT_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+
+TRANSIENT_ERRNOS = {
+    errno.ECONNRESET, errno.ECONNABORTED, errno.ECONNREFUSED, errno.ETIMEDOUT,
+    errno.EPIPE, errno.ENETUNREACH, errno.EHOSTUNREACH,
+}
+
+# The server refused the request, so sending it again cannot duplicate work
+_REJECTED_ERRORS = (
+    openai.RateLimitError,
+    google_exceptions.TooManyRequests,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.Aborted,
+)
+
+# The outcome is unknown (the request may have been applied), so only idempotent calls are retried
+_TRANSPORT_ERRORS = (
+    openai.APIConnectionError,
+    auth_exceptions.TransportError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    TimeoutError,
+    ConnectionError,
+)
+
+
+class StageDeadlineExceeded(TimeoutError):
+    """A call did not finish within its stage deadline"""
+
+
+class StageUnavailable(Exception):
+    """
+    An upstream stage failed in a way that says it is unhealthy (see
+    is_upstream_failure); work that needs it should be deferred, not dropped.
+    """
+
+    def __init__(self, stage, reason=None):
+        super().__init__(f"{stage} unavailable: {reason}")
+        self.stage = stage
+
+
+class CircuitOpenError(StageUnavailable):
+    """The upstream's circuit breaker is open, so the call was not attempted"""
+
+    def __init__(self, stage):
+        Exception.__init__(self, f"{stage} circuit is open")
+        self.stage = stage
+
+
+def is_retryable(error, idempotent=True):
+    """
+    Classify an error from any of the client libraries used here (openai,
+    google-api-core/gRPC, googleapiclient, requests, raw sockets).
+    """
+    if isinstance(error, StageDeadlineExceeded):
+        return False
+    if isinstance(error, _REJECTED_ERRORS):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return _status_retryable(error.status_code, idempotent)
+    if isinstance(error, google_exceptions.GoogleAPICallError) and isinstance(error.code, int):
+        return _status_retryable(error.code, idempotent)
+    if isinstance(error, HttpError):
+        content = error.content.decode("utf-8", errors="replace") if isinstance(error.content, bytes) else ""
+        if error.status_code == 403 and any(reason in content for reason in DRIVE_RATE_LIMIT_REASONS):
+            return True
+        return _status_retryable(error.status_code, idempotent)
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return _status_retryable(error.response.status_code, idempotent)
+    if isinstance(error, _TRANSPORT_ERRORS):
+        return idempotent
+    if isinstance(error, OSError) and error.errno in TRANSIENT_ERRNOS:
+        return idempotent
+    return False
+
+
+def _status_retryable(status, idempotent):
+    if status in REJECTED_HTTP_STATUS:
+        return True
+    return idempotent and status in RETRYABLE_HTTP_STATUS
+
+
+def is_upstream_failure(error):
+    """True if the error says the upstream is unhealthy (counts towards tripping its circuit)"""
+    if isinstance(error, (StageDeadlineExceeded, RequestBlocked, YouTubeRequestFailed)):
+        return True
+    return is_retryable(error, idempotent=True)
+
+
+class CircuitBreaker:
+    """
+    Tracks recent call outcomes for one upstream.
+
+    Closed: calls flow, and the circuit opens once the error rate over the last
+    `window` calls reaches `error_rate` (with at least `min_calls` outcomes).
+    Open: calls are rejected until the cooldown passes.
+    Half-open: a single probe call is let through; success closes the circuit,
+    failure reopens it with double the cooldown (up to max_cooldown).
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, name, window=20, min_calls=5, error_rate=0.5, cooldown=60, max_cooldown=600):
+        self.name = name
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.state = self.CLOSED
+        self.trips = 0
+        self._outcomes = deque(maxlen=window)
+        self._current_cooldown = cooldown
+        self._opened_until = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Return True if a call may be made now (claims the probe slot when half-open)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() < self._opened_until:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+                logging.info(f"Circuit {self.name} half-open: sending a probe")
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def available(self):
+        """True if a call would be allowed now, without claiming anything"""
+        with self._lock:
+            if self.state == self.OPEN:
+                return time.monotonic() >= self._opened_until
+            return not (self.state == self.HALF_OPEN and self._probe_in_flight)
+
+    def seconds_until_probe(self):
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(self._opened_until - time.monotonic(), 0.0)
+
+    def record_success(self):
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.CLOSED
+                self._outcomes.clear()
+                self._current_cooldown = self.cooldown
+                self._probe_in_flight = False
+                print(f"✅ {self.name} is responding again - resuming calls")
+                logging.info(f"Circuit {self.name} closed after a successful probe")
+            elif self.state == self.CLOSED:
+                self._outcomes.append(True)
+
+    def record_failure(self):
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._open(min(self._current_cooldown * 2, self.max_cooldown), "probe failed")
+            elif self.state == self.CLOSED:
+                self._outcomes.append(False)
+                failures = self._outcomes.count(False)
+                if len(self._outcomes) >= self.min_calls and failures / len(self._outcomes) >= self.error_rate:
+                    self._open(self.cooldown, f"{failures}/{len(self._outcomes)} recent calls failed")
+
+    def trip(self, reason):
+        """Open the circuit immediately (e.g. on an explicit block from the service)"""
+        with self._lock:
+            if self.state != self.OPEN:
+                self._open(self._current_cooldown, reason)
+
+    def _open(self, cooldown, reason):
+        self.state = self.OPEN
+        self.trips += 1
+        self._current_cooldown = cooldown
+        self._opened_until = time.monotonic() + cooldown
+        self._probe_in_flight = False
+        self._outcomes.clear()
+        print(f"⚡ {self.name} unavailable ({reason}) - pausing calls for {cooldown:.0f}s")
+        logging.warning(f"Circuit {self.name} open for {cooldown:.0f}s: {reason}")
+
+
+class LatencyStats:
+    """Sliding window of call latencies per operation, for hedging thresholds and reports"""
+
+    def __init__(self, window=1000):
+        self.window = window
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def observe(self, operation, seconds):
+        with self._lock:
+            samples = self._samples.setdefault(operation, deque(maxlen=self.window))
+            samples.append(seconds)
+
+    def count(self, operation):
+        with self._lock:
+            return len(self._samples.get(operation, ()))
+
+    def percentile(self, operation, quantile):
+        """Latency at the given quantile (0-1), or None without samples"""
+        with self._lock:
+            samples = sorted(self._samples.get(operation, ()))
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(quantile * len(samples)))]
+
+    def operations(self):
+        with self._lock:
+            return sorted(self._samples)
+
+
+class Resilience:
+    """
+    Runs upstream calls with a deadline per stage, classified retries with
+    jittered backoff, optional hedging, and a circuit breaker per stage shared
+    by every channel and worker thread.
+
+    The call is given the time left before its deadline so client libraries
+    that accept a timeout can stop on their own. Idempotent calls that cannot
+    are abandoned when the deadline passes; a started non-idempotent call is
+    awaited instead (see _attempt). Every client either passes the timeout on
+    or has its own socket timeout, so an abandoned call frees its pool slot
+    soon after. The pool is bounded by max_workers; shutdown() at the end of a
+    run drops queued calls instead of waiting for them. Each attempt is traced
+    as a child span. With hedging on, an idempotent call still running after
+    the operation's p95 latency gets a duplicate request, and whichever
+    finishes first wins.
+    """
+
+    def __init__(self):
+        self.deadlines = dict(DEFAULT_DEADLINES)
+        self.max_attempts = 3
+        self.backoff = 1.0
+        self.max_workers = 32
+        self.hedging_enabled = False
+        self.hedge_quantile = 0.95
+        self.hedge_min_samples = 20
+        self.latency = LatencyStats()
+        self.hedges = {"fired": 0, "won": 0}
+        self.circuit_settings = {}
+        self.cooldowns = dict(DEFAULT_COOLDOWNS)
+        self.breakers = {}
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def configure(self, config):
+        self.deadlines.update(config.resilience_deadlines)
+        self.max_attempts = config.resilience_max_attempts
+        self.backoff = config.resilience_backoff
+        self.max_workers = config.resilience_max_workers
+        self.hedging_enabled = config.hedging_enabled
+        self.hedge_quantile = config.hedging_quantile
+        self.hedge_min_samples = config.hedging_min_samples
+        self.circuit_settings = {
+            "window": config.circuit_window,
+            "min_calls": config.circuit_min_calls,
+            "error_rate": config.circuit_error_rate,
+            "max_cooldown": config.circuit_max_cooldown,
+        }
+        self.cooldowns.update(config.circuit_cooldowns)
+        self.breakers = {}
+
+    def breaker(self, stage):
+        """The shared circuit breaker for an upstream stage"""
+        with self._lock:
+            if stage not in self.breakers:
+                self.breakers[stage] = CircuitBreaker(
+                    stage, cooldown=self.cooldowns.get(stage, 60), **self.circuit_settings
+                )
+            return self.breakers[stage]
+
+    def wait_for_circuits(self, stages, max_wait):
+        """
+        Sleep until every listed circuit accepts a call or probe again.
+        Returns False without waiting if that would take longer than max_wait seconds.
+        """
+        waits = [(stage, self.breaker(stage).seconds_until_probe()) for stage in stages]
+        longest = max((wait for _, wait in waits), default=0.0)
+        if longest > max_wait:
+            return False
+        if longest > 0:
+            blocked = ", ".join(stage for stage, wait in waits if wait > 0)
+            print(f"⏳ Waiting {longest:.0f}s for {blocked} to accept requests again")
+            time.sleep(longest)
+        return True
+
+    def call(self, stage, fn, operation=None, idempotent=False):
+        """
+        Call fn(timeout) for an upstream stage and return its result.
+        `timeout` is the number of seconds left before the stage deadline.
+        Raises CircuitOpenError without calling fn while the stage's circuit is open.
+        """
+        breaker = self.breaker(stage)
+        if not breaker.allow():
+            raise CircuitOpenError(stage)
+        try:
+            result = self._call_with_retries(stage, fn, operation or stage, idempotent)
+        except Exception as e:
+            if is_upstream_failure(e):
+                breaker.record_failure()
+            else:
+                # The service answered (e.g. a bad request), so it is up
+                breaker.record_success()
+            raise
+        breaker.record_success()
+        return result
+
+    def _call_with_retries(self, stage, fn, operation, idempotent):
+        deadline = time.monotonic() + self.deadlines.get(stage, 300)
+        attempt = 0
+        while True:
+            attempt += 1
+            start = time.monotonic()
+            try:
+                result = self._attempt(operation, fn, deadline, attempt, idempotent)
+            except Exception as e:
+                delay = self.backoff * 2 ** (attempt - 1) * (0.5 + random.random())
+                if (
+                    attempt >= self.max_attempts
+                    or not is_retryable(e, idempotent)
+                    or time.monotonic() + delay >= deadline
+                ):
+                    raise
+                logging.warning(
+                    f"{operation} failed ({type(e).__name__}: {e}); "
+                    f"retry {attempt}/{self.max_attempts - 1} in {delay:.1f}s"
+                )
+                time.sleep(delay)
+                continue
+
+            self.latency.observe(operation, time.monotonic() - start)
+            return result
+
+    def observe(self, operation, seconds):
+        """Record a latency measured elsewhere (e.g. end-to-end time per video)"""
+        self.latency.observe(operation, seconds)
+
+    def report(self):
+        """Print p50/p95/p99 latency per operation"""
+        operations = self.latency.operations()
+        if not operations:
+            return
+        print("⏱️  Latency (p50 / p95 / p99, seconds):")
+        for operation in operations:
+            p50, p95, p99 = (self.latency.percentile(operation, q) for q in (0.5, 0.95, 0.99))
+            line = f"{operation}: n={self.latency.count(operation)} p50={p50:.2f} p95={p95:.2f} p99={p99:.2f}"
+            print(f"   {line}")
+            logging.info(f"Latency {line}")
+        if self.hedges["fired"]:
+            print(f"   Hedged requests: {self.hedges['fired']} sent, {self.hedges['won']} finished first")
+            logging.info(f"Hedged requests: {self.hedges}")
+        for stage, breaker in sorted(self.breakers.items()):
+            if breaker.trips:
+                print(f"   Circuit {stage}: opened {breaker.trips} time(s), now {breaker.state}")
+                logging.info(f"Circuit {stage}: {breaker.trips} trip(s), final state {breaker.state}")
+
+    def _attempt(self, operation, fn, deadline, attempt, idempotent):
+        """
+        Run one attempt of fn in the call pool, traced as a child span with its
+        attempt number. Idempotent calls may be hedged, and are abandoned at the
+        deadline. A non-idempotent call is never duplicated or abandoned once
+        started: past the deadline it is only cancelled if still queued,
+        otherwise its outcome is awaited so the caller never retries a request
+        that may still be applied.
+        """
+        context = tracer.current_context()
+
+        def run(hedge=False):
+            with tracer.attach(context), tracer.span(operation, attempt=attempt, hedge=hedge):
+                return fn(max(deadline - time.monotonic(), 0.001))
+
+        first = self._pool().submit(run)
+        pending = {first}
+
+        hedge_after = None
+        if idempotent and self.hedging_enabled and self.latency.count(operation) >= self.hedge_min_samples:
+            hedge_after = self.latency.percentile(operation, self.hedge_quantile)
+        if hedge_after is not None and time.monotonic() + hedge_after < deadline:
+            done, _ = wait(pending, timeout=hedge_after)
+            if not done:
+                with self._lock:
+                    self.hedges["fired"] += 1
+                logging.info(f"Hedging {operation} after {hedge_after:.2f}s")
+                pending.add(self._pool().submit(run, hedge=True))
+
+        error = None
+        while pending:
+            done, pending = wait(pending, timeout=max(deadline - time.monotonic(), 0), return_when=FIRST_COMPLETED)
+            if not done:
+                # Requests still queued behind a busy pool never start
+                pending = {future for future in pending if not future.cancel()}
+                if idempotent or not pending:
+                    # Abandon the stuck request; its thread finishes in the background
+                    raise StageDeadlineExceeded(f"{operation} did not finish before its deadline")
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is not first:
+                        with self._lock:
+                            self.hedges["won"] += 1
+                    for other in pending:
+                        other.cancel()
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def shutdown(self):
+        """Stop the call pool without waiting for abandoned calls; queued ones are cancelled"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="upstream")
+            return self._executor
+
+
+# Shared call wrapper used by all upstream clients; configured once from main()
+resilience = Resilience()
@@ -0,0 +1,113 @@
+# ABOUTME: Local SQLite FTS5 full-text index over transcripts and summaries
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    video_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    channel TEXT,
+    title TEXT,
+    published TEXT,
+    path TEXT,
+    UNIQUE (video_id, kind)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    title,
+    body,
+    tokenize = 'porter unicode61 remove_diacritics 2'
+);
+CREATE INDEX IF NOT EXISTS documents_channel ON documents (channel);
+"""
+
+
+class SearchIndex:
+    """
+    Incremental full-text index of everything the pipeline writes locally.
+
+    Each (video ID, kind) pair is one document, where kind is "transcript" or
+    "summary". Re-indexing a document replaces the previous version, so the
+    index can be updated every time a file is (re)written.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def add_document(self, video_id, kind, text, channel=None, title=None, published=None, path=None):
+        """Insert or replace the indexed text for a video's transcript or summary"""
+        published = self._format_date(published)
+        with self._lock, self.conn:
+            row = self.conn.execute(
+                "SELECT id FROM documents WHERE video_id = ? AND kind = ?", (video_id, kind)
+            ).fetchone()
+            if row:
+                doc_id = row[0]
+                self.conn.execute(
+                    "UPDATE documents SET channel = ?, title = ?, published = ?, path = ? WHERE id = ?",
+                    (channel, title, published, path, doc_id),
+                )
+                self.conn.execute("DELETE FROM documents_fts WHERE rowid = ?", (doc_id,))
+            else:
+                doc_id = self.conn.execute(
+                    "INSERT INTO documents (video_id, kind, channel, title, published, path) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (video_id, kind, channel, title, published, path),
+                ).lastrowid
+            self.conn.execute(
+                "INSERT INTO documents_fts (rowid, title, body) VALUES (?, ?, ?)",
+                (doc_id, title or "", text),
+            )
+        logging.info(f"Indexed {kind} for video {video_id}")
+
+    def search(self, query, channel=None, kind=None, limit=10, snippet_tokens=16):
+        """
+        Run an FTS5 MATCH query and return ranked results with highlighted snippets.
+        Title matches are weighted above body matches.
+        """
+        sql = (
+            "SELECT d.video_id, d.kind, d.channel, d.title, d.published, d.path, "
+            "snippet(documents_fts, 1, '[', ']', '...', ?) AS snippet, "
+            "bm25(documents_fts, 5.0, 1.0) AS score "
+            "FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid "
+            "WHERE documents_fts MATCH ?"
+        )
+        params = [snippet_tokens, query]
+        if channel:
+            sql += " AND d.channel = ?"
+            params.append(channel)
+        if kind:
+            sql += " AND d.kind = ?"
+            params.append(kind)
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+
+        columns = ["video_id", "kind", "channel", "title", "published", "path", "snippet", "score"]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def count(self):
+        """Return the number of indexed documents"""
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    @staticmethod
+    def _format_date(date_suffix):
+        """Normalize a YYYYMMDD file suffix to YYYY-MM-DD"""
+        if date_suffix and len(date_suffix) == 8 and date_suffix.isdigit():
+            return f"{date_suffix[:4]}-{date_suffix[4:6]}-{date_suffix[6:]}"
+        return date_suffix or None
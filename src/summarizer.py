@@ -1,16 +1,53 @@
 # ABOUTME: OpenAI-powered text summarization for video transcripts
 import re
+import json
 import logging
 import certifi
 import httpx
 from openai import OpenAI
 
+from .extractive import ExtractiveSummarizer
+from .resilience import resilience, CircuitOpenError, is_upstream_failure
+from .tracing import tracer
+
+SYSTEM_PROMPT = (
+    "You are a detailed and analytical summarization assistant. Do not use any markdown formatting in your output."
+)
+
+SUMMARY_INSTRUCTIONS = (
+    "Using the details provided below, generate a comprehensive and detailed summary that thoroughly covers all key insights and nuances present in the transcript. "
+    "Provide a detailed explanation including any critical analysis or observations that are relevant. "
+    "Explain with examples from the transcript where applicable."
+    "Explain Technical steps being explained where applicable."
+    "Include Channel Name and Video details in beginning."
+    "Do not use any markdown formatting (avoid symbols like asterisks, hashes, underscores, or backticks).\n\n"
+)
+
+# Added to the instructions when transcripts carry [hh:mm:ss] segment times
+TIMESTAMP_INSTRUCTIONS = (
+    "The transcript lines start with [hh:mm:ss] times; mention the time (hh:mm:ss) "
+    "where each key point or step begins.\n\n"
+)
+
+# A packed summary shorter than this is treated as a failed split
+MIN_PACKED_SUMMARY_CHARS = 80
+
 
 class Summarizer:
-    """Handles text summarization using OpenAI API"""
+    """
+    Handles text summarization using OpenAI API, with a local extractive engine
+    for short transcripts and for when OpenAI keeps failing.
+    """
 
     def __init__(self, config):
         self.config = config
+        self.tokens_used = 0
+        self.extractive = ExtractiveSummarizer(max_sentences=config.local_summary_max_sentences)
+        self.engine_counts = {"openai": 0, "extractive": 0}
+        self.last_engine = None
+        # Keys the last summarize_packed() left out because OpenAI was unavailable
+        self.unavailable_keys = set()
+        self.requests_made = 0
 
         # Create httpx client with explicit SSL certificate verification using venv's certifi
         import os
@@ -25,7 +62,8 @@ class Summarizer:
             timeout=60.0
         )
 
-        self.client = OpenAI(http_client=http_client)
+        # Retries are classified and bounded by the openai stage deadline in resilience.call
+        self.client = OpenAI(http_client=http_client, max_retries=0)
 
         if not self.client.api_key:
             raise Exception(
@@ -33,40 +71,218 @@ class Summarizer:
             )
 
     def generate_summary(self, transcript_text, channel_details, video_details):
+        """
+        Generate a summary of the transcript. Transcripts shorter than
+        local_summary.threshold_chars are summarized locally; longer ones go to
+        OpenAI unless its circuit is open, in which case the local engine is
+        used as a fallback (if enabled).
+        """
+        if len(transcript_text) < self.config.local_summary_threshold_chars:
+            return self._extractive_summary(transcript_text, channel_details, video_details)
+
+        if self._circuit_open():
+            if self.config.local_summary_fallback:
+                return self._extractive_summary(transcript_text, channel_details, video_details)
+            raise CircuitOpenError("openai")
+
+        try:
+            summary = self._openai_summary(transcript_text, channel_details, video_details)
+        except Exception as e:
+            # An outage may have tripped the shared openai circuit during this call;
+            # anything else (bad request, auth, a bug) is not papered over
+            outage = isinstance(e, CircuitOpenError) or is_upstream_failure(e)
+            if outage and self._circuit_open() and self.config.local_summary_fallback:
+                return self._extractive_summary(transcript_text, channel_details, video_details)
+            raise
+
+        self.engine_counts["openai"] += 1
+        self.last_engine = "openai"
+        return summary
+
+    def packable(self, transcript_text):
+        """True if the transcript should wait to be packed with others into one request"""
+        return (
+            self.config.openai_pack_enabled
+            and self.config.local_summary_threshold_chars <= len(transcript_text) <= self.config.openai_pack_max_chars
+        )
+
+    def summarize_packed(self, items):
+        """
+        Summarize several short transcripts with as few requests as possible.
+
+        items is a list of dicts with key, transcript_text, channel_details and
+        video_details. Transcripts are grouped into requests up to
+        openai.pack_max_tokens of input; each request asks for a JSON object with
+        one summary per video. Summaries missing from, or invalid in, a response
+        are retried one request per video. Returns {key: (summary, engine)};
+        keys whose summary could not be produced are left out, and those that
+        failed because OpenAI was unavailable are listed in unavailable_keys.
+        """
+        results = {}
+        self.unavailable_keys = set()
+        for pack in self._packs(items):
+            if len(pack) > 1 and not self._circuit_open():
+                try:
+                    with tracer.span("summary.packed", videos=len(pack)):
+                        results.update(self._packed_request(pack))
+                except ValueError as e:
+                    logging.warning(f"Packed summary response for {len(pack)} videos was unusable: {e}")
+                except Exception as e:
+                    logging.warning(f"Packed summary request for {len(pack)} videos failed: {e}")
+
+            for item in pack:
+                if item["key"] in results:
+                    continue
+                try:
+                    summary = self.generate_summary(
+                        item["transcript_text"], item["channel_details"], item["video_details"]
+                    )
+                    results[item["key"]] = (summary, self.last_engine)
+                except Exception as e:
+                    if isinstance(e, CircuitOpenError) or is_upstream_failure(e):
+                        # Left out of the results; the caller defers it until OpenAI recovers
+                        self.unavailable_keys.add(item["key"])
+                        logging.warning(f"Summary for {item['video_details']} deferred: {e}")
+                        continue
+                    logging.error(f"Error generating summary for {item['video_details']}: {e}")
+        return results
+
+    def report(self):
+        """Print how many summaries each engine produced"""
+        if not self.engine_counts["extractive"] and not self.config.openai_pack_enabled:
+            return
+        print(
+            f"📝 Summaries: {self.engine_counts['openai']} via OpenAI in {self.requests_made} request(s), "
+            f"{self.engine_counts['extractive']} extractive (local)"
+        )
+        logging.info(f"Summary engines used: {self.engine_counts}, OpenAI requests: {self.requests_made}")
+
+    def _packs(self, items):
+        """Group items into request-sized packs by estimated input tokens"""
+        budget = self.config.openai_pack_max_tokens
+        packs, current, current_tokens = [], [], 0
+        for item in items:
+            tokens = len(item["transcript_text"]) // 4 + 50
+            if current and (current_tokens + tokens > budget or len(current) >= self.config.openai_pack_max_videos):
+                packs.append(current)
+                current, current_tokens = [], 0
+            current.append(item)
+            current_tokens += tokens
+        if current:
+            packs.append(current)
+        return packs
+
+    def _packed_request(self, pack):
+        """One request for a whole pack; returns the summaries that pass validation"""
+        ids = {f"v{idx + 1}": item for idx, item in enumerate(pack)}
+        sections = "".join(
+            f"=== Video {video_id} ===\n"
+            f"Channel Details:\n{item['channel_details']}\n\n"
+            f"Video Details:\n{item['video_details']}\n\n"
+            f"Transcript:\n{item['transcript_text']}\n\n"
+            for video_id, item in ids.items()
+        )
+        prompt = (
+            f"Summarize each of the following {len(pack)} videos separately. For every video: "
+            + self._instructions()
+            + sections
+            + 'Respond with only a JSON object of the form {"summaries": [{"id": "v1", "summary": "..."}]} '
+            f"containing exactly one entry for each of the ids {', '.join(ids)}."
+        )
+
+        response = self._chat_completion(
+            prompt,
+            max_tokens=min(self.config.max_tokens * len(pack), self.config.openai_pack_max_output_tokens),
+            response_format={"type": "json_object"},
+        )
+
+        try:
+            entries = json.loads(response.choices[0].message.content or "")["summaries"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"response is not the expected JSON ({e})")
+        if not isinstance(entries, list):
+            raise ValueError("'summaries' is not a list")
+
+        results = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            item = ids.get(str(entry.get("id")))
+            summary = entry.get("summary")
+            if item is None or item["key"] in results or not isinstance(summary, str):
+                continue
+            summary = self._clean_summary_text(summary)
+            if len(summary) >= MIN_PACKED_SUMMARY_CHARS:
+                results[item["key"]] = (summary, "openai-packed")
+
+        missing = len(pack) - len(results)
+        if missing:
+            logging.warning(f"Packed summary response missing {missing} of {len(pack)} videos; retrying them individually")
+        self.engine_counts["openai"] += len(results)
+        return results
+
+    def _extractive_summary(self, transcript_text, channel_details, video_details):
+        with tracer.span("summary.extractive", chars=len(transcript_text)):
+            body = self.extractive.summarize(transcript_text)
+        self.engine_counts["extractive"] += 1
+        self.last_engine = "extractive"
+        return self._clean_summary_text(f"{channel_details}. {video_details}. {body}")
+
+    def _instructions(self):
+        if self.config.summary_timestamps:
+            return SUMMARY_INSTRUCTIONS + TIMESTAMP_INSTRUCTIONS
+        return SUMMARY_INSTRUCTIONS
+
+    @staticmethod
+    def _circuit_open():
+        return not resilience.breaker("openai").available()
+
+    def _openai_summary(self, transcript_text, channel_details, video_details):
         """
         Generate a comprehensive and detailed summary from the transcript text
         using OpenAI's ChatCompletion API.
         """
         prompt = (
-            "Using the details provided below, generate a comprehensive and detailed summary that thoroughly covers all key insights and nuances present in the transcript. "
-            "Provide a detailed explanation including any critical analysis or observations that are relevant. "
-            "Explain with examples from the transcript where applicable."
-            "Explain Technical steps being explained where applicable."
-            "Include Channel Name and Video details in beginning."
-            "Do not use any markdown formatting (avoid symbols like asterisks, hashes, underscores, or backticks).\n\n"
+            self._instructions() +
             f"Channel Details:\n{channel_details}\n\n"
             f"Video Details:\n{video_details}\n\n"
             f"Transcript:\n{transcript_text}\n\n"
             "Detailed Summary:"
         )
 
-        response = self.client.chat.completions.create(
-            model=self.config.openai_model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a detailed and analytical summarization assistant. Do not use any markdown formatting in your output.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            max_tokens=self.config.max_tokens,
-            temperature=self.config.temperature,
-        )
-
+        response = self._chat_completion(prompt)
         summary = response.choices[0].message.content.strip()
         cleaned_summary = self._clean_summary_text(summary)
         return cleaned_summary
 
+    def _chat_completion(self, prompt, max_tokens=None, **options):
+        """Send one chat completion request with the shared system prompt"""
+        with tracer.span("openai.chat_completion", model=self.config.openai_model, prompt_chars=len(prompt)) as span:
+            self.requests_made += 1
+            response = resilience.call(
+                "openai",
+                lambda timeout: self.client.chat.completions.create(
+                    model=self.config.openai_model,
+                    messages=[
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt},
+                    ],
+                    max_tokens=max_tokens or self.config.max_tokens,
+                    temperature=self.config.temperature,
+                    timeout=timeout,
+                    **options,
+                ),
+                operation="openai.chat_completion",
+            )
+
+            if response.usage:
+                self.tokens_used += response.usage.total_tokens
+                span.set(
+                    prompt_tokens=response.usage.prompt_tokens,
+                    completion_tokens=response.usage.completion_tokens,
+                )
+        return response
+
     def _clean_summary_text(self, summary):
         """
         Remove markdown formatting symbols and extra whitespace from the summary.
@@ -0,0 +1,241 @@
+# ABOUTME: Lightweight sampled span tracing with Chrome trace-event and OTLP-JSON export
+import os
+import json
+import time
+import random
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class _Span:
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "start_ns", "end_ns", "attributes", "error", "thread")
+
+    def __init__(self, trace_id, parent_id, name, attributes):
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.name = name
+        self.attributes = attributes
+        self.error = None
+        self.thread = threading.get_ident()
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+
+    def set(self, **attributes):
+        """Attach attributes to the span (e.g. token counts once known)"""
+        self.attributes.update(attributes)
+
+
+class _NoopSpan:
+    def set(self, **attributes):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """
+    Collects spans grouped into one trace per video (or per channel stage).
+
+    The sampling decision is a hash of the trace key, so every stage of the same
+    video is either fully traced or not traced at all, even across separate
+    calls to trace(). Unsampled traces cost one hash and a no-op context manager.
+    """
+
+    def __init__(self, enabled=False, sample_rate=1.0, output_dir="logs/traces", max_spans=100000):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.output_dir = Path(output_dir)
+        self.max_spans = max_spans
+        self.spans = []
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def configure(self, config):
+        self.enabled = config.tracing_enabled
+        self.sample_rate = config.tracing_sample_rate
+        self.output_dir = Path(config.tracing_output_dir)
+        self.max_spans = config.tracing_max_spans
+
+    @contextmanager
+    def trace(self, key, name=None, **attributes):
+        """Open (or re-open) the trace for a video ID or other key, with a root span"""
+        if not self.enabled or not self._sampled(key):
+            previous = self._context()
+            self._local.context = (None, None)
+            try:
+                yield _NOOP_SPAN
+            finally:
+                self._local.context = previous
+            return
+
+        trace_id = hashlib.sha256(str(key).encode("utf-8")).hexdigest()[:32]
+        previous = self._context()
+        self._local.context = (trace_id, None)
+        try:
+            with self.span(name or "trace", key=str(key), **attributes) as root:
+                yield root
+        finally:
+            self._local.context = previous
+
+    @contextmanager
+    def span(self, name, **attributes):
+        """Record a child span of the current span, if the current trace is sampled"""
+        trace_id, parent_id = self._context()
+        if trace_id is None:
+            yield _NOOP_SPAN
+            return
+
+        span = _Span(trace_id, parent_id, name, attributes)
+        self._local.context = (trace_id, span.span_id)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            self._local.context = (trace_id, parent_id)
+            self._record(span)
+
+    def record(self, key, name, start_ns, end_ns, **attributes):
+        """Record a finished span measured elsewhere as a root span of the trace for key"""
+        if not self.enabled or not self._sampled(key):
+            return
+        trace_id = hashlib.sha256(str(key).encode("utf-8")).hexdigest()[:32]
+        span = _Span(trace_id, None, name, {"key": str(key), **attributes})
+        span.start_ns = start_ns
+        span.end_ns = end_ns
+        self._record(span)
+
+    def current_context(self):
+        """Capture the current trace context to hand to a worker thread"""
+        return self._context()
+
+    @contextmanager
+    def attach(self, context):
+        """Continue a captured trace context in another thread"""
+        previous = self._context()
+        self._local.context = context or (None, None)
+        try:
+            yield
+        finally:
+            self._local.context = previous
+
+    def export(self, run_name=None):
+        """Write collected spans as Chrome trace-event JSON and OTLP JSON"""
+        with self._lock:
+            spans, self.spans = self.spans, []
+        if not spans:
+            return None
+
+        run_name = run_name or time.strftime("%Y%m%d-%H%M%S")
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        chrome_path = self.output_dir / f"trace-{run_name}.chrome.json"
+        otlp_path = self.output_dir / f"trace-{run_name}.otlp.json"
+
+        with open(chrome_path, "w", encoding="utf-8") as f:
+            json.dump(self._to_chrome(spans), f)
+        with open(otlp_path, "w", encoding="utf-8") as f:
+            json.dump(self._to_otlp(spans), f)
+
+        print(f"🧭 Traces exported: {chrome_path} ({len(spans)} spans)")
+        logging.info(f"Exported {len(spans)} spans to {chrome_path} and {otlp_path} (dropped {self.dropped})")
+        return chrome_path, otlp_path
+
+    def _sampled(self, key):
+        if self.sample_rate >= 1.0:
+            return True
+        digest = hashlib.sha256(str(key).encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") / 2**64 < self.sample_rate
+
+    def _context(self):
+        return getattr(self._local, "context", (None, None))
+
+    def _record(self, span):
+        with self._lock:
+            if len(self.spans) < self.max_spans:
+                self.spans.append(span)
+            else:
+                self.dropped += 1
+
+    @staticmethod
+    def _to_chrome(spans):
+        """Chrome trace-event format: one process row per trace, one thread row per OS thread"""
+        trace_pids = {}
+        trace_labels = {}
+        events = []
+        for span in spans:
+            pid = trace_pids.setdefault(span.trace_id, len(trace_pids) + 1)
+            if span.parent_id is None:
+                trace_labels.setdefault(span.trace_id, span.attributes.get("key", span.trace_id))
+            args = {key: str(value) for key, value in span.attributes.items()}
+            if span.error:
+                args["error"] = span.error
+            events.append({
+                "name": span.name,
+                "cat": span.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": span.start_ns / 1000,
+                "dur": (span.end_ns - span.start_ns) / 1000,
+                "pid": pid,
+                "tid": span.thread,
+                "args": args,
+            })
+        for trace_id, pid in trace_pids.items():
+            label = trace_labels.get(trace_id, trace_id)
+            events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": str(label)}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    @staticmethod
+    def _to_otlp(spans):
+        """OTLP/JSON (ExportTraceServiceRequest) encoding"""
+        otlp_spans = []
+        for span in spans:
+            otlp_span = {
+                "traceId": span.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 1,
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": [
+                    {"key": key, "value": _otlp_value(value)} for key, value in span.attributes.items()
+                ],
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+            }
+            if span.parent_id:
+                otlp_span["parentSpanId"] = span.parent_id
+            otlp_spans.append(otlp_span)
+
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    {"key": "service.name", "value": {"stringValue": "youtube-transcript-processor"}},
+                    {"key": "process.pid", "value": {"intValue": str(os.getpid())}},
+                ]},
+                "scopeSpans": [{
+                    "scope": {"name": "src.tracing"},
+                    "spans": otlp_spans,
+                }],
+            }]
+        }
+
+
+def _otlp_value(value):
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+# Shared tracer used by all modules; configured once from main()
+tracer = Tracer()
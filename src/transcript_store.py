@@ -0,0 +1,158 @@
+# ABOUTME: Compact, compressed, append-friendly storage for timestamped transcript segments
+import io
+import zlib
+import struct
+from pathlib import Path
+
+# File layout:
+#   MAGIC, then any number of independently compressed blocks.
+#   Each block = BLOCK_HEADER (compressed length, segment count, first start, last end)
+#   followed by a zlib payload of fixed-size RECORDs and the UTF-8 text blob they point into.
+# Blocks can be appended without rewriting the file, and a time-range read only
+# decompresses the blocks whose [start, end] span overlaps the requested window.
+MAGIC = b"YTTS\x01"
+BLOCK_HEADER = struct.Struct("<IIdd")
+RECORD = struct.Struct("<IIII")  # start_ms, duration_ms, text_offset, text_length
+
+TRANSCRIPT_STORE_SUFFIX = ".tsz"
+TRANSCRIPT_STORE_MIMETYPE = "application/octet-stream"
+DEFAULT_BLOCK_SIZE = 256
+
+
+def encode_segments(segments, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Encode transcript segments into the container format in memory.
+    Segments are dicts (or objects) with text, start and duration in seconds.
+    """
+    buffer = io.BytesIO()
+    buffer.write(MAGIC)
+    _write_blocks(buffer, segments, block_size)
+    return buffer.getvalue()
+
+
+def append_segments(path, segments, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Append segments to a container as new blocks, creating it if needed.
+    Existing blocks are not rewritten, so growing a transcript (e.g. a live
+    stream fetched in parts) costs only the new segments.
+    """
+    path = Path(path)
+    if not path.exists():
+        path.write_bytes(encode_segments(segments, block_size))
+        return path
+
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a transcript store file")
+    with open(path, "ab") as f:
+        _write_blocks(f, segments, block_size)
+    return path
+
+
+def read_segments(path, start=None, end=None):
+    """
+    Read segments as dicts, optionally limited to those overlapping [start, end] seconds.
+    Blocks entirely outside the window are skipped without decompression.
+    """
+    segments = []
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a transcript store file")
+
+        while True:
+            header = f.read(BLOCK_HEADER.size)
+            if not header:
+                break
+            if len(header) < BLOCK_HEADER.size:
+                raise ValueError(f"Truncated block header in {path}")
+
+            payload_len, count, block_start, block_end = BLOCK_HEADER.unpack(header)
+            if (start is not None and block_end < start) or (end is not None and block_start > end):
+                f.seek(payload_len, 1)
+                continue
+
+            compressed = f.read(payload_len)
+            if len(compressed) < payload_len:
+                raise ValueError(f"Truncated block in {path}")
+            try:
+                payload = zlib.decompress(compressed)
+            except zlib.error as e:
+                raise ValueError(f"Corrupt block in {path}: {e}") from e
+            if len(payload) < count * RECORD.size:
+                raise ValueError(f"Corrupt block in {path}: {count} records do not fit")
+            text_blob = payload[count * RECORD.size:]
+            for i in range(count):
+                start_ms, duration_ms, offset, length = RECORD.unpack_from(payload, i * RECORD.size)
+                seg_start = start_ms / 1000.0
+                seg_end = seg_start + duration_ms / 1000.0
+                if (start is not None and seg_end < start) or (end is not None and seg_start > end):
+                    continue
+                segments.append({
+                    "text": text_blob[offset:offset + length].decode("utf-8"),
+                    "start": seg_start,
+                    "duration": duration_ms / 1000.0,
+                })
+    return segments
+
+
+def to_plain_text(path, start=None, end=None):
+    """Derive the plain-text view (one segment per line, like TextFormatter)"""
+    return "\n".join(segment["text"] for segment in read_segments(path, start, end))
+
+
+def to_timestamped_text(path, start=None, end=None):
+    """Derive a "[hh:mm:ss] text" view for timestamp-aware summaries"""
+    lines = []
+    for segment in read_segments(path, start, end):
+        seconds = int(segment["start"])
+        stamp = f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+        lines.append(f"[{stamp}] {segment['text']}")
+    return "\n".join(lines)
+
+
+def read_transcript_text(path, timestamps=False):
+    """
+    Return the transcript text for either a .txt file or a segment store.
+    With timestamps, segment stores are rendered with a [hh:mm:ss] prefix per
+    segment (plain .txt transcripts have no timing to show).
+    """
+    path = Path(path)
+    if path.suffix == TRANSCRIPT_STORE_SUFFIX:
+        return to_timestamped_text(path) if timestamps else to_plain_text(path)
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _write_blocks(f, segments, block_size):
+    block = []
+    for segment in segments:
+        block.append(_normalize(segment))
+        if len(block) >= block_size:
+            _write_block(f, block)
+            block = []
+    if block:
+        _write_block(f, block)
+
+
+def _write_block(f, block):
+    records = bytearray()
+    text_blob = bytearray()
+    for text, start, duration in block:
+        encoded = text.encode("utf-8")
+        records += RECORD.pack(
+            int(round(start * 1000)), int(round(duration * 1000)), len(text_blob), len(encoded)
+        )
+        text_blob += encoded
+
+    payload = zlib.compress(bytes(records + text_blob), 9)
+    block_start = min(start for _, start, _ in block)
+    block_end = max(start + duration for _, start, duration in block)
+    f.write(BLOCK_HEADER.pack(len(payload), len(block), block_start, block_end))
+    f.write(payload)
+
+
+def _normalize(segment):
+    """Accept raw dicts from to_raw_data() as well as FetchedTranscriptSnippet objects"""
+    if isinstance(segment, dict):
+        return segment["text"], float(segment["start"]), float(segment.get("duration", 0.0))
+    return segment.text, float(segment.start), float(segment.duration)
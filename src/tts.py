@@ -1,43 +1,78 @@
-# ABOUTME: Text-to-speech conversion using Google Cloud TTS API
-import os
+# ABOUTME: Text-to-speech conversion through a configurable engine (Google Cloud TTS or local)
 import re
-import time
 import logging
-from google.cloud import texttospeech
-from google.oauth2 import service_account
+
+from .utils import atomic_write
+from .audio_formats import join_audio, validate_encoding
+from .tts_backends import create_backend
+from .tracing import tracer
 
 
 class TextToSpeech:
-    """Handles text-to-speech conversion using Google Cloud TTS"""
+    """Handles text-to-speech conversion using the engine selected in config (tts.backend)"""
 
     def __init__(self, config):
         self.config = config
-        credentials = service_account.Credentials.from_service_account_file(
-            os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-        )
-        self.tts_client = texttospeech.TextToSpeechClient(credentials=credentials)
+        self.encoding = validate_encoding(config.tts_audio_encoding)
+        self.backend = create_backend(config, self.encoding)
+        self.characters_synthesized = 0
+        self.last_checksum = None
+
+    @property
+    def batch_size(self):
+        """How many videos' summaries the engine prefers to synthesize together"""
+        return self.backend.batch_size
 
-    def synthesize_text_to_audio(self, text, output_filename, max_bytes=4900):
+    def synthesize_text_to_audio(self, text, output_filename, max_bytes=None):
         """
-        Converts long text into an MP3 audio file by chunking the text,
-        synthesizing each chunk, and concatenating the resulting MP3 audio content.
+        Converts long text into an audio file by chunking the text,
+        synthesizing each chunk, and joining the resulting audio content
+        in the configured encoding (MP3 by default).
         """
-        text_chunks = self._chunk_text(text, max_bytes=max_bytes)
-
-        audio_buffers = []
-        for idx, chunk in enumerate(text_chunks):
-            logging.info(f"Processing audio chunk {idx + 1}/{len(text_chunks)}...")
-            audio_content = self._synthesize_chunk(chunk)
-            audio_buffers.append(audio_content)
-            if idx < len(text_chunks) - 1:
-                time.sleep(0.1)
-
-        final_audio_content = b"".join(audio_buffers)
-        with open(output_filename, "wb") as out:
-            out.write(final_audio_content)
+        checksums = self.synthesize_batch([(text, output_filename)], max_bytes=max_bytes)
+        self.last_checksum = checksums[output_filename]
+        return output_filename
+
+    def synthesize_batch(self, jobs, max_bytes=None):
+        """
+        Synthesize several (text, output_filename) jobs in one pass and write
+        each file. Returns {output_filename: sha256} for the files written.
+        """
+        audio = self.render_batch([text for text, _ in jobs], max_bytes=max_bytes)
+        checksums = {}
+        for (_, output_filename), audio_content in zip(jobs, audio):
+            checksums[output_filename] = atomic_write(output_filename, audio_content)
             logging.info(f'Audio content written to file "{output_filename}".')
+        return checksums
 
-        return output_filename
+    def render_batch(self, texts, max_bytes=None):
+        """
+        Synthesize several texts in one pass, returning the encoded audio bytes
+        for each, in order, without touching the disk.
+
+        The chunks of all texts are handed to the engine together, so a local
+        engine can keep every core busy even when individual summaries are
+        short.
+        """
+        max_bytes = max_bytes or self.backend.max_chunk_bytes
+        chunked = [self._chunk_text(text, max_bytes=max_bytes) for text in texts]
+        all_chunks = [chunk for text_chunks in chunked for chunk in text_chunks]
+
+        with tracer.span(
+            "tts.synthesize", engine=self.backend.name, jobs=len(texts),
+            chunks=len(all_chunks), chars=sum(len(chunk) for chunk in all_chunks),
+        ):
+            audio_buffers = self.backend.synthesize_chunks(all_chunks)
+
+            audio = []
+            offset = 0
+            for text_chunks in chunked:
+                parts = audio_buffers[offset:offset + len(text_chunks)]
+                offset += len(text_chunks)
+                audio.append(self.backend.finalize(join_audio(self.backend.chunk_encoding, parts)))
+                self.characters_synthesized += sum(len(chunk) for chunk in text_chunks)
+
+        return audio
 
     def _chunk_text(self, text, max_bytes=4900):
         """
@@ -63,51 +98,3 @@ class TextToSpeech:
             chunks.append(current_chunk.strip())
 
         return chunks
-
-    def _synthesize_chunk(self, text, retry_count=0):
-        """
-        Synthesizes a text chunk into MP3 audio content using Google Cloud TTS.
-        Retries up to 3 times on temporary connection errors.
-        """
-        try:
-            synthesis_input = texttospeech.SynthesisInput(text=text)
-
-            # Map gender string to enum
-            gender_map = {
-                "NEUTRAL": texttospeech.SsmlVoiceGender.NEUTRAL,
-                "MALE": texttospeech.SsmlVoiceGender.MALE,
-                "FEMALE": texttospeech.SsmlVoiceGender.FEMALE,
-            }
-            voice_gender = gender_map.get(
-                self.config.tts_voice_gender,
-                texttospeech.SsmlVoiceGender.NEUTRAL
-            )
-
-            voice = texttospeech.VoiceSelectionParams(
-                language_code=self.config.tts_language_code,
-                name=self.config.tts_voice_name,
-                ssml_gender=voice_gender,
-            )
-
-            audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.MP3,
-                speaking_rate=self.config.tts_speaking_rate,
-                pitch=0.0,
-                volume_gain_db=self.config.tts_volume_gain,
-                sample_rate_hertz=self.config.tts_sample_rate,
-            )
-
-            response = self.tts_client.synthesize_speech(
-                input=synthesis_input, voice=voice, audio_config=audio_config
-            )
-            return response.audio_content
-
-        except Exception as error:
-            if retry_count < 3 and (
-                hasattr(error, "code")
-                and error.code in ["ECONNRESET", "ETIMEDOUT"]
-            ):
-                time.sleep(1 * (2**retry_count))
-                return self._synthesize_chunk(text, retry_count + 1)
-            else:
-                raise error
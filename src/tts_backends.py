@@ -0,0 +1,215 @@
+# ABOUTME: Speech synthesis engines behind TextToSpeech: Google Cloud TTS and a local CPU engine
+import os
+import time
+import shlex
+import shutil
+import logging
+import tempfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from google.cloud import texttospeech
+from google.oauth2 import service_account
+
+from .audio_formats import rewrap_wav, wav_sample_rate
+from .resilience import resilience
+from .tracing import tracer
+
+# ffmpeg output options for each TTS encoding (local engine output is transcoded from WAV)
+FFMPEG_CODECS = {
+    "MP3": ["-c:a", "libmp3lame", "-b:a", "48k", "-f", "mp3"],
+    "OGG_OPUS": ["-c:a", "libopus", "-b:a", "24k", "-application", "voip", "-f", "ogg"],
+    "LINEAR16": ["-c:a", "pcm_s16le", "-f", "wav"],
+    "MULAW": ["-c:a", "pcm_mulaw", "-f", "wav"],
+    "ALAW": ["-c:a", "pcm_alaw", "-f", "wav"],
+}
+
+# Opus only encodes at these rates; anything else is resampled to 48 kHz
+OPUS_SAMPLE_RATES = {8000, 12000, 16000, 24000, 48000}
+
+
+class GoogleTTSBackend:
+    """
+    Google Cloud TTS. Chunks are synthesized one request at a time, already in
+    the configured encoding, so the joined result needs no further processing.
+    """
+
+    name = "google"
+    max_chunk_bytes = 4900
+    batch_size = 1
+
+    def __init__(self, config, encoding):
+        self.config = config
+        self.chunk_encoding = encoding
+        credentials = service_account.Credentials.from_service_account_file(
+            os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+        )
+        self.tts_client = texttospeech.TextToSpeechClient(credentials=credentials)
+
+    def synthesize_chunks(self, chunks):
+        """Synthesize text chunks in order, returning one audio byte string per chunk"""
+        audio = []
+        for idx, chunk in enumerate(chunks):
+            logging.info(f"Processing audio chunk {idx + 1}/{len(chunks)}...")
+            with tracer.span("tts.chunk", index=idx, chars=len(chunk)):
+                audio.append(self._synthesize_chunk(chunk))
+            if idx < len(chunks) - 1:
+                time.sleep(0.1)
+        return audio
+
+    def finalize(self, audio_content):
+        return audio_content
+
+    def _synthesize_chunk(self, text):
+        """
+        Synthesizes a text chunk into audio content using Google Cloud TTS.
+        Transient gRPC and connection errors are retried (and slow requests
+        hedged) by the shared resilience wrapper, within the tts deadline.
+        """
+        synthesis_input = texttospeech.SynthesisInput(text=text)
+
+        # Map gender string to enum
+        gender_map = {
+            "NEUTRAL": texttospeech.SsmlVoiceGender.NEUTRAL,
+            "MALE": texttospeech.SsmlVoiceGender.MALE,
+            "FEMALE": texttospeech.SsmlVoiceGender.FEMALE,
+        }
+        voice_gender = gender_map.get(
+            self.config.tts_voice_gender,
+            texttospeech.SsmlVoiceGender.NEUTRAL
+        )
+
+        voice = texttospeech.VoiceSelectionParams(
+            language_code=self.config.tts_language_code,
+            name=self.config.tts_voice_name,
+            ssml_gender=voice_gender,
+        )
+
+        audio_config = texttospeech.AudioConfig(
+            audio_encoding=texttospeech.AudioEncoding[self.chunk_encoding],
+            speaking_rate=self.config.tts_speaking_rate,
+            pitch=0.0,
+            volume_gain_db=self.config.tts_volume_gain,
+            sample_rate_hertz=self.config.tts_sample_rate,
+        )
+
+        with tracer.span("tts.synthesize_speech"):
+            response = resilience.call(
+                "tts",
+                lambda timeout: self.tts_client.synthesize_speech(
+                    input=synthesis_input, voice=voice, audio_config=audio_config, timeout=timeout
+                ),
+                operation="tts.synthesize_speech",
+                idempotent=True,
+            )
+        return response.audio_content
+
+
+class LocalTTSBackend:
+    """
+    Offline synthesis with a local engine such as espeak-ng or Piper.
+
+    The engine command reads text on stdin and writes a WAV file to stdout, or
+    to the path given by an "{output}" argument. Each chunk runs as its own
+    process, so chunks from a whole batch of videos are spread over all cores.
+    Chunks come back as WAV, are joined per video, and transcoded once with
+    ffmpeg when the configured encoding is not plain PCM at the engine's rate.
+    """
+
+    name = "local"
+    chunk_encoding = "LINEAR16"
+
+    def __init__(self, config, encoding):
+        self.config = config
+        self.encoding = encoding
+        command = config.tts_local_command
+        self.command = shlex.split(command) if isinstance(command, str) else list(command)
+        self.workers = config.tts_local_workers or os.cpu_count() or 1
+        self.batch_size = max(1, config.tts_local_batch_size)
+        self.max_chunk_bytes = config.tts_local_chunk_bytes
+        self.timeout = config.tts_local_timeout
+
+        if not self.command or not shutil.which(self.command[0]):
+            raise RuntimeError(f"Local TTS engine not found in PATH: {self.command[:1]}")
+        self.ffmpeg = shutil.which("ffmpeg")
+
+    def synthesize_chunks(self, chunks):
+        """Synthesize text chunks in parallel, returning WAV bytes per chunk in input order"""
+        if not chunks:
+            return []
+        context = tracer.current_context()
+        workers = min(self.workers, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tts-local") as pool:
+            return list(pool.map(
+                lambda item: self._synthesize_chunk(item[0], item[1], context), enumerate(chunks)
+            ))
+
+    def finalize(self, audio_content):
+        """Convert joined engine WAV output to the configured encoding and sample rate"""
+        if self.encoding == "LINEAR16" and self._sample_rate(audio_content) == self.config.tts_sample_rate:
+            return rewrap_wav(audio_content)
+        if not self.ffmpeg:
+            raise RuntimeError(f"ffmpeg is required to encode local TTS output as {self.encoding}")
+
+        sample_rate = self.config.tts_sample_rate
+        if self.encoding == "OGG_OPUS" and sample_rate not in OPUS_SAMPLE_RATES:
+            sample_rate = 48000
+
+        with tempfile.TemporaryDirectory(prefix="tts-") as tmp:
+            source = os.path.join(tmp, "in.wav")
+            target = os.path.join(tmp, "out")
+            with open(source, "wb") as f:
+                f.write(audio_content)
+            # Write to a seekable file so ffmpeg can fix up WAV header sizes
+            with tracer.span("tts.transcode", encoding=self.encoding):
+                self._run([
+                    self.ffmpeg, "-nostdin", "-loglevel", "error", "-y", "-i", source,
+                    "-ac", "1", "-ar", str(sample_rate), *FFMPEG_CODECS[self.encoding], target,
+                ])
+            with open(target, "rb") as f:
+                return f.read()
+
+    def _synthesize_chunk(self, index, text, context):
+        with tracer.attach(context), tracer.span("tts.chunk", index=index, chars=len(text), engine="local"):
+            if not any("{output}" in arg for arg in self.command):
+                return self._run(self.command, stdin=text)
+
+            with tempfile.TemporaryDirectory(prefix="tts-") as tmp:
+                output = os.path.join(tmp, "chunk.wav")
+                self._run([arg.replace("{output}", output) for arg in self.command], stdin=text)
+                with open(output, "rb") as f:
+                    return f.read()
+
+    def _run(self, command, stdin=None):
+        result = subprocess.run(
+            command,
+            input=stdin.encode("utf-8") if stdin is not None else None,
+            capture_output=True,
+            timeout=self.timeout,
+        )
+        if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", errors="replace").strip()
+            raise RuntimeError(f"{os.path.basename(command[0])} exited with {result.returncode}: {stderr[-500:]}")
+        return result.stdout
+
+    @staticmethod
+    def _sample_rate(wav_data):
+        try:
+            return wav_sample_rate(wav_data)
+        except ValueError:
+            return None
+
+
+TTS_BACKENDS = {
+    "google": GoogleTTSBackend,
+    "local": LocalTTSBackend,
+}
+
+
+def create_backend(config, encoding):
+    """Instantiate the TTS engine selected by tts.backend in the config"""
+    if config.tts_backend not in TTS_BACKENDS:
+        raise ValueError(
+            f"Unsupported TTS backend '{config.tts_backend}'. Choose one of: {', '.join(TTS_BACKENDS)}"
+        )
+    return TTS_BACKENDS[config.tts_backend](config, encoding)
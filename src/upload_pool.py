@@ -0,0 +1,100 @@
+# ABOUTME: Concurrent Google Drive upload executor with a cap on in-flight bytes
+import os
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .tracing import tracer
+
+
+class InFlightByteLimiter:
+    """
+    Blocks callers until the requested number of bytes fits under the cap.
+    A single item larger than the cap is admitted once nothing else is in flight,
+    so oversized files still upload instead of deadlocking.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.in_flight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, size):
+        with self._cond:
+            while self.in_flight > 0 and self.in_flight + size > self.max_bytes:
+                self._cond.wait()
+            self.in_flight += size
+
+    def release(self, size):
+        with self._cond:
+            self.in_flight -= size
+            self._cond.notify_all()
+
+
+class UploadPool:
+    """Uploads a batch of local files to Drive with a thread pool"""
+
+    def __init__(self, drive_uploader, max_workers=4, max_inflight_bytes=64 * 1024 * 1024):
+        self.drive_uploader = drive_uploader
+        self.max_workers = max(1, max_workers)
+        self.limiter = InFlightByteLimiter(max_inflight_bytes)
+
+    def upload_all(self, jobs, delete_after_upload=True):
+        """
+        Upload (file_path, folder_id, mimetype) jobs concurrently.
+
+        Small text files are queued first so they finish quickly, while audio files
+        follow largest-first and overlap with them on the remaining workers.
+        Each local file is deleted only after its own upload returned a file ID.
+        Returns the number of files uploaded successfully.
+        """
+        sized_jobs = [(path, folder_id, mimetype, os.path.getsize(path)) for path, folder_id, mimetype in jobs]
+        text_jobs = sorted(
+            (job for job in sized_jobs if not self._is_audio(job[2])), key=lambda job: job[3]
+        )
+        audio_jobs = sorted(
+            (job for job in sized_jobs if self._is_audio(job[2])), key=lambda job: job[3], reverse=True
+        )
+
+        uploaded = 0
+        trace_context = tracer.current_context()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="drive-upload") as executor:
+            futures = {}
+            for path, folder_id, mimetype, size in text_jobs + audio_jobs:
+                # Admission happens here so submission order is preserved under the byte cap
+                self.limiter.acquire(size)
+                future = executor.submit(
+                    self._upload_one, path, folder_id, mimetype, size, delete_after_upload, trace_context
+                )
+                futures[future] = path
+
+            for future in as_completed(futures):
+                try:
+                    if future.result():
+                        uploaded += 1
+                except Exception as e:
+                    logging.error(f"Error uploading {futures[future]}: {e}")
+
+        return uploaded
+
+    def _upload_one(self, path, folder_id, mimetype, size, delete_after_upload, trace_context=None):
+        try:
+            with tracer.attach(trace_context), tracer.span("drive.upload_file", path=str(path)):
+                file_id = self.drive_uploader.upload_file(str(path), folder_id=folder_id, mimetype=mimetype)
+        finally:
+            self.limiter.release(size)
+
+        if file_id and delete_after_upload:
+            self._delete_local(path)
+        return file_id
+
+    def _delete_local(self, path):
+        try:
+            os.remove(path)
+            logging.info(f"Deleted local file: {path}")
+        except Exception as e:
+            logging.error(f"Error deleting local file {path}: {e}")
+
+    @staticmethod
+    def _is_audio(mimetype):
+        return bool(mimetype) and mimetype.startswith("audio/")
@@ -1,30 +1,69 @@
 # ABOUTME: Utility functions for file operations, naming, and data management
 import re
 import os
+import hashlib
+import tempfile
+import threading
+import time
 import pandas as pd
 from pathlib import Path
 from datetime import timedelta
 
+from .transcript_store import encode_segments, TRANSCRIPT_STORE_SUFFIX
+
 
 def sanitize_name(name):
     """Sanitize folder or file names by removing special characters and spaces."""
     return re.sub(r"[^\w\s\u4e00-\u9fff]", "", name.strip().replace(" ", "_"))
 
 
+CSV_COLUMNS = ["Video URL", "Video ID", "Upload Date", "Scrape Date", "Status", "Transcript File"]
+
+
 def append_to_csv(file_path, data):
     """Append data to a CSV file, creating it if it doesn't exist.
-    Updates existing rows if Video ID and Upload Date match."""
-    columns = ["Video URL", "Video ID", "Upload Date", "Scrape Date", "Status"]
-    df = pd.DataFrame(data, columns=columns)
-    if not os.path.exists(file_path):
-        df.to_csv(file_path, index=False)
-    else:
+    Updates existing rows if Video ID and Upload Date match.
+    The file is rewritten atomically, so a crash never leaves it truncated."""
+    df = pd.DataFrame(data, columns=CSV_COLUMNS)
+    if os.path.exists(file_path):
         existing = pd.read_csv(file_path)
-        combined = pd.concat([existing, df]).drop_duplicates(
+        df = pd.concat([existing, df]).drop_duplicates(
             subset=["Video ID", "Upload Date"],
             keep='last'  # Keep the most recent entry (new data)
         )
-        combined.to_csv(file_path, index=False)
+    atomic_write(file_path, df.to_csv(index=False))
+
+
+def atomic_write(file_path, data):
+    """
+    Write bytes or text to file_path atomically: the data goes to a temp file in
+    the same folder, is fsynced, then renamed over the target. A crash leaves
+    either the old file or the new one, never a truncated one.
+    Returns the SHA-256 checksum of the written data.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    file_path = Path(file_path)
+    fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return hashlib.sha256(data).hexdigest()
+
+
+def build_file_path(folder, base_name, suffix, extension, max_length=30):
+    """Return {folder}/{sanitized_base_name}_{suffix}{extension}"""
+    file_name = sanitize_name(base_name)[:max_length]
+    if suffix:
+        file_name += f"_{suffix}"
+    return folder / f"{file_name}{extension}"
 
 
 def save_text_file(folder, base_name, suffix, text, max_length=30):
@@ -33,33 +72,105 @@ def save_text_file(folder, base_name, suffix, text, max_length=30):
     The file will be named as: {sanitized_base_name}_{suffix}.txt,
     where 'suffix' is the computed published date (e.g., YYYYMMDD).
     """
-    file_name = sanitize_name(base_name)[:max_length]
-    if suffix:
-        file_name += f"_{suffix}"
-    file_path = folder / f"{file_name}.txt"
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(text)
+    file_path = build_file_path(folder, base_name, suffix, ".txt", max_length)
+    atomic_write(file_path, text)
     return file_path
 
 
+def save_segments_file(folder, base_name, suffix, segments, max_length=30):
+    """
+    Save timestamped transcript segments to a compressed segment store.
+    Uses the same naming scheme as save_text_file with a .tsz extension.
+    """
+    file_path = build_file_path(folder, base_name, suffix, TRANSCRIPT_STORE_SUFFIX, max_length)
+    atomic_write(file_path, encode_segments(segments))
+    return file_path
+
+
+# Length of each relative-time unit; months and years are YouTube's rounded labels
+RELATIVE_TIME_UNITS = {
+    "second": timedelta(seconds=1),
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+    "year": timedelta(days=365),
+}
+
+# Shortest and longest span of the calendar units, for conservative age ranges
+RELATIVE_TIME_SPANS = {
+    "month": (timedelta(days=28), timedelta(days=31)),
+    "year": (timedelta(days=365), timedelta(days=366)),
+}
+
+# Extra margin on both ends of an age range, for rounding and time zones
+RELATIVE_TIME_SLACK = timedelta(days=1)
+
+
+def _match_relative_time(text):
+    """(count, unit name) of a relative time string, or None"""
+    text = text.lower().replace("streamed", "").replace("premiered", "").strip()
+    match = re.match(r"(\d+)\s+(second|minute|hour|day|week|month|year)s?\b", text)
+    if not match:
+        return None
+    return int(match.group(1)), match.group(2)
+
+
+def relative_time_range(text):
+    """
+    Parse a relative time string (e.g., "3 days ago", "2 months ago") into the
+    (earliest, latest) age it can stand for: "2 months ago" means at least two
+    and less than three months. The range is widened to the shortest and
+    longest months and years plus a day either side, so a date outside it is
+    certainly not what the label means. Returns None if the string cannot be parsed.
+    """
+    matched = _match_relative_time(text)
+    if not matched:
+        return None
+    value, name = matched
+    unit = RELATIVE_TIME_UNITS[name]
+    shortest, longest = RELATIVE_TIME_SPANS.get(name, (unit, unit))
+    earliest = max(shortest * value - RELATIVE_TIME_SLACK, timedelta(0))
+    return earliest, longest * (value + 1) + RELATIVE_TIME_SLACK
+
+
 def parse_relative_time(text):
     """
-    Parse a relative time string (e.g., "3 days ago", "1 week ago", "4 hours ago")
+    Parse a relative time string (e.g., "3 days ago", "1 week ago", "1 year ago")
     and return a timedelta object. Returns None if the string cannot be parsed.
     """
-    text = text.lower().replace("streamed", "").strip()
-    match = re.match(
-        r"(\d+)\s+(minute|minutes|hour|hours|day|days|week|weeks)", text
-    )
-    if match:
-        value = int(match.group(1))
-        unit = match.group(2)
-        if "minute" in unit:
-            return timedelta(minutes=value)
-        elif "hour" in unit:
-            return timedelta(hours=value)
-        elif "day" in unit:
-            return timedelta(days=value)
-        elif "week" in unit:
-            return timedelta(weeks=value)
-    return None
+    matched = _match_relative_time(text)
+    if not matched:
+        return None
+    value, name = matched
+    return RELATIVE_TIME_UNITS[name] * value
+
+
+class RequestPacer:
+    """
+    Spaces requests to one host at least interval seconds apart, across all
+    threads sharing it. reserve() claims the next free slot and returns how
+    long the caller must sleep before sending; work done since the previous
+    request counts towards the wait.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._next_at = None
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        if self.interval <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            slot = now if self._next_at is None else max(now, self._next_at)
+            self._next_at = slot + self.interval
+        return slot - now
+
+    def wait(self):
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
@@ -1,81 +1,167 @@
 # ABOUTME: YouTube video scraping and transcript extraction functionality
+import csv
+import queue
 import logging
+import threading
 import pandas as pd
 import time
 from pathlib import Path
 from datetime import datetime, timedelta
-from youtube_transcript_api import YouTubeTranscriptApi, YouTubeRequestFailed
+from youtube_transcript_api import YouTubeTranscriptApi, YouTubeRequestFailed, RequestBlocked
 from youtube_transcript_api.formatters import TextFormatter
+from concurrent.futures import ThreadPoolExecutor
 import scrapetube
+import requests
+
+from .utils import (
+    sanitize_name,
+    save_text_file,
+    save_segments_file,
+    build_file_path,
+    append_to_csv,
+    CSV_COLUMNS,
+    parse_relative_time,
+    RequestPacer,
+)
+from .feed_checker import FeedChecker
+from .publish_dates import PublishDates
+from .backfill import BackfillPlan
+from .journal import RunJournal
+from .resilience import resilience, CircuitOpenError
+from .tracing import tracer
+from .transcript_store import TRANSCRIPT_STORE_SUFFIX
+
+
+class DeadlineSession(requests.Session):
+    """
+    HTTP session for youtube-transcript-api, whose calls take no timeout.
+    Requests made inside bounded() default to the time left before the
+    resilience deadline, so an abandoned fetch does not hang in its worker.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._local = threading.local()
+
+    def bounded(self, timeout, fn):
+        self._local.timeout = timeout
+        try:
+            return fn()
+        finally:
+            self._local.timeout = None
 
-from .utils import sanitize_name, save_text_file, append_to_csv, parse_relative_time
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", getattr(self._local, "timeout", None))
+        return super().request(method, url, **kwargs)
 
 
 class YouTubeProcessor:
     """Handles YouTube channel scraping and transcript extraction"""
 
-    def __init__(self, config):
+    def __init__(self, config, search_index=None, backfill=None):
         self.config = config
+        self.search_index = search_index
         self.formatter = TextFormatter()
         self.videos_processed_count = 0  # Track videos for rate limiting
-
-    def process_channel(self, channel_username, output_folder):
+        # A BackfillWindow switches iter_channel_videos() to the sharded historical backfill
+        self.backfill = backfill
+        self.feed_checker = FeedChecker(config) if config.feed_check_enabled and not backfill else None
+        # One pace for every request to YouTube (transcripts and watch pages), shared by backfill workers
+        self.pacer = RequestPacer(config.delay_between_videos)
+        self.publish_dates = (
+            PublishDates(config, pacer=self.pacer) if config.exact_publish_dates or backfill else None
+        )
+        # Videos whose transcript fetch was paused by the transcripts circuit breaker
+        self.deferred_videos = []
+        # Backfill workers share the CSV and the counters
+        self._lock = threading.Lock()
+
+    def prepare_channel_folder(self, channel_username, output_folder):
+        """Create the channel folder and its subfolders, returning the channel folder path"""
+        channel_name = sanitize_name(channel_username)
+        channel_folder = output_folder / channel_name
+
+        for subfolder in (
+            self.config.drive_transcripts_folder,
+            self.config.drive_summaries_folder,
+            self.config.drive_audio_folder,
+        ):
+            (channel_folder / subfolder).mkdir(parents=True, exist_ok=True)
+
+        return channel_folder
+
+    def iter_channel_videos(self, channel_username, channel_folder):
         """
-        Process a single YouTube channel: scrape videos and extract transcripts.
-        Returns the channel folder path for further processing.
+        Scrape a channel and extract transcripts, yielding one lightweight record
+        per attempted video as soon as its transcript stage finishes.
+
+        Records only carry IDs, paths and status (see _make_record); transcript
+        text stays on disk, so memory does not grow with the number of videos.
+        Running totals are kept in self.channel_stats.
         """
+        self.channel_stats = {"scanned": 0, "succeeded": 0, "failed": 0, "deferred": 0}
+        if self.backfill:
+            yield from self._iter_backfill_videos(channel_username, channel_folder)
+            return
+        transcripts_folder = channel_folder / self.config.drive_transcripts_folder
+        csv_path = channel_folder / "channel_data.csv"
+        journal = RunJournal.for_folder(channel_folder)
+
         try:
+            # Cheap feed pre-check: skip the full scrape when nothing new was uploaded
+            if self.feed_checker and not self.feed_checker.has_new_videos(channel_username):
+                print(f"💤 No new uploads in feed for {channel_username} - skipping scrape")
+                return
+
             print(f"🔍 Fetching videos from channel: {channel_username}")
             logging.info(f"Fetching videos from channel: {channel_username}")
 
             videos = scrapetube.get_channel(channel_username=channel_username)
+            processed_ids = self._load_processed_ids(csv_path)
+            scan_aborted = False
+            # Videos to retry on the next run, which the feed check must not hide
+            retry_ids = []
 
-            channel_name = sanitize_name(channel_username)
-            channel_folder = output_folder / channel_name
-
-            # Create subfolders
-            transcripts_folder = channel_folder / self.config.drive_transcripts_folder
-            summaries_folder = channel_folder / self.config.drive_summaries_folder
-            audio_folder = channel_folder / self.config.drive_audio_folder
-
-            transcripts_folder.mkdir(parents=True, exist_ok=True)
-            summaries_folder.mkdir(parents=True, exist_ok=True)
-            audio_folder.mkdir(parents=True, exist_ok=True)
+            for video in self._timed_scrape(videos, channel_username):
+                self.channel_stats["scanned"] += 1
 
-            csv_path = channel_folder / "channel_data.csv"
-
-            processed_videos = []
-            video_count = 0
-
-            for video in videos:
-                video_count += 1
                 video_data = self._process_video(
                     video,
                     transcripts_folder,
                     csv_path,
-                    channel_username
+                    channel_username,
+                    processed_ids,
+                    journal,
                 )
 
-                if video_data:
-                    processed_videos.append(video_data)
-
-                    # Add delay after processing each video to avoid rate limiting
-                    if video_data.get("Status") == "SUCCESS":
+                if video_data and "Video ID" in video_data:
+                    if video_data["Status"] == "DEFERRED":
+                        self.channel_stats["deferred"] += 1
+                        scan_aborted = True
+                    elif video_data["Status"] == "SUCCESS":
+                        self.channel_stats["succeeded"] += 1
                         self.videos_processed_count += 1
-                        if self.config.delay_between_videos > 0:
-                            print(f"      ⏱️  Waiting {self.config.delay_between_videos}s before next request...")
-                            time.sleep(self.config.delay_between_videos)
+                    else:
+                        self.channel_stats["failed"] += 1
+                        if video_data["Status"] != "FAILED - Subtitles disabled":
+                            retry_ids.append(video_data["Video ID"])
+                    yield self._make_record(video_data)
 
                 # Check if we should stop processing older videos
                 if video_data and video_data.get("stop_processing"):
                     print(f"⏹️  Stopped processing - reached videos older than {self.config.days_back} days")
                     break
 
-            print(f"📊 Total videos scanned: {video_count}")
-            print(f"✅ Videos processed: {len([v for v in processed_videos if v.get('Status') == 'SUCCESS'])}")
-            logging.info(f"Channel {channel_username}: Scanned {video_count} videos, processed {len(processed_videos)}")
+            print(f"📊 Total videos scanned: {self.channel_stats['scanned']}")
+            print(f"✅ Videos processed: {self.channel_stats['succeeded']}")
+            if self.channel_stats["deferred"]:
+                print(f"⏸️  Transcripts deferred until YouTube accepts requests: {self.channel_stats['deferred']}")
+            logging.info(
+                f"Channel {channel_username}: Scanned {self.channel_stats['scanned']} videos, "
+                f"processed {self.channel_stats['succeeded'] + self.channel_stats['failed']}"
+            )
 
-            if video_count == 0:
+            if self.channel_stats["scanned"] == 0:
                 print(f"⚠️  No videos found for channel '{channel_username}'")
                 print(f"   This could mean:")
                 print(f"   - The channel username is incorrect")
@@ -83,16 +169,308 @@ class YouTubeProcessor:
                 print(f"   - Try using the channel ID instead (starts with 'UC')")
                 logging.warning(f"No videos found for channel {channel_username}")
 
-            return channel_folder
+            # Only trust the feed validators once the scan got through
+            if self.feed_checker and not scan_aborted:
+                self.feed_checker.mark_seen(channel_username, failed_ids=retry_ids)
 
         except Exception as e:
             print(f"❌ Error processing channel '{channel_username}': {e}")
             logging.error(f"Error processing channel {channel_username}: {e}")
             import traceback
             traceback.print_exc()
-            return None
+        finally:
+            if self.publish_dates:
+                self.publish_dates.save()
 
-    def _process_video(self, video, transcripts_folder, csv_path, channel_username):
+    def iter_pending_transcripts(self, channel_folder):
+        """
+        Yield records for transcripts from earlier runs that are still on disk,
+        e.g. because summarization failed or the run was interrupted.
+        Streams the channel CSV row by row instead of loading it into a DataFrame.
+        Rows written before the CSV recorded transcript file names are matched
+        to a file by their publish date once all named files are known.
+        """
+        csv_path = channel_folder / "channel_data.csv"
+        transcripts_folder = channel_folder / self.config.drive_transcripts_folder
+        journal = RunJournal.for_folder(channel_folder)
+        if not csv_path.exists():
+            return
+
+        claimed = set()
+        legacy_rows = []
+        with open(csv_path, "r", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                if row.get("Status") != "SUCCESS":
+                    continue
+                transcript_name = row.get("Transcript File")
+                if not transcript_name:
+                    legacy_rows.append(row)
+                    continue
+                claimed.add(transcript_name)
+                transcript_path = transcripts_folder / transcript_name
+                if journal.is_complete(transcript_path):
+                    yield self._pending_record(row, transcript_path)
+
+        for row, transcript_path in self._match_legacy_transcripts(legacy_rows, transcripts_folder, claimed):
+            if journal.is_complete(transcript_path):
+                yield self._pending_record(row, transcript_path)
+
+    def _pending_record(self, row, transcript_path):
+        return {
+            "video_id": row["Video ID"],
+            "video_url": row["Video URL"],
+            "transcript_path": transcript_path,
+            "status": row["Status"],
+        }
+
+    def _match_legacy_transcripts(self, rows, transcripts_folder, claimed):
+        """
+        Pair CSV rows without a Transcript File with the transcript saved for
+        them. Those rows do not store the title, so the file is found by the
+        publish date suffix the scrape computed (Scrape Date minus the relative
+        Upload Date). Dates shared by several unnamed rows or files are skipped
+        rather than guessed.
+        """
+        by_suffix = {}
+        for row in rows:
+            age = parse_relative_time(row.get("Upload Date") or "")
+            try:
+                scraped = datetime.strptime(row.get("Scrape Date") or "", "%Y-%m-%d %H:%M:%S")
+            except ValueError:
+                continue
+            if age is not None:
+                by_suffix.setdefault((scraped - age).strftime("%Y%m%d"), []).append(row)
+
+        for date_suffix, suffix_rows in by_suffix.items():
+            files = [
+                path
+                for extension in (".txt", TRANSCRIPT_STORE_SUFFIX)
+                for path in transcripts_folder.glob(f"*_{date_suffix}{extension}")
+                if path.name not in claimed
+            ]
+            if len(suffix_rows) == 1 and len(files) == 1:
+                yield suffix_rows[0], files[0]
+            elif files:
+                logging.info(
+                    f"Cannot tell apart {len(files)} transcript(s) from {date_suffix} "
+                    f"for {len(suffix_rows)} older CSV row(s); leaving them"
+                )
+
+    def retry_deferred(self):
+        """
+        Retry transcript fetches paused by the transcripts circuit, yielding
+        (channel_username, channel_folder, record) for each attempted video.
+        Videos that hit an open circuit again are deferred again.
+        """
+        deferred, self.deferred_videos = self.deferred_videos, []
+        for video, video_data, channel_username, channel_folder in deferred:
+            video_data["Status"] = "PENDING"
+            video_data = self._extract_transcript(
+                video,
+                video_data,
+                channel_folder / self.config.drive_transcripts_folder,
+                channel_folder / "channel_data.csv",
+                channel_username,
+                journal=RunJournal.for_folder(channel_folder),
+            )
+            yield channel_username, channel_folder, self._make_record(video_data)
+
+    def _iter_backfill_videos(self, channel_username, channel_folder):
+        """
+        Historical backfill of a channel within self.backfill's date window.
+
+        The full listing is saved once and cut into shards of consecutive
+        videos; worker threads each take a shard, resolve exact publish dates
+        and fetch transcripts, while this generator yields their records to the
+        caller as they finish. Shard checkpoints let an interrupted backfill
+        resume without repeating finished videos.
+        """
+        csv_path = channel_folder / "channel_data.csv"
+        try:
+            plan = BackfillPlan.load_or_create(
+                channel_folder / self.config.backfill_folder,
+                lambda: self._list_channel_videos(channel_username),
+                self.config.backfill_shard_size,
+            )
+        except Exception as e:
+            print(f"❌ Error listing videos for channel '{channel_username}': {e}")
+            logging.error(f"Error listing videos for channel {channel_username}: {e}")
+            return
+
+        shards = [shard for shard in plan.shards if not shard.complete]
+        print(
+            f"🗄️  Backfill {self.backfill.describe()}: {len(plan.videos)} videos listed, "
+            f"{len(shards)}/{len(plan.shards)} shard(s) left, {self.config.backfill_workers} worker(s)"
+        )
+        logging.info(f"Backfill of {channel_username}: {len(shards)} of {len(plan.shards)} shards to process")
+
+        processed_ids = self._load_processed_ids(csv_path)
+        journal = RunJournal.for_folder(channel_folder)
+        records = queue.Queue()
+        stop = threading.Event()
+        context = tracer.current_context()
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, self.config.backfill_workers), thread_name_prefix="backfill"
+        ) as pool:
+            futures = [
+                pool.submit(
+                    self._backfill_shard, plan, shard, channel_username, channel_folder,
+                    processed_ids, journal, records, stop, context,
+                )
+                for shard in shards
+            ]
+            try:
+                finished = 0
+                while finished < len(futures):
+                    record = records.get()
+                    if record is None:
+                        finished += 1
+                    else:
+                        yield record
+            finally:
+                stop.set()
+
+        left = 0
+        for shard, future in zip(shards, futures):
+            if future.exception():
+                logging.error(f"Backfill shard {shard.index} of {channel_username} failed: {future.exception()}")
+            if future.exception() or not future.result():
+                left += 1
+        self.publish_dates.save()
+        print(f"📊 Total videos scanned: {self.channel_stats['scanned']}")
+        print(f"✅ Videos processed: {self.channel_stats['succeeded']}")
+        if left:
+            print(f"⏸️  {left} shard(s) unfinished - run --backfill again to resume")
+        logging.info(
+            f"Backfill of {channel_username}: {self.channel_stats['succeeded']} transcripts, "
+            f"{self.channel_stats['failed']} failed, {left} shard(s) unfinished"
+        )
+
+    def _list_channel_videos(self, channel_username):
+        """Every video of a channel, newest first, reduced to what the backfill needs"""
+        print(f"🔍 Listing all videos of channel: {channel_username}")
+        videos = []
+        for video in self._timed_scrape(
+            scrapetube.get_channel(channel_username=channel_username), channel_username
+        ):
+            published = video.get("publishedTimeText", {}).get("simpleText")
+            if not published:
+                # Upcoming premieres and live streams have no date yet
+                continue
+            videos.append({
+                "video_id": video["videoId"],
+                "title": video.get("title", {}).get("runs", [{}])[0].get("text", "No Title Available"),
+                "published": published,
+            })
+        return videos
+
+    def _backfill_shard(
+        self, plan, shard, channel_username, channel_folder, processed_ids, journal, records, stop, context,
+    ):
+        """
+        Worker: fetch the transcripts of one shard, putting records on the queue
+        and None when done. Returns False if it stopped before the end of the shard.
+        """
+        transcripts_folder = channel_folder / self.config.drive_transcripts_folder
+        csv_path = channel_folder / "channel_data.csv"
+        try:
+            with tracer.attach(context):
+                for video in shard.pending():
+                    if stop.is_set() or not resilience.breaker("transcripts").available():
+                        return False
+                    video_id = video["video_id"]
+                    with self._lock:
+                        self.channel_stats["scanned"] += 1
+
+                    if video_id in processed_ids:
+                        shard.mark(video_id)
+                        continue
+                    if any(keyword in video["title"].lower() for keyword in self.config.skip_keywords):
+                        shard.mark(video_id)
+                        continue
+                    # Labels like "3 years ago" often rule a video out without a request
+                    if not self.backfill.may_contain(video["published"], plan.listed_at):
+                        continue
+
+                    age = parse_relative_time(video["published"])
+                    estimate = (plan.listed_at - age).strftime("%Y%m%d") if age else plan.listed_at.strftime("%Y%m%d")
+                    try:
+                        date_suffix = self._exact_date_suffix(video_id, estimate)
+                    except CircuitOpenError:
+                        return False
+                    if not self.backfill.contains(date_suffix):
+                        continue
+
+                    print(f"   📹 [{shard.index}] {video['title'][:50]}... ({date_suffix}, ID: {video_id})")
+                    video_data = {
+                        "Video URL": f"https://www.youtube.com/watch?v={video_id}",
+                        "Video ID": video_id,
+                        "Upload Date": video["published"],
+                        "Scrape Date": pd.Timestamp.now().strftime("%Y-%m-%d %H:%M:%S"),
+                        "Status": "PENDING",
+                        "video_title": video["title"],
+                        "date_suffix": date_suffix,
+                        "channel_username": channel_username,
+                    }
+                    video_data = self._extract_transcript(
+                        video, video_data, transcripts_folder, csv_path, channel_username, journal
+                    )
+
+                    status = video_data["Status"]
+                    if status == "DEFERRED":
+                        # The transcripts circuit is open; main retries it, the checkpoint does not count it
+                        with self._lock:
+                            self.channel_stats["deferred"] += 1
+                        records.put(self._make_record(video_data))
+                        return False
+                    with self._lock:
+                        if status == "SUCCESS":
+                            self.channel_stats["succeeded"] += 1
+                            self.videos_processed_count += 1
+                        else:
+                            self.channel_stats["failed"] += 1
+                    if status == "SUCCESS" or status == "FAILED - Subtitles disabled":
+                        shard.mark(video_id)
+                    records.put(self._make_record(video_data))
+            return True
+        finally:
+            records.put(None)
+
+    def _timed_scrape(self, videos, channel_username):
+        """
+        Iterate scrapetube results, recording a span for each step that hit the
+        network (page fetches); in-memory steps are not worth a span.
+        """
+        iterator = iter(videos)
+        while True:
+            start_ns = time.time_ns()
+            try:
+                video = next(iterator)
+            except StopIteration:
+                return
+            end_ns = time.time_ns()
+            if end_ns - start_ns > 20_000_000:
+                tracer.record(
+                    f"channel:{channel_username}", "youtube.scrape_page", start_ns, end_ns,
+                    channel=channel_username,
+                )
+            yield video
+
+    @staticmethod
+    def _make_record(video_data):
+        """Reduce a video_data dict to the fields downstream stages need"""
+        transcript_path = video_data.get("transcript_path")
+        return {
+            "video_id": video_data["Video ID"],
+            "video_url": video_data["Video URL"],
+            "transcript_path": transcript_path,
+            "status": video_data["Status"],
+        }
+
+    def _process_video(
+        self, video, transcripts_folder, csv_path, channel_username, processed_ids=(), journal=None
+    ):
         """Process a single video and extract transcript"""
         video_id = video["videoId"]
         video_url = f"https://www.youtube.com/watch?v={video_id}"
@@ -135,10 +513,21 @@ class YouTubeProcessor:
         date_suffix = absolute_date.strftime("%Y%m%d")
 
         # Check if already processed
-        if self._is_already_processed(csv_path, video_id):
+        if video_id in processed_ids:
             print(f"      ⏭️  Already processed - skipping")
             return None
 
+        if self.publish_dates:
+            try:
+                date_suffix = self._exact_date_suffix(video_id, date_suffix)
+            except CircuitOpenError:
+                pass  # The transcript fetch below defers the video
+            # The label is rounded ("1 week ago"); the exact date decides the window
+            cutoff = (datetime.now() - timedelta(days=self.config.days_back)).strftime("%Y%m%d")
+            if date_suffix < cutoff:
+                print(f"      ⏹️  Published {date_suffix}, before {cutoff} - stopping scan")
+                return {"stop_processing": True}
+
         print(f"      ✅ Within time window - processing...")
 
         video_data = {
@@ -151,51 +540,117 @@ class YouTubeProcessor:
             "date_suffix": date_suffix,
             "channel_username": channel_username,
         }
-
+        return self._extract_transcript(video, video_data, transcripts_folder, csv_path, channel_username, journal)
+
+    def _extract_transcript(self, video, video_data, transcripts_folder, csv_path, channel_username, journal=None):
+        """Fetch, save and index the transcript of a video that passed the date checks"""
+        video_id = video_data["Video ID"]
+        video_title = video_data["video_title"]
+        date_suffix = video_data["date_suffix"]
+
+        # Space requests to YouTube; skipped while the circuit would refuse the fetch anyway
+        if resilience.breaker("transcripts").available():
+            delay = self.pacer.reserve()
+            if delay > 0:
+                if not self.backfill:
+                    print(f"      ⏱️  Waiting {delay:.1f}s before next request...")
+                time.sleep(delay)
+
+        started = time.monotonic()
         try:
-            print(f"      📝 Fetching transcript...")
-            # Fetch transcript using new API (youtube-transcript-api v1.2.3+)
-            api = YouTubeTranscriptApi()
-
-            if self.config.preferred_languages:
-                # Get list of available transcripts and find preferred language
-                transcript_list = api.list(video_id)
-                transcript = transcript_list.find_transcript(self.config.preferred_languages)
-                fetched = transcript.fetch()
-            else:
-                # Direct fetch (gets default language)
-                fetched = api.fetch(video_id)
-
-            # Format transcript to text (TextFormatter expects FetchedTranscript object)
-            txt_formatted = self.formatter.format_transcript(fetched)
-            video_data["Status"] = "SUCCESS"
-            video_data["transcript"] = txt_formatted
-
-            # Save transcript file
-            transcript_file = save_text_file(
-                transcripts_folder,
-                video_title,
-                date_suffix,
-                txt_formatted,
-                self.config.file_name_max_length
-            )
-            print(f"      💾 Transcript saved: {transcript_file.name}")
-            logging.info(f"Transcript saved for video: {video_id}")
-
-        except YouTubeRequestFailed as e:
+            with tracer.trace(video_id, "video.transcript", channel=channel_username) as root:
+                print(f"      📝 Fetching transcript...")
+                # Fetch transcript using new API (youtube-transcript-api v1.2.3+)
+                session = DeadlineSession()
+                api = YouTubeTranscriptApi(http_client=session)
+
+                if self.config.preferred_languages:
+                    # Get list of available transcripts and find preferred language
+                    with tracer.span("youtube.list", video_id=video_id):
+                        transcript_list = resilience.call(
+                            "transcripts", lambda timeout: session.bounded(timeout, lambda: api.list(video_id)),
+                            operation="youtube.list", idempotent=True,
+                        )
+                    transcript = transcript_list.find_transcript(self.config.preferred_languages)
+                    with tracer.span("youtube.fetch", video_id=video_id, language=transcript.language_code):
+                        fetched = resilience.call(
+                            "transcripts", lambda timeout: session.bounded(timeout, transcript.fetch),
+                            operation="youtube.fetch", idempotent=True,
+                        )
+                else:
+                    # Direct fetch (gets default language)
+                    with tracer.span("youtube.fetch", video_id=video_id):
+                        fetched = resilience.call(
+                            "transcripts", lambda timeout: session.bounded(timeout, lambda: api.fetch(video_id)),
+                            operation="youtube.fetch", idempotent=True,
+                        )
+
+                # Format transcript to text (TextFormatter expects FetchedTranscript object)
+                txt_formatted = self.formatter.format_transcript(fetched)
+                video_data["Status"] = "SUCCESS"
+
+                # Save transcript file (atomically, bracketed by journal entries)
+                extension = ".txt" if self.config.transcript_format != "segments" else TRANSCRIPT_STORE_SUFFIX
+                expected_file = build_file_path(
+                    transcripts_folder, video_title, date_suffix, extension, self.config.file_name_max_length
+                )
+                if journal:
+                    journal.start("transcript", expected_file)
+
+                if self.config.transcript_format == "segments":
+                    transcript_file = save_segments_file(
+                        transcripts_folder,
+                        video_title,
+                        date_suffix,
+                        fetched,
+                        self.config.file_name_max_length
+                    )
+                else:
+                    transcript_file = save_text_file(
+                        transcripts_folder,
+                        video_title,
+                        date_suffix,
+                        txt_formatted,
+                        self.config.file_name_max_length
+                    )
+                if journal:
+                    journal.complete("transcript", transcript_file, video_id=video_id)
+                video_data["transcript_path"] = transcript_file
+                root.set(segments=len(fetched), chars=len(txt_formatted))
+                video_data["Transcript File"] = transcript_file.name
+                print(f"      💾 Transcript saved: {transcript_file.name}")
+                logging.info(f"Transcript saved for video: {video_id}")
+                resilience.observe("video.transcript", time.monotonic() - started)
+
+                if self.search_index:
+                    self.search_index.add_document(
+                        video_id,
+                        "transcript",
+                        txt_formatted,
+                        channel=channel_username,
+                        title=video_title,
+                        published=date_suffix,
+                        path=transcript_file.name,
+                    )
+
+        except CircuitOpenError:
+            # YouTube is refusing requests; keep the video for when the circuit recovers
+            print(f"      ⏸️  Transcript requests paused - deferred")
+            return self._defer_video(video, video_data, channel_username, transcripts_folder)
+        except (YouTubeRequestFailed, RequestBlocked) as e:
             # Handle rate limiting and other request failures
             error_msg = str(e)
             if "429" in error_msg or "too many requests" in error_msg.lower():
                 print(f"      ⚠️  Rate limit reached")
                 logging.warning(f"Too many requests for video {video_id}. Rate limit reached.")
-                video_data["Status"] = "FAILED"
-                video_data["stop_processing"] = True
-            elif "blocking requests from your IP" in error_msg or "IP" in error_msg:
+                resilience.breaker("transcripts").trip("rate limited by YouTube")
+                return self._defer_video(video, video_data, channel_username, transcripts_folder)
+            elif isinstance(e, RequestBlocked) or "blocking requests from your IP" in error_msg or "IP" in error_msg:
                 print(f"      ❌ Error: YouTube is blocking requests from your IP")
                 print(f"      💡 Tip: Wait 24-48 hours, or increase delay_between_videos in config.yaml")
                 logging.warning(f"IP blocked for video {video_id}: {error_msg}")
-                video_data["Status"] = "FAILED"
-                video_data["stop_processing"] = True
+                resilience.breaker("transcripts").trip("requests blocked by YouTube")
+                return self._defer_video(video, video_data, channel_username, transcripts_folder)
             else:
                 print(f"      ❌ YouTube request failed: {error_msg}")
                 logging.warning(f"YouTube request failed for video {video_id}: {error_msg}")
@@ -214,22 +669,34 @@ class YouTubeProcessor:
         # Save to CSV
         csv_data = {
             k: v for k, v in video_data.items()
-            if k in ["Video URL", "Video ID", "Upload Date", "Scrape Date", "Status"]
+            if k in CSV_COLUMNS
         }
-        append_to_csv(csv_path, [csv_data])
+        with self._lock:
+            append_to_csv(csv_path, [csv_data])
 
         return video_data
 
-    def _is_already_processed(self, csv_path, video_id):
-        """Check if video has already been successfully processed"""
-        if not csv_path.exists():
-            return False
+    def _exact_date_suffix(self, video_id, fallback):
+        """Publish date from the watch page, or fallback if it cannot be read"""
+        try:
+            return self.publish_dates.get(video_id) or fallback
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            logging.warning(f"Could not resolve publish date for video {video_id}: {e}")
+            return fallback
+
+    def _defer_video(self, video, video_data, channel_username, transcripts_folder):
+        """Keep a video for retry_deferred(); deferred videos are not written to the CSV"""
+        self.deferred_videos.append((video, video_data, channel_username, transcripts_folder.parent))
+        video_data["Status"] = "DEFERRED"
+        logging.info(f"Deferred transcript for video {video_data['Video ID']} ({channel_username})")
+        return video_data
 
-        existing_data = pd.read_csv(csv_path)
-        if video_id in existing_data["Video ID"].values:
-            existing_row = existing_data[existing_data["Video ID"] == video_id].iloc[0]
-            # Only skip if successfully processed - retry failed ones
-            if existing_row["Status"] == "SUCCESS":
-                return True
+    def _load_processed_ids(self, csv_path):
+        """Load the IDs of videos already processed successfully (failed ones are retried)"""
+        if not csv_path.exists():
+            return set()
 
-        return False
+        with open(csv_path, "r", encoding="utf-8", newline="") as f:
+            return {row["Video ID"] for row in csv.DictReader(f) if row.get("Status") == "SUCCESS"}
@@ -0,0 +1,5 @@
+# ABOUTME: Shared pytest setup: makes the project root importable as in `python main.py`
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,127 @@
+# ABOUTME: ArtifactStore direct mode: uploads from memory, local fallback and reads back from Drive
+import hashlib
+from types import SimpleNamespace
+
+import pytest
+
+from src.artifact_store import ArtifactStore
+from src.journal import RunJournal
+
+
+def make_config(direct=True, local_copy=False):
+    return SimpleNamespace(
+        drive_direct_upload=direct,
+        drive_local_copy=local_copy,
+        drive_base_folder="Base",
+        drive_audio_folder="Audio",
+    )
+
+
+class FakeDrive:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.files = {}
+        self.folders = []
+
+    def get_or_create_folder(self, name, parent_folder_id=None):
+        self.folders.append((name, parent_folder_id))
+        return f"{parent_folder_id}/{name}" if parent_folder_id else name
+
+    def upload_bytes(self, data, name, folder_id, mimetype=None):
+        if self.fail:
+            raise ConnectionError("drive down")
+        file_id = f"id-{len(self.files)}"
+        self.files[file_id] = (f"{folder_id}/{name}", data, mimetype)
+        return file_id
+
+    def download_bytes(self, file_id):
+        return self.files[file_id][1]
+
+
+@pytest.fixture
+def channel(tmp_path):
+    for subfolder in ("Summaries", "Audio"):
+        (tmp_path / subfolder).mkdir()
+    return tmp_path
+
+
+def test_direct_upload_journals_remote_artifact(channel):
+    drive = FakeDrive()
+    store = ArtifactStore()
+    store.configure(make_config(), drive)
+    journal = RunJournal(channel)
+    path = channel / "Summaries" / "talk_summary.txt"
+
+    checksum = store.save("summary", path, "a summary", journal, "My Channel", video_id="vid")
+
+    assert checksum == hashlib.sha256(b"a summary").hexdigest()
+    assert not path.exists()
+    [(file_id, (remote_path, data, mimetype))] = drive.files.items()
+    assert remote_path == "Base/My_Channel/Summaries/talk_summary.txt"
+    assert (data, mimetype) == (b"a summary", "text/plain")
+    assert journal.is_complete(path)
+    assert journal.remote_file_id(path) == file_id
+    assert journal.size(path) == len(b"a summary")
+    assert store.uploaded == 1
+
+    # Folder IDs are looked up once per channel subfolder
+    store.save("summary", channel / "Summaries" / "other_summary.txt", "b", journal, "My Channel", video_id="v2")
+    assert len(drive.folders) == 3
+
+
+def test_audio_uses_its_codec_mimetype_and_optional_local_copy(channel):
+    drive = FakeDrive()
+    store = ArtifactStore()
+    store.configure(make_config(local_copy=True), drive)
+    journal = RunJournal(channel)
+    path = channel / "Audio" / "talk.ogg"
+
+    store.save("audio", path, b"OggS", journal, "chan", video_id="vid")
+
+    assert path.read_bytes() == b"OggS"
+    [(_, _, mimetype)] = drive.files.values()
+    assert mimetype == "audio/ogg"
+    assert journal.remote_file_id(path)
+
+
+def test_failed_upload_falls_back_to_local_file(channel):
+    store = ArtifactStore()
+    store.configure(make_config(), FakeDrive(fail=True))
+    journal = RunJournal(channel)
+    path = channel / "Summaries" / "talk_summary.txt"
+
+    store.save("summary", path, "a summary", journal, "chan", video_id="vid")
+
+    assert path.read_text(encoding="utf-8") == "a summary"
+    assert journal.is_complete(path)
+    assert journal.remote_file_id(path) is None  # goes out with the channel upload
+    assert journal.verify(path)
+    assert (store.uploaded, store.fallbacks) == (0, 1)
+
+
+def test_without_direct_mode_artifacts_are_written_locally(channel):
+    drive = FakeDrive()
+    store = ArtifactStore()
+    store.configure(make_config(direct=False), drive)
+    journal = RunJournal(channel)
+    path = channel / "Summaries" / "talk_summary.txt"
+
+    store.save("summary", path, "a summary", journal, "chan")
+
+    assert path.exists() and drive.files == {}
+
+
+def test_read_text_prefers_disk_then_drive(channel):
+    drive = FakeDrive()
+    store = ArtifactStore()
+    store.configure(make_config(), drive)
+    journal = RunJournal(channel)
+    remote = channel / "Summaries" / "remote_summary.txt"
+    store.save("summary", remote, "from drive", journal, "chan", video_id="vid")
+    local = channel / "Summaries" / "local_summary.txt"
+    local.write_text("from disk", encoding="utf-8")
+
+    assert store.read_text(remote, journal) == "from drive"
+    assert store.read_text(local, journal) == "from disk"
+    with pytest.raises(FileNotFoundError):
+        store.read_text(channel / "Summaries" / "missing_summary.txt", journal)
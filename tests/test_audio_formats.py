@@ -0,0 +1,73 @@
+# ABOUTME: Audio extension and mimetype selection per encoding, and joining of synthesized chunks
+import struct
+
+import pytest
+
+from src.audio_formats import (
+    audio_extension,
+    audio_mimetype,
+    join_audio,
+    rewrap_wav,
+    wav_duration,
+    wav_sample_rate,
+)
+
+
+def wav(samples, sample_rate=16000, data_size=None):
+    """Mono 16-bit PCM WAV; data_size overrides the header (streamed output writes placeholders)"""
+    fmt = struct.pack("<HHIIHH", 1, 1, sample_rate, sample_rate * 2, 2, 16)
+    size = len(samples) if data_size is None else data_size
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt + b"data" + struct.pack("<I", size) + samples
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+@pytest.mark.parametrize("encoding, extension, mimetype", [
+    ("MP3", ".mp3", "audio/mpeg"),
+    ("OGG_OPUS", ".ogg", "audio/ogg"),
+    ("LINEAR16", ".wav", "audio/wav"),
+    ("MULAW", ".wav", "audio/wav"),
+    ("ALAW", ".wav", "audio/wav"),
+])
+def test_extension_and_mimetype_follow_the_encoding(encoding, extension, mimetype):
+    assert audio_extension(encoding) == extension
+    assert audio_mimetype(f"Audio/Talk_20260101{extension}") == mimetype
+
+
+def test_unknown_encoding_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported audio encoding"):
+        audio_extension("FLAC")
+
+
+def test_unknown_extension_uploads_as_binary():
+    assert audio_mimetype("Talk.aiff") == "application/octet-stream"
+    assert audio_mimetype("Talk.MP3") == "audio/mpeg"
+
+
+def test_compressed_chunks_are_concatenated():
+    assert join_audio("MP3", [b"frame1", b"frame2"]) == b"frame1frame2"
+    assert join_audio("OGG_OPUS", [b"page1", b"page2"]) == b"page1page2"
+
+
+def test_wav_chunks_share_one_header():
+    joined = join_audio("LINEAR16", [wav(b"\x01\x00" * 8000), wav(b"\x02\x00" * 8000)])
+    assert joined.count(b"RIFF") == 1
+    assert wav_sample_rate(joined) == 16000
+    assert wav_duration(joined) == pytest.approx(1.0)
+
+
+def test_single_chunk_is_returned_untouched():
+    chunk = wav(b"\x00\x00" * 10)
+    assert join_audio("LINEAR16", [chunk]) is chunk
+
+
+def test_rewrap_fixes_placeholder_sizes():
+    samples = b"\x03\x00" * 100
+    fixed = rewrap_wav(wav(samples, data_size=0xFFFFFFFF))
+    assert struct.unpack_from("<I", fixed, 40)[0] == len(samples)
+    assert struct.unpack_from("<I", fixed, 4)[0] == len(fixed) - 8
+    assert wav_duration(fixed) == pytest.approx(len(samples) / 32000)
+
+
+def test_non_wav_data_is_rejected():
+    with pytest.raises(ValueError, match="Not a WAV file"):
+        wav_duration(b"ID3 mp3 data")
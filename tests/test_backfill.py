@@ -0,0 +1,132 @@
+# ABOUTME: Backfill date windows against relative listing labels, and shard checkpoints
+import json
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.backfill import BackfillPlan, BackfillShard, BackfillWindow
+from src.youtube_processor import YouTubeProcessor
+
+LISTED_AT = datetime(2026, 6, 1, 12, 0)
+
+
+def calendar_label(published, listed_at):
+    """The label YouTube shows: whole calendar years, else months, else days"""
+    today = listed_at.date()
+    months = (today.year - published.year) * 12 + today.month - published.month
+    if today.day < published.day:
+        months -= 1
+    if months >= 12:
+        return f"{months // 12} years ago"
+    if months >= 1:
+        return f"{months} months ago"
+    return f"{(today - published).days} days ago"
+
+
+def test_contains_checks_both_ends():
+    window = BackfillWindow(date(2024, 1, 1), date(2024, 12, 31))
+    assert window.contains("20240101")
+    assert window.contains("20241231")
+    assert not window.contains("20231231")
+    assert not window.contains("20250101")
+    assert BackfillWindow().contains("19990101")
+
+
+@pytest.mark.parametrize(
+    "published, listed_at",
+    [
+        (date(2026, 6, 1), LISTED_AT),  # same day
+        (date(2026, 5, 31), LISTED_AT),  # yesterday
+        (date(2026, 5, 2), LISTED_AT),  # last day before "1 month"
+        (date(2026, 5, 1), LISTED_AT),  # exactly one month
+        (date(2026, 1, 31), datetime(2026, 3, 1, 12, 0)),  # one month after a 31-day month
+        (date(2026, 2, 28), datetime(2026, 3, 28, 12, 0)),  # one month of February
+        (date(2025, 6, 2), LISTED_AT),  # last day before "1 year"
+        (date(2025, 6, 1), LISTED_AT),  # exactly one year
+        (date(2024, 6, 2), LISTED_AT),  # last day before "2 years"
+        (date(2025, 12, 31), datetime(2026, 1, 1, 0, 30)),  # across new year
+        (date(2024, 2, 29), datetime(2024, 3, 1, 12, 0)),  # leap day, next day
+        (date(2024, 2, 28), datetime(2024, 3, 1, 12, 0)),  # across a leap day
+        (date(2024, 2, 29), datetime(2025, 2, 28, 12, 0)),  # leap day, last day before "1 year"
+        (date(2024, 2, 29), datetime(2025, 3, 1, 12, 0)),  # leap day, one year on
+        (date(2023, 3, 1), datetime(2024, 3, 1, 12, 0)),  # a year containing a leap day
+    ],
+)
+def test_may_contain_never_rules_out_the_true_date(published, listed_at):
+    window = BackfillWindow(published, published)
+    assert window.may_contain(calendar_label(published, listed_at), listed_at)
+
+
+def test_may_contain_rules_out_distant_windows():
+    label = "2 years ago"
+    assert not BackfillWindow(since=date(2025, 1, 1)).may_contain(label, LISTED_AT)
+    assert not BackfillWindow(until=date(2023, 1, 1)).may_contain(label, LISTED_AT)
+    assert BackfillWindow(date(2023, 6, 1), date(2024, 6, 1)).may_contain(label, LISTED_AT)
+
+
+def test_may_contain_keeps_unparseable_labels():
+    assert BackfillWindow(since=date(2025, 1, 1)).may_contain("", LISTED_AT)
+
+
+def test_shard_checkpoint_survives_reload(tmp_path):
+    videos = [{"video_id": f"v{i}", "title": f"t{i}", "published": "1 year ago"} for i in range(3)]
+    path = tmp_path / "shard_0000.json"
+    shard = BackfillShard(0, videos, path)
+    shard.mark("v1")
+
+    resumed = BackfillShard(0, videos, path)
+    assert [video["video_id"] for video in resumed.pending()] == ["v0", "v2"]
+    assert not resumed.complete
+    resumed.mark("v0")
+    resumed.mark("v2")
+    assert BackfillShard(0, videos, path).complete
+
+
+def test_plan_reuses_saved_listing_and_shard_size(tmp_path):
+    videos = [{"video_id": f"v{i}", "title": f"t{i}", "published": "1 year ago"} for i in range(5)]
+    plan = BackfillPlan.load_or_create(tmp_path, lambda: videos, shard_size=2)
+    assert [len(shard.videos) for shard in plan.shards] == [2, 2, 1]
+
+    def relisted():
+        raise AssertionError("listing should come from the manifest")
+
+    resumed = BackfillPlan.load_or_create(tmp_path, relisted, shard_size=3)
+    assert [len(shard.videos) for shard in resumed.shards] == [2, 2, 1]
+    assert resumed.listed_at == plan.listed_at
+    assert json.loads((tmp_path / "manifest.json").read_text())["shard_size"] == 2
+
+
+class FixedDates:
+    def __init__(self, date_suffix):
+        self.date_suffix = date_suffix
+
+    def get(self, video_id):
+        return self.date_suffix
+
+    def save(self):
+        pass
+
+
+@pytest.mark.parametrize("exact_age, scanned", [(2, True), (9, False)])
+def test_exact_publish_date_decides_days_back(tmp_path, monkeypatch, exact_age, scanned):
+    config = SimpleNamespace(
+        feed_check_enabled=False,
+        exact_publish_dates=False,
+        delay_between_videos=0,
+        days_back=3,
+        skip_keywords=[],
+    )
+    processor = YouTubeProcessor(config)
+    # The label says "2 days ago"; the watch page's date is what counts
+    processor.publish_dates = FixedDates((datetime.now() - timedelta(days=exact_age)).strftime("%Y%m%d"))
+    extracted = []
+    monkeypatch.setattr(processor, "_extract_transcript", lambda video, data, *args: extracted.append(data) or data)
+    video = {
+        "videoId": "abc",
+        "title": {"runs": [{"text": "Talk"}]},
+        "publishedTimeText": {"simpleText": "2 days ago"},
+    }
+    result = processor._process_video(video, tmp_path, tmp_path / "channel_data.csv", "chan")
+    assert bool(extracted) == scanned
+    assert result.get("stop_processing", False) != scanned
@@ -0,0 +1,91 @@
+# ABOUTME: RunBudget ordering by channel priority and recency, limits, and work carried to the next run
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.budget import RunBudget
+
+
+def make_budget(max_tokens=None, max_tts_chars=None, max_drive_mb=None, priority=None):
+    return RunBudget(SimpleNamespace(
+        budget_max_tokens=max_tokens,
+        budget_max_tts_chars=max_tts_chars,
+        budget_max_drive_mb=max_drive_mb,
+        budget_channel_priority=priority or {},
+        tts_audio_encoding="MP3",
+        local_summary_threshold_chars=0,
+        max_tokens=500,
+    ))
+
+
+def spend(tokens=100, tts_chars=10, drive_bytes=10):
+    return {"tokens": tokens, "tts_chars": tts_chars, "drive_bytes": drive_bytes}
+
+
+def add(budget, channel, video_id, date_suffix, estimate=None, artifacts=()):
+    record = {"video_id": video_id, "transcript_path": Path(f"{channel}/{video_id}.txt")}
+    budget.add_candidate(channel, record, date_suffix, estimate or spend(), artifacts=artifacts)
+
+
+def scheduled_ids(scheduled):
+    return {channel: [record["video_id"] for record in records] for channel, records in scheduled.items()}
+
+
+def test_priority_channels_first_then_newest():
+    budget = make_budget(priority={"news": 2})
+    add(budget, "hobby", "h_old", "20260101")
+    add(budget, "news", "n_old", "20251201")
+    add(budget, "hobby", "h_new", "20260301")
+    add(budget, "news", "n_new", "20260201")
+    scheduled = budget.plan()
+    assert list(scheduled) == ["news", "hobby"]
+    assert scheduled_ids(scheduled) == {"news": ["n_new", "n_old"], "hobby": ["h_new", "h_old"]}
+
+
+def test_limit_defers_what_does_not_fit():
+    budget = make_budget(max_tokens=250)
+    add(budget, "chan", "newest", "20260303", spend(tokens=100))
+    add(budget, "chan", "large", "20260302", spend(tokens=200))
+    add(budget, "chan", "small", "20260301", spend(tokens=100))
+    scheduled = budget.plan()
+    # "large" would exceed the limit; the older, smaller video still fits after it
+    assert scheduled_ids(scheduled) == {"chan": ["newest", "small"]}
+    assert [candidate["record"]["video_id"] for candidate in budget.deferred] == ["large"]
+    assert budget.estimated["tokens"] == 200
+
+
+@pytest.mark.parametrize("limits, estimate", [
+    ({"max_tts_chars": 15}, spend(tts_chars=10)),
+    ({"max_drive_mb": 1}, spend(drive_bytes=600 * 1024)),
+])
+def test_every_limit_is_enforced(limits, estimate):
+    budget = make_budget(**limits)
+    add(budget, "chan", "first", "20260302", estimate)
+    add(budget, "chan", "second", "20260301", estimate)
+    assert scheduled_ids(budget.plan()) == {"chan": ["first"]}
+
+
+def test_deferred_work_stays_on_disk_for_the_next_run():
+    budget = make_budget(max_tokens=100)
+    add(budget, "chan", "now", "20260302", artifacts=(Path("chan/now_summary.txt"),))
+    add(budget, "chan", "later", "20260301", artifacts=(Path("chan/later_summary.txt"), Path("chan/later.mp3")))
+    budget.plan()
+    assert budget.deferred_paths() == {
+        Path("chan/later.txt"), Path("chan/later_summary.txt"), Path("chan/later.mp3"),
+    }
+
+    # The next run sees the leftover again, alongside anything new
+    next_run = make_budget(max_tokens=100)
+    for candidate in budget.deferred:
+        add(next_run, "chan", candidate["record"]["video_id"], candidate["date"])
+    assert scheduled_ids(next_run.plan()) == {"chan": ["later"]}
+
+
+def test_existing_summary_only_costs_audio_and_upload():
+    budget = make_budget()
+    fresh = budget.estimate(4000)
+    resumed = budget.estimate(4000, summary_chars=800)
+    assert fresh["tokens"] > 0
+    assert resumed["tokens"] == 0
+    assert resumed["tts_chars"] == 800
@@ -0,0 +1,84 @@
+# ABOUTME: MinHash/LSH near-duplicate lookups and persistence of the dedup index
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.dedup import DuplicateDetector
+
+TALK = (
+    "today we look at how the new scheduler decides which task runs next on each core "
+    "and why the old heuristics wasted so much time waiting on locks that were already free "
+    "we then measure the change on a build server and on a laptop running a browser and a game"
+)
+
+
+@pytest.fixture
+def config(tmp_path):
+    return SimpleNamespace(
+        dedup_index_path=str(tmp_path / "dedup_index.json"),
+        dedup_threshold=0.8,
+        dedup_shingle_size=3,
+        dedup_num_perm=128,
+        dedup_bands=32,
+    )
+
+
+def index(detector, video_id, text):
+    detector.add(video_id, detector.signature(text), channel="chan", title=video_id)
+
+
+def test_reupload_is_found(config):
+    detector = DuplicateDetector(config)
+    index(detector, "original", TALK)
+    # Same talk with a different intro line, as re-uploads usually have
+    match = detector.find_duplicate(detector.signature("welcome back everyone " + TALK))
+    assert match is not None
+    entry, similarity = match
+    assert entry["video_id"] == "original"
+    assert similarity >= 0.8
+
+
+def test_distinct_transcripts_are_not_linked(config):
+    detector = DuplicateDetector(config)
+    index(detector, "original", TALK)
+    other = "a recipe for sourdough bread with a long cold proof and a very hot oven for a crisp crust"
+    assert detector.find_duplicate(detector.signature(other)) is None
+    assert not detector.is_duplicate(detector.signature(TALK), detector.signature(other))
+
+
+def test_video_is_not_its_own_duplicate(config):
+    detector = DuplicateDetector(config)
+    index(detector, "original", TALK)
+    assert detector.find_duplicate(detector.signature(TALK), exclude_video_id="original") is None
+
+
+def test_index_is_written_on_save_and_reloaded(config):
+    detector = DuplicateDetector(config)
+    index(detector, "original", TALK)
+    reloaded = DuplicateDetector(config)
+    assert reloaded.entries == {}
+
+    detector.save()
+    reloaded = DuplicateDetector(config)
+    entry, _ = reloaded.find_duplicate(reloaded.signature(TALK))
+    assert entry["video_id"] == "original"
+
+
+def test_index_with_other_settings_is_not_reused(config):
+    detector = DuplicateDetector(config)
+    index(detector, "original", TALK)
+    detector.save()
+    config.dedup_shingle_size = 4
+    assert DuplicateDetector(config).entries == {}
+
+
+def test_unreadable_index_starts_empty(config, tmp_path):
+    (tmp_path / "dedup_index.json").write_text("{not json", encoding="utf-8")
+    detector = DuplicateDetector(config)
+    assert detector.entries == {}
+    index(detector, "original", TALK)
+    detector.save()
+    assert [entry["video_id"] for entry in json.loads((tmp_path / "dedup_index.json").read_text())["entries"]] == [
+        "original"
+    ]
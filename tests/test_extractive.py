@@ -0,0 +1,56 @@
+# ABOUTME: Local TextRank summarizer: ranking, ordering, length limits and degenerate input
+from src.extractive import ExtractiveSummarizer
+
+TOPIC = [
+    "Rust ownership rules prevent data races in concurrent programs.",
+    "The borrow checker enforces ownership rules for every reference in concurrent code.",
+    "Ownership and borrowing make concurrent Rust programs free of data races.",
+    "References obey the borrow checker and ownership rules at compile time.",
+]
+OFF_TOPIC = [
+    "My cat likes sleeping on the windowsill.",
+    "Thanks to our sponsor for supporting the channel.",
+]
+
+
+def test_central_sentences_win():
+    text = " ".join([OFF_TOPIC[0], *TOPIC, OFF_TOPIC[1]])
+    summary = ExtractiveSummarizer(max_sentences=3).summarize(text)
+    assert all(sentence not in summary for sentence in OFF_TOPIC)
+    assert sum(sentence in summary for sentence in TOPIC) == 3
+
+
+def test_sentences_keep_transcript_order():
+    sentences = [f"Sentence {i} talks about databases and indexes number {i}." for i in range(30)]
+    summary = ExtractiveSummarizer(max_sentences=5).summarize(" ".join(sentences))
+    positions = [summary.index(sentence) for sentence in sentences if sentence in summary]
+    assert len(positions) == 5
+    assert positions == sorted(positions)
+
+
+def test_length_limits():
+    sentences = [f"Point {i} is about caching layers and cache {i} eviction." for i in range(100)]
+    text = " ".join(sentences)
+    assert summary_count(ExtractiveSummarizer(max_sentences=8).summarize(text), sentences) == 8
+    # ratio caps short inputs: 20% of 20 sentences
+    assert summary_count(ExtractiveSummarizer(max_sentences=8).summarize(" ".join(sentences[:20])), sentences) == 4
+    # never fewer than three
+    assert summary_count(ExtractiveSummarizer(max_sentences=8).summarize(" ".join(sentences[:5])), sentences) == 3
+
+
+def summary_count(summary, sentences):
+    return sum(sentence in summary for sentence in sentences)
+
+
+def test_unpunctuated_captions_are_windowed():
+    words = " ".join(f"word{i % 40}" for i in range(2000))
+    summary = ExtractiveSummarizer(max_sentences=4).summarize(words)
+    assert 0 < len(summary.split()) <= 4 * 25
+
+
+def test_empty_and_short_input():
+    summarizer = ExtractiveSummarizer()
+    assert summarizer.summarize("") == ""
+    assert summarizer.summarize("   \n ") == ""
+    assert summarizer.summarize("Only one sentence here.") == "Only one sentence here."
+    assert summarizer.summarize("First one.  Second\none.") == "First one. Second one."
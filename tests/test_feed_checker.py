@@ -0,0 +1,184 @@
+# ABOUTME: FeedChecker against a local HTTP stand-in for YouTube's channel page and Atom feed
+import threading
+from types import SimpleNamespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.feed_checker import FeedChecker
+
+CHANNEL_ID = "UC" + "a" * 22
+ETAG = '"v1"'
+LAST_MODIFIED = "Mon, 05 Jan 2026 10:00:00 GMT"
+
+
+def atom_feed(video_ids):
+    entries = "".join(f"<entry><yt:videoId>{vid}</yt:videoId></entry>" for vid in video_ids)
+    return (
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:yt="http://www.youtube.com/xml/schemas/2015">'
+        f"{entries}</feed>"
+    ).encode("utf-8")
+
+
+class FeedServer:
+    """Serves /@<handle> (channel page) and /feed (Atom, honouring If-None-Match or If-Modified-Since)"""
+
+    def __init__(self):
+        self.video_ids = ["vid1", "vid2"]
+        self.etag = ETAG
+        self.last_modified = None
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append((self.path, dict(self.headers)))
+                if self.path.startswith("/@"):
+                    body = f'<script>{{"externalId":"{CHANNEL_ID}"}}</script>'.encode("utf-8")
+                    self.send_response(200)
+                elif (server.etag and self.headers.get("If-None-Match") == server.etag) or (
+                    server.last_modified and self.headers.get("If-Modified-Since") == server.last_modified
+                ):
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                else:
+                    body = atom_feed(server.video_ids)
+                    self.send_response(200)
+                    if server.etag:
+                        self.send_header("ETag", server.etag)
+                    if server.last_modified:
+                        self.send_header("Last-Modified", server.last_modified)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def feed_requests(self):
+        return [headers for path, headers in self.requests if path.startswith("/feed")]
+
+
+@pytest.fixture
+def server():
+    server = FeedServer()
+    yield server
+    server.httpd.shutdown()
+
+
+@pytest.fixture
+def config(server):
+    return SimpleNamespace(
+        feed_url=server.url + "/feed?channel_id={channel_id}",
+        feed_channel_url=server.url + "/@{username}",
+        feed_timeout=5,
+        feed_seen_history=200,
+    )
+
+
+@pytest.fixture
+def checker(config, tmp_path):
+    return FeedChecker(config, state_file=tmp_path / "feed_state.json")
+
+
+def test_unseen_videos_trigger_scrape_until_marked_seen(checker, server):
+    assert checker.has_new_videos("handle")
+    # Not committed until the scrape succeeds, so the next check still sends no validators
+    assert checker.has_new_videos("handle")
+    assert "If-None-Match" not in server.feed_requests()[-1]
+
+    checker.mark_seen("handle")
+    assert not checker.has_new_videos("handle")
+    assert server.feed_requests()[-1].get("If-None-Match") == ETAG
+    assert checker.state["handle"]["channel_id"] == CHANNEL_ID
+
+
+def test_new_upload_is_detected(checker, server):
+    checker.has_new_videos("handle")
+    checker.mark_seen("handle")
+
+    server.video_ids = ["vid3", "vid1", "vid2"]
+    # A changed feed arrives with a different validator
+    checker.state["handle"]["etag"] = '"stale"'
+    assert checker.has_new_videos("handle")
+
+
+def test_failed_videos_are_retried_on_next_check(checker, server):
+    checker.has_new_videos("handle")
+    checker.mark_seen("handle", failed_ids=["vid2"])
+
+    assert "vid2" not in checker.state["handle"]["seen_ids"]
+    # Validators were dropped, so no 304 can hide the failed video
+    assert checker.has_new_videos("handle")
+    assert "If-None-Match" not in server.feed_requests()[-1]
+
+    checker.mark_seen("handle")
+    assert not checker.has_new_videos("handle")
+
+
+def test_unreachable_feed_falls_back_to_scrape(checker, server):
+    checker.config.feed_url = "http://127.0.0.1:1/feed?channel_id={channel_id}"
+    assert checker.has_new_videos(CHANNEL_ID)
+
+
+def test_not_modified_feed_skips_the_scrape_after_a_restart(checker, config, server, tmp_path):
+    checker.has_new_videos("handle")
+    checker.mark_seen("handle")
+
+    restarted = FeedChecker(config, state_file=tmp_path / "feed_state.json")
+    assert not restarted.has_new_videos("handle")
+    # The channel ID came from the saved state, so only the feed was requested
+    assert [path for path, _ in server.requests].count("/@handle") == 1
+    assert server.feed_requests()[-1].get("If-None-Match") == ETAG
+
+
+def test_last_modified_is_sent_back(checker, server):
+    server.etag = None
+    server.last_modified = LAST_MODIFIED
+    checker.has_new_videos("handle")
+    checker.mark_seen("handle")
+
+    assert not checker.has_new_videos("handle")
+    headers = server.feed_requests()[-1]
+    assert headers.get("If-Modified-Since") == LAST_MODIFIED
+    assert "If-None-Match" not in headers
+
+
+def test_changed_feed_without_unseen_videos_commits_new_validators(checker, server):
+    checker.has_new_videos("handle")
+    checker.mark_seen("handle")
+
+    # Feed reordered (e.g. a video was re-published), but every ID was seen before
+    server.video_ids = ["vid2", "vid1"]
+    server.etag = '"v2"'
+    assert not checker.has_new_videos("handle")
+    assert checker.state["handle"]["etag"] == '"v2"'
+    assert not checker.has_new_videos("handle")
+    assert server.feed_requests()[-1].get("If-None-Match") == '"v2"'
+
+
+def test_only_unseen_ids_count_as_new(checker, server):
+    checker.has_new_videos("handle")
+    checker.mark_seen("handle")
+
+    # vid1 dropped off the feed; a new upload pushes in
+    server.video_ids = ["vid3", "vid2"]
+    server.etag = '"v2"'
+    assert checker.has_new_videos("handle")
+    checker.mark_seen("handle")
+    assert checker.state["handle"]["seen_ids"] == ["vid3", "vid2", "vid1"]
+
+
+def test_seen_history_is_bounded(checker, server):
+    checker.config.feed_seen_history = 3
+    for generation in range(3):
+        server.video_ids = [f"g{generation}a", f"g{generation}b"]
+        server.etag = f'"g{generation}"'
+        assert checker.has_new_videos("handle")
+        checker.mark_seen("handle")
+    assert checker.state["handle"]["seen_ids"] == ["g2a", "g2b", "g1a"]
@@ -0,0 +1,155 @@
+# ABOUTME: RunJournal trust rules for artifacts and recovery of interrupted stages
+import json
+
+import pytest
+
+from src.journal import JOURNAL_FILE, RunJournal
+from src.utils import atomic_write
+
+
+@pytest.fixture
+def folder(tmp_path):
+    (tmp_path / "Summaries").mkdir()
+    return tmp_path
+
+
+def save(journal, path, text):
+    journal.start("summary", path)
+    checksum = atomic_write(path, text)
+    journal.complete("summary", path, checksum)
+
+
+def test_done_artifact_is_trusted_while_size_matches(folder):
+    journal = RunJournal(folder)
+    path = folder / "Summaries" / "a.txt"
+    save(journal, path, "summary text")
+    assert journal.is_complete(path)
+    assert journal.verify(path)
+
+    path.write_text("truncated", encoding="utf-8")
+    assert not journal.is_complete(path)
+
+
+def test_started_artifact_is_incomplete(folder):
+    journal = RunJournal(folder)
+    path = folder / "Summaries" / "a.txt"
+    journal.start("summary", path)
+    path.write_text("partial", encoding="utf-8")
+    assert not journal.is_complete(path)
+
+
+def test_unjournaled_artifact_is_trusted_if_present(folder):
+    journal = RunJournal(folder)
+    path = folder / "Summaries" / "legacy.txt"
+    assert not journal.is_complete(path)
+    path.write_text("from an older version", encoding="utf-8")
+    assert journal.is_complete(path)
+
+
+def test_remote_artifact_is_complete_without_local_file(folder):
+    (folder / "Transcripts").mkdir()
+    transcript = folder / "Transcripts" / "direct.txt"
+    journal = RunJournal(folder)
+    transcript.write_text("transcript", encoding="utf-8")
+    journal.complete("transcript", transcript, video_id="vid")
+    path = folder / "Summaries" / "direct_summary.txt"
+    journal.complete("summary", path, "abc", remote=True, drive_file_id="file-1", size=42, video_id="vid")
+    assert journal.is_complete(path)
+    assert journal.size(path) == 42
+    assert journal.remote_file_id(path) == "file-1"
+
+    # Kept while the video's transcript is still waiting on disk
+    reloaded = RunJournal(folder)
+    assert reloaded.is_complete(path)
+    assert reloaded.remote_file_id(path) == "file-1"
+
+
+def test_remote_entries_are_pruned_once_the_video_is_done(folder):
+    (folder / "Transcripts").mkdir()
+    journal = RunJournal(folder)
+    for video_id in ("done", "waiting"):
+        transcript = folder / "Transcripts" / f"{video_id}.txt"
+        transcript.write_text("transcript", encoding="utf-8")
+        journal.complete("transcript", transcript, video_id=video_id)
+        journal.complete(
+            "summary", folder / "Summaries" / f"{video_id}_summary.txt", "abc",
+            remote=True, drive_file_id=f"id-{video_id}", size=3, video_id=video_id,
+        )
+    copy = folder / "Summaries" / "copy_summary.txt"
+    checksum = atomic_write(copy, "abc")
+    journal.complete("summary", copy, checksum, remote=True, drive_file_id="id-copy", size=3, video_id="copy")
+    (folder / "Transcripts" / "done.txt").unlink()  # uploaded with the channel
+
+    reloaded = RunJournal(folder)
+    assert reloaded.remote_file_id(folder / "Summaries" / "done_summary.txt") is None
+    assert reloaded.remote_file_id(folder / "Summaries" / "waiting_summary.txt") == "id-waiting"
+    # A local copy of a direct upload keeps its entry, so it is not uploaded again
+    assert reloaded.remote_file_id(copy) == "id-copy"
+    lines = (folder / JOURNAL_FILE).read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3
+
+
+def test_restart_removes_partial_artifacts_and_temp_files(folder):
+    journal = RunJournal(folder)
+    done = folder / "Summaries" / "done.txt"
+    partial = folder / "Summaries" / "partial.txt"
+    save(journal, done, "finished")
+    journal.start("summary", partial)
+    partial.write_text("half", encoding="utf-8")
+    stale_tmp = folder / "Summaries" / ".partial.txt.123.tmp"
+    stale_tmp.write_text("half", encoding="utf-8")
+
+    resumed = RunJournal(folder)
+    assert not partial.exists()
+    assert not stale_tmp.exists()
+    assert [entry["artifact"] for entry in resumed.unfinished()] == ["Summaries/partial.txt"]
+    assert resumed.is_complete(done)
+    assert not resumed.is_complete(partial)
+
+
+def test_restart_compacts_and_ignores_torn_last_line(folder):
+    journal = RunJournal(folder)
+    kept = folder / "Summaries" / "kept.txt"
+    uploaded = folder / "Summaries" / "uploaded.txt"
+    save(journal, kept, "one")
+    save(journal, kept, "one again")
+    save(journal, uploaded, "two")
+    uploaded.unlink()  # uploaded to Drive and removed locally
+    with open(folder / JOURNAL_FILE, "a", encoding="utf-8") as f:
+        f.write('{"event": "do')
+
+    resumed = RunJournal(folder)
+    assert resumed.is_complete(kept)
+    lines = (folder / JOURNAL_FILE).read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["artifact"] for line in lines] == ["Summaries/kept.txt"]
+
+
+def test_for_folder_shares_one_journal(folder):
+    RunJournal._instances.clear()
+    try:
+        assert RunJournal.for_folder(folder) is RunJournal.for_folder(folder / ".")
+    finally:
+        RunJournal._instances.clear()
+
+
+def test_changed_artifact_is_redone_on_reload(folder):
+    journal = RunJournal(folder)
+    path = folder / "Summaries" / "a.txt"
+    save(journal, path, "summary text")
+    # Same size, different bytes: the size check alone would trust it
+    path.write_text("summary tent", encoding="utf-8")
+    assert journal.is_complete(path)
+
+    reloaded = RunJournal(folder)
+    assert not reloaded.is_complete(path)
+    assert not path.exists()
+    assert [entry["artifact"] for entry in reloaded.unfinished()] == ["Summaries/a.txt"]
+
+
+def test_intact_artifact_survives_reload(folder):
+    journal = RunJournal(folder)
+    path = folder / "Summaries" / "a.txt"
+    save(journal, path, "summary text")
+    reloaded = RunJournal(folder)
+    assert reloaded.is_complete(path)
+    assert reloaded.unfinished() == []
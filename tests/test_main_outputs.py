@@ -0,0 +1,180 @@
+# ABOUTME: Summary and audio stages of main: videos hit by an upstream outage are kept and retried
+import csv
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+import main
+from src.artifact_store import artifacts
+from src.dedup import DuplicateDetector
+from src.journal import RunJournal
+from src.utils import CSV_COLUMNS
+from src.youtube_processor import YouTubeProcessor
+
+CONFIG = SimpleNamespace(
+    feed_check_enabled=False,
+    exact_publish_dates=False,
+    delay_between_videos=0,
+    drive_transcripts_folder="Transcripts",
+    drive_summaries_folder="Summaries",
+    drive_audio_folder="Audio",
+    drive_base_folder="Base",
+    drive_direct_upload=False,
+    drive_local_copy=False,
+    drive_upload_workers=2,
+    drive_max_inflight_mb=8,
+    tts_audio_encoding="MP3",
+    openai_pack_enabled=False,
+    summary_timestamps=False,
+    circuit_requeue_wait=0,
+)
+
+
+class OfflineProcessor(YouTubeProcessor):
+    """No new uploads; only transcripts left by earlier runs are processed"""
+
+    def iter_channel_videos(self, channel_username, channel_folder):
+        return iter(())
+
+
+class FlakySummarizer:
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+        self.last_engine = None
+
+    def packable(self, transcript_text):
+        return False
+
+    def generate_summary(self, transcript_text, channel_details, video_details):
+        self.calls += 1
+        if self.calls <= self.failures:
+            request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+            raise openai.InternalServerError("upstream 500", response=httpx.Response(500, request=request), body=None)
+        self.last_engine = "openai"
+        return f"Summary of {video_details}"
+
+
+class FakeTTS:
+    batch_size = 1
+
+    def render_batch(self, texts):
+        return [b"audio" for _ in texts]
+
+
+class FakeDrive:
+    def __init__(self):
+        self.uploaded = []
+
+    def get_or_create_folder(self, name, parent_folder_id=None):
+        return name
+
+    def upload_file(self, path, folder_id=None, mimetype=None):
+        self.uploaded.append(path)
+        return f"id-{len(self.uploaded)}"
+
+
+@pytest.fixture
+def channel(tmp_path, monkeypatch):
+    monkeypatch.setattr(RunJournal, "_instances", {})
+    artifacts.configure(CONFIG)
+    processor = OfflineProcessor(CONFIG)
+    folder = processor.prepare_channel_folder("chan", tmp_path)
+    transcript = folder / "Transcripts" / "Talk_20260101.txt"
+    transcript.write_text("A transcript.", encoding="utf-8")
+    with open(folder / "channel_data.csv", "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        writer.writerow({
+            "Video URL": "https://www.youtube.com/watch?v=abc",
+            "Video ID": "abc",
+            "Upload Date": "1 day ago",
+            "Scrape Date": "2026-01-02 10:00:00",
+            "Status": "SUCCESS",
+            "Transcript File": transcript.name,
+        })
+    return SimpleNamespace(processor=processor, folder=folder, transcript=transcript, root=tmp_path)
+
+
+def run_once(channel, summarizer, drive):
+    deferred = []
+    folder = main.process_channel_complete(
+        "chan", channel.root, channel.processor, summarizer, FakeTTS(), CONFIG, deferred=deferred,
+    )
+    main.upload_channel_files(folder, "chan", drive, CONFIG, keep_files=main.deferred_output_paths(deferred, CONFIG))
+    return deferred
+
+
+def test_failed_summary_is_retried_on_next_run(channel, monkeypatch):
+    summarizer = FlakySummarizer(failures=1)
+    drive = FakeDrive()
+
+    deferred = run_once(channel, summarizer, drive)
+    assert [(record["video_id"], stage) for record, _, _, stage in deferred] == [("abc", "openai")]
+    assert channel.transcript.exists()
+    assert drive.uploaded == []
+
+    # Next run: a fresh journal finds the transcript still pending
+    monkeypatch.setattr(RunJournal, "_instances", {})
+    assert run_once(channel, summarizer, drive) == []
+    assert summarizer.calls == 2
+    assert sorted(path.rsplit("/", 1)[-1] for path in drive.uploaded) == [
+        "Talk_20260101.mp3", "Talk_20260101.txt", "Talk_20260101_summary.txt",
+    ]
+
+
+def test_non_upstream_errors_are_not_deferred(channel):
+    class BrokenSummarizer(FlakySummarizer):
+        def generate_summary(self, *args):
+            raise KeyError("choices")
+
+    assert run_once(channel, BrokenSummarizer(failures=0), FakeDrive()) == []
+
+
+class PackingSummarizer(FlakySummarizer):
+    def __init__(self):
+        super().__init__(failures=0)
+        self.packed = []
+        self.unavailable_keys = set()
+
+    def packable(self, transcript_text):
+        return True
+
+    def summarize_packed(self, items):
+        self.packed.append([item["key"] for item in items])
+        return {item["key"]: (f"Summary of {item['key']}", "openai") for item in items}
+
+
+def test_near_duplicates_in_one_batch_are_summarized_once(channel, tmp_path):
+    detector = DuplicateDetector(SimpleNamespace(
+        dedup_index_path=str(tmp_path / "dedup_index.json"),
+        dedup_threshold=0.8,
+        dedup_shingle_size=3,
+        dedup_num_perm=128,
+        dedup_bands=32,
+    ))
+    talk = " ".join(f"word{i}" for i in range(200))
+    records = []
+    for video_id, text in (("first", talk), ("reupload", talk + " thanks"), ("other", "something else entirely")):
+        transcript = channel.folder / "Transcripts" / f"{video_id}_20260101.txt"
+        transcript.write_text(text, encoding="utf-8")
+        records.append({"video_id": video_id, "video_url": "", "transcript_path": transcript, "status": "SUCCESS"})
+
+    summarizer = PackingSummarizer()
+    batch = []
+    for record in records:
+        assert not main.process_video_outputs(
+            record, "chan", channel.folder, summarizer, FakeTTS(), CONFIG,
+            duplicate_detector=detector, summary_batch=batch,
+        )
+    assert main.flush_summary_batch(
+        batch, summarizer, FakeTTS(), CONFIG, duplicate_detector=detector, deferred=[],
+    ) == 3
+
+    assert summarizer.packed == [["first", "other"]]
+    assert (channel.folder / "Summaries" / "reupload_20260101_duplicate.txt").exists()
+    assert not (channel.folder / "Summaries" / "reupload_20260101_summary.txt").exists()
+    # The batch was written to the index once it was done
+    assert sorted(DuplicateDetector(detector.config).entries) == ["first", "other"]
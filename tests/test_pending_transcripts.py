@@ -0,0 +1,90 @@
+# ABOUTME: Recovery of transcripts left on disk by earlier runs, including CSV rows from older versions
+import csv
+from types import SimpleNamespace
+
+from src.youtube_processor import YouTubeProcessor
+
+CONFIG = SimpleNamespace(
+    feed_check_enabled=False,
+    exact_publish_dates=False,
+    delay_between_videos=0,
+    drive_transcripts_folder="transcripts",
+    drive_summaries_folder="summaries",
+    drive_audio_folder="audio",
+)
+
+
+def write_csv(channel_folder, rows, columns):
+    with open(channel_folder / "channel_data.csv", "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def legacy_row(video_id, upload_date, scrape_date, status="SUCCESS"):
+    return {
+        "Video URL": f"https://www.youtube.com/watch?v={video_id}",
+        "Video ID": video_id,
+        "Upload Date": upload_date,
+        "Scrape Date": scrape_date,
+        "Status": status,
+    }
+
+
+def pending(tmp_path):
+    processor = YouTubeProcessor(CONFIG)
+    channel_folder = processor.prepare_channel_folder("chan", tmp_path)
+    return processor, channel_folder
+
+
+def test_named_rows_use_the_recorded_file(tmp_path):
+    processor, channel_folder = pending(tmp_path)
+    transcript = channel_folder / "transcripts" / "Talk_20260101.txt"
+    transcript.write_text("hello", encoding="utf-8")
+    row = dict(legacy_row("abc", "2 days ago", "2026-01-03 10:00:00"), **{"Transcript File": transcript.name})
+    write_csv(channel_folder, [row], list(row))
+
+    records = list(processor.iter_pending_transcripts(channel_folder))
+    assert [(r["video_id"], r["transcript_path"]) for r in records] == [("abc", transcript)]
+
+
+def test_legacy_rows_are_matched_by_publish_date(tmp_path):
+    processor, channel_folder = pending(tmp_path)
+    transcripts = channel_folder / "transcripts"
+    (transcripts / "Old_talk_20260101.txt").write_text("a", encoding="utf-8")
+    (transcripts / "Same_day_one_20260105.txt").write_text("b", encoding="utf-8")
+    (transcripts / "Same_day_two_20260105.txt").write_text("c", encoding="utf-8")
+    write_csv(
+        channel_folder,
+        [
+            legacy_row("old", "2 days ago", "2026-01-03 10:00:00"),
+            legacy_row("dup1", "1 day ago", "2026-01-06 09:00:00"),
+            legacy_row("dup2", "1 day ago", "2026-01-06 09:00:05"),
+            legacy_row("gone", "1 week ago", "2026-01-20 09:00:00"),
+            legacy_row("failed", "2 days ago", "2026-01-03 10:00:00", status="FAILED"),
+        ],
+        ["Video URL", "Video ID", "Upload Date", "Scrape Date", "Status"],
+    )
+
+    records = list(processor.iter_pending_transcripts(channel_folder))
+    # Two unnamed videos on 2026-01-05 cannot be told apart, and "gone" has no file
+    assert [(r["video_id"], r["transcript_path"].name) for r in records] == [("old", "Old_talk_20260101.txt")]
+
+
+def test_legacy_rows_skip_files_claimed_by_named_rows(tmp_path):
+    processor, channel_folder = pending(tmp_path)
+    transcripts = channel_folder / "transcripts"
+    (transcripts / "New_20260101.txt").write_text("a", encoding="utf-8")
+    (transcripts / "Old_20260101.txt").write_text("b", encoding="utf-8")
+    columns = ["Video URL", "Video ID", "Upload Date", "Scrape Date", "Status", "Transcript File"]
+    write_csv(
+        channel_folder,
+        [
+            dict(legacy_row("old", "2 days ago", "2026-01-03 10:00:00"), **{"Transcript File": ""}),
+            dict(legacy_row("new", "1 day ago", "2026-01-02 10:00:00"), **{"Transcript File": "New_20260101.txt"}),
+        ],
+        columns,
+    )
+
+    records = {r["video_id"]: r["transcript_path"].name for r in processor.iter_pending_transcripts(channel_folder)}
+    assert records == {"new": "New_20260101.txt", "old": "Old_20260101.txt"}
@@ -0,0 +1,191 @@
+# ABOUTME: Circuit breaker transitions, retry classification, deadlines and per-attempt spans of upstream calls
+import threading
+import time
+
+import httplib2
+import httpx
+import openai
+import pytest
+import requests
+from google.api_core import exceptions as google_exceptions
+from googleapiclient.errors import HttpError
+
+from src import resilience as resilience_module
+from src.resilience import CircuitBreaker, Resilience, StageDeadlineExceeded, is_retryable
+from src.tracing import tracer
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for cooldowns"""
+    now = [1000.0]
+    monkeypatch.setattr(resilience_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def open_breaker(breaker):
+    for _ in range(breaker.min_calls):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_opens_once_error_rate_reached(clock):
+    breaker = CircuitBreaker("test", window=10, min_calls=4, error_rate=0.5, cooldown=30)
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED  # below min_calls
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.trips == 1
+    assert not breaker.allow()
+    assert breaker.seconds_until_probe() == pytest.approx(30)
+
+
+def test_half_open_allows_a_single_probe(clock):
+    breaker = CircuitBreaker("test", min_calls=2, cooldown=30)
+    open_breaker(breaker)
+    clock[0] += 30
+    assert breaker.available()
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.available()
+    assert not breaker.allow()
+
+
+def test_successful_probe_closes(clock):
+    breaker = CircuitBreaker("test", min_calls=2, cooldown=30)
+    open_breaker(breaker)
+    clock[0] += 30
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+    # Outcomes from before the trip no longer count
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failed_probe_reopens_with_doubled_cooldown(clock):
+    breaker = CircuitBreaker("test", min_calls=2, cooldown=30, max_cooldown=50)
+    open_breaker(breaker)
+    clock[0] += 30
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.seconds_until_probe() == pytest.approx(50)  # 60, capped at max_cooldown
+    assert breaker.trips == 2
+
+
+def test_trip_opens_immediately(clock):
+    breaker = CircuitBreaker("test", cooldown=30)
+    breaker.trip("blocked")
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def http_error(status, content=b""):
+    return HttpError(httplib2.Response({"status": status}), content)
+
+
+@pytest.mark.parametrize("status", [500, 502, 504, 408])
+def test_unknown_outcome_statuses_retry_only_when_idempotent(status):
+    assert is_retryable(http_error(status), idempotent=True)
+    assert not is_retryable(http_error(status), idempotent=False)
+
+
+def test_rejected_requests_always_retry():
+    assert is_retryable(http_error(429), idempotent=False)
+    assert is_retryable(http_error(503), idempotent=False)
+    rate_limited = http_error(403, b'{"error": {"errors": [{"reason": "userRateLimitExceeded"}]}}')
+    assert is_retryable(rate_limited, idempotent=False)
+
+
+def test_client_errors_never_retry():
+    assert not is_retryable(http_error(404), idempotent=True)
+    assert not is_retryable(http_error(403, b"forbidden"), idempotent=True)
+
+
+@pytest.fixture
+def wrapper():
+    instance = Resilience()
+    instance.backoff = 0.01
+    yield instance
+    instance.shutdown()
+
+
+def test_non_idempotent_call_is_awaited_past_its_deadline(wrapper):
+    wrapper.deadlines["slow"] = 0.05
+
+    def slow(timeout):
+        time.sleep(0.2)
+        return "applied"
+
+    assert wrapper.call("slow", slow, idempotent=False) == "applied"
+
+
+def test_idempotent_call_is_abandoned_at_its_deadline(wrapper):
+    wrapper.deadlines["slow"] = 0.05
+    with pytest.raises(StageDeadlineExceeded):
+        wrapper.call("slow", lambda timeout: time.sleep(0.2), idempotent=True)
+
+
+def test_queued_call_is_cancelled_at_its_deadline(wrapper):
+    wrapper.max_workers = 1
+    wrapper.deadlines["slow"] = 0.05
+    release = threading.Event()
+    wrapper._pool().submit(release.wait)
+    ran = []
+    try:
+        with pytest.raises(StageDeadlineExceeded):
+            wrapper.call("slow", lambda timeout: ran.append(True), idempotent=False)
+    finally:
+        release.set()
+    wrapper.shutdown()
+    assert ran == []
+
+
+def test_every_attempt_gets_a_span(wrapper, monkeypatch):
+    monkeypatch.setattr(tracer, "enabled", True)
+    monkeypatch.setattr(tracer, "sample_rate", 1.0)
+    monkeypatch.setattr(tracer, "spans", [])
+    outcomes = [http_error(503), "ok"]
+
+    def flaky(timeout):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    with tracer.trace("video", "video.test"):
+        assert wrapper.call("drive", flaky, operation="drive.list", idempotent=True) == "ok"
+
+    attempts = [span for span in tracer.spans if span.name == "drive.list"]
+    assert [(span.attributes["attempt"], span.error is None) for span in attempts] == [(1, False), (2, True)]
+    root = next(span for span in tracer.spans if span.name == "video.test")
+    assert {span.parent_id for span in attempts} == {root.span_id}
+
+
+def openai_error(status):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    return openai.APIStatusError("error", response=httpx.Response(status, request=request), body=None)
+
+
+def requests_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.exceptions.HTTPError(response=response)
+
+
+def google_error(status):
+    return google_exceptions.from_http_status(status, "error")
+
+
+@pytest.mark.parametrize("make_error", [http_error, openai_error, requests_error, google_error])
+def test_classification_is_the_same_for_every_client(make_error):
+    for status in (500, 502, 504):
+        assert is_retryable(make_error(status), idempotent=True)
+        assert not is_retryable(make_error(status), idempotent=False)
+    for status in (429, 503):
+        assert is_retryable(make_error(status), idempotent=False)
+    assert not is_retryable(make_error(400), idempotent=True)
@@ -0,0 +1,32 @@
+# ABOUTME: search.py command-line handling of FTS5 queries
+import sys
+
+import pytest
+
+import search
+from src.search_index import SearchIndex
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    path = tmp_path / "index.db"
+    SearchIndex(str(path)).close()
+    return str(path)
+
+
+def run(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["search.py", *argv])
+    search.main()
+
+
+@pytest.mark.parametrize("query", ["c++", '"unbalanced', "AND"])
+def test_invalid_syntax_exits_with_message(monkeypatch, capsys, index_path, query):
+    with pytest.raises(SystemExit) as exit_info:
+        run(monkeypatch, "--index", index_path, query)
+    assert exit_info.value.code == 1
+    assert "Invalid search syntax" in capsys.readouterr().out
+
+
+def test_valid_query_reports_results(monkeypatch, capsys, index_path):
+    run(monkeypatch, "--index", index_path, '"c++"')
+    assert "0 result(s)" in capsys.readouterr().out
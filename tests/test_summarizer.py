@@ -0,0 +1,160 @@
+# ABOUTME: Summarizer fallback to the local engine only when OpenAI is down, and packed requests
+import json
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from src import summarizer as summarizer_module
+from src.summarizer import Summarizer
+
+CONFIG = SimpleNamespace(local_summary_max_sentences=3, local_summary_threshold_chars=0, local_summary_fallback=True)
+TRANSCRIPT = "The first point is speed. The second point is cost. The third point is safety. " * 5
+
+
+@pytest.fixture
+def summarizer(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    return Summarizer(CONFIG)
+
+
+def fail_with(summarizer, monkeypatch, error, trips_circuit):
+    """Make the OpenAI call raise error, opening the circuit as it does if trips_circuit"""
+    circuit = {"open": False}
+
+    def openai_summary(*args):
+        circuit["open"] = trips_circuit
+        raise error
+
+    monkeypatch.setattr(summarizer, "_openai_summary", openai_summary)
+    monkeypatch.setattr(summarizer_module.Summarizer, "_circuit_open", staticmethod(lambda: circuit["open"]))
+
+
+def server_error():
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    return openai.InternalServerError("boom", response=httpx.Response(500, request=request), body=None)
+
+
+def test_outage_that_opened_the_circuit_falls_back(summarizer, monkeypatch):
+    fail_with(summarizer, monkeypatch, server_error(), trips_circuit=True)
+    summary = summarizer.generate_summary(TRANSCRIPT, "Channel", "Video")
+    assert summary.startswith("Channel. Video.")
+    assert summarizer.last_engine == "extractive"
+
+
+def test_other_errors_propagate_even_with_circuit_open(summarizer, monkeypatch):
+    fail_with(summarizer, monkeypatch, KeyError("choices"), trips_circuit=True)
+    with pytest.raises(KeyError):
+        summarizer.generate_summary(TRANSCRIPT, "Channel", "Video")
+
+
+def test_outage_with_circuit_closed_propagates(summarizer, monkeypatch):
+    fail_with(summarizer, monkeypatch, server_error(), trips_circuit=False)
+    with pytest.raises(openai.InternalServerError):
+        summarizer.generate_summary(TRANSCRIPT, "Channel", "Video")
+
+
+PACK_CONFIG = SimpleNamespace(
+    local_summary_max_sentences=3,
+    local_summary_threshold_chars=0,
+    local_summary_fallback=False,
+    openai_pack_enabled=True,
+    openai_pack_max_chars=4000,
+    openai_pack_max_tokens=3000,
+    openai_pack_max_videos=5,
+    openai_pack_max_output_tokens=4000,
+    max_tokens=500,
+    summary_timestamps=False,
+)
+
+
+@pytest.fixture
+def packer(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    packer = Summarizer(PACK_CONFIG)
+    monkeypatch.setattr(summarizer_module.Summarizer, "_circuit_open", staticmethod(lambda: False))
+    packer.single_requests = []
+
+    def openai_summary(transcript_text, channel_details, video_details):
+        packer.single_requests.append(video_details)
+        return f"Single summary of {video_details}"
+
+    monkeypatch.setattr(packer, "_openai_summary", openai_summary)
+    return packer
+
+
+def respond_with(packer, monkeypatch, summaries):
+    """Answer packed requests with {"summaries": summaries}, recording each prompt"""
+    packer.prompts = []
+
+    def chat_completion(prompt, max_tokens=None, **options):
+        packer.prompts.append(prompt)
+        content = json.dumps({"summaries": summaries})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=None)
+
+    monkeypatch.setattr(packer, "_chat_completion", chat_completion)
+
+
+def items(count):
+    return [
+        {
+            "key": f"video{idx}",
+            "transcript_text": f"Transcript {idx}. " * 20,
+            "channel_details": "Channel: chan",
+            "video_details": f"Title: Talk {idx}",
+        }
+        for idx in range(count)
+    ]
+
+
+def long_summary(label):
+    return f"{label} covers the main points of the talk in enough detail to be a real summary of it."
+
+
+def test_packed_response_is_split_per_video(packer, monkeypatch):
+    respond_with(packer, monkeypatch, [
+        {"id": "v2", "summary": long_summary("Second")},
+        {"id": "v1", "summary": "**" + long_summary("First") + "**"},
+        {"id": "v3", "summary": long_summary("Third")},
+    ])
+    results = packer.summarize_packed(items(3))
+
+    assert len(packer.prompts) == 1
+    assert all(f"=== Video v{idx} ===" in packer.prompts[0] for idx in (1, 2, 3))
+    assert results == {
+        "video0": (long_summary("First"), "openai-packed"),
+        "video1": (long_summary("Second"), "openai-packed"),
+        "video2": (long_summary("Third"), "openai-packed"),
+    }
+    assert packer.single_requests == []
+
+
+def test_video_missing_from_the_response_gets_its_own_request(packer, monkeypatch):
+    respond_with(packer, monkeypatch, [
+        {"id": "v1", "summary": long_summary("First")},
+        {"id": "v2", "summary": "Too short."},
+        {"id": "v9", "summary": long_summary("Unknown")},
+    ])
+    results = packer.summarize_packed(items(3))
+
+    assert results["video0"] == (long_summary("First"), "openai-packed")
+    assert results["video1"] == ("Single summary of Title: Talk 1", "openai")
+    assert results["video2"] == ("Single summary of Title: Talk 2", "openai")
+    assert packer.single_requests == ["Title: Talk 1", "Title: Talk 2"]
+
+
+def test_unusable_response_falls_back_for_every_video(packer, monkeypatch):
+    respond_with(packer, monkeypatch, "not a list")
+    results = packer.summarize_packed(items(2))
+    assert {key: engine for key, (_, engine) in results.items()} == {"video0": "openai", "video1": "openai"}
+
+
+def test_packs_respect_the_video_limit(packer, monkeypatch):
+    respond_with(packer, monkeypatch, [
+        {"id": f"v{idx}", "summary": long_summary(f"Video {idx}")} for idx in range(1, 6)
+    ])
+    packer.summarize_packed(items(7))
+    # 5 + 2; the second pack only finds v1 and v2 in the response
+    assert len(packer.prompts) == 2
+    assert packer.single_requests == []
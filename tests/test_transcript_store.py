@@ -0,0 +1,90 @@
+# ABOUTME: Round trips through the compressed transcript segment store, appends and damaged files
+import pytest
+
+from src.transcript_store import (
+    BLOCK_HEADER,
+    MAGIC,
+    append_segments,
+    encode_segments,
+    read_segments,
+    read_transcript_text,
+    to_timestamped_text,
+)
+
+SEGMENTS = [{"text": f"line {i} é", "start": i * 2.0, "duration": 2.0} for i in range(10)]
+
+
+def write_store(tmp_path, block_size):
+    path = tmp_path / "talk.tsz"
+    path.write_bytes(encode_segments(SEGMENTS, block_size=block_size))
+    return path
+
+
+def test_round_trip(tmp_path):
+    path = write_store(tmp_path, block_size=3)
+    assert read_segments(path) == SEGMENTS
+    assert read_transcript_text(path) == "\n".join(segment["text"] for segment in SEGMENTS)
+
+
+def test_time_window_read(tmp_path):
+    path = write_store(tmp_path, block_size=3)
+    assert [segment["text"] for segment in read_segments(path, start=7.0, end=10.0)] == [
+        "line 3 é", "line 4 é", "line 5 é",
+    ]
+
+
+def test_plain_text_files_are_read_as_is(tmp_path):
+    path = tmp_path / "talk.txt"
+    path.write_text("hello\nworld", encoding="utf-8")
+    assert read_transcript_text(path) == "hello\nworld"
+
+
+def test_append_adds_blocks_without_rewriting(tmp_path):
+    path = tmp_path / "live.tsz"
+    append_segments(path, SEGMENTS[:4], block_size=3)
+    before = path.read_bytes()
+    append_segments(path, SEGMENTS[4:], block_size=3)
+    assert path.read_bytes().startswith(before)
+    assert read_segments(path) == SEGMENTS
+
+
+def test_append_refuses_other_files(tmp_path):
+    path = tmp_path / "talk.tsz"
+    path.write_bytes(b"not a store")
+    with pytest.raises(ValueError):
+        append_segments(path, SEGMENTS)
+
+
+def test_timestamped_view(tmp_path):
+    path = tmp_path / "talk.tsz"
+    path.write_bytes(encode_segments([
+        {"text": "intro", "start": 0.0, "duration": 5.0},
+        {"text": "deep dive", "start": 3725.4, "duration": 5.0},
+    ]))
+    assert to_timestamped_text(path) == "[00:00:00] intro\n[01:02:05] deep dive"
+    assert read_transcript_text(path, timestamps=True) == to_timestamped_text(path)
+    assert read_transcript_text(path) == "intro\ndeep dive"
+
+
+@pytest.mark.parametrize("cut", [3, 10, 40])
+def test_truncated_file_is_reported(tmp_path, cut):
+    path = write_store(tmp_path, block_size=100)
+    path.write_bytes(path.read_bytes()[:-cut])
+    with pytest.raises(ValueError, match="Truncated"):
+        read_segments(path)
+
+
+def test_corrupt_block_is_reported(tmp_path):
+    path = write_store(tmp_path, block_size=100)
+    data = bytearray(path.read_bytes())
+    data[len(MAGIC) + BLOCK_HEADER.size + 5] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="Corrupt"):
+        read_segments(path)
+
+
+def test_wrong_magic_is_reported(tmp_path):
+    path = tmp_path / "talk.tsz"
+    path.write_bytes(b"PK\x03\x04")
+    with pytest.raises(ValueError, match="not a transcript store"):
+        read_segments(path)
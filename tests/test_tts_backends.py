@@ -0,0 +1,138 @@
+# ABOUTME: Local TTS engine subprocess handling and ffmpeg transcoding, driven by fake engine scripts
+import json
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from src.audio_formats import wav_sample_rate
+from src.tts import TextToSpeech
+from src.tts_backends import LocalTTSBackend, create_backend
+
+ENGINE = '''
+import struct, sys
+text = sys.stdin.read()
+if "fail" in text:
+    sys.stderr.write("engine crashed")
+    sys.exit(3)
+rate = 22050
+samples = text.encode("utf-8")
+fmt = struct.pack("<HHIIHH", 1, 1, rate, rate * 2, 2, 16)
+body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt + b"data" + struct.pack("<I", len(samples)) + samples
+wav = b"RIFF" + struct.pack("<I", len(body)) + body
+outputs = [arg for arg in sys.argv[1:] if arg.endswith(".wav")]
+if outputs:
+    open(outputs[0], "wb").write(wav)
+else:
+    sys.stdout.buffer.write(wav)
+'''
+
+# Records its arguments and the size of its input instead of encoding
+FFMPEG = '''
+import json, os, sys
+args = sys.argv[1:]
+source = args[args.index("-i") + 1]
+with open(args[-1], "w") as f:
+    json.dump({"args": args, "input_bytes": os.path.getsize(source)}, f)
+'''
+
+
+def script(tmp_path, name, source):
+    path = tmp_path / name
+    path.write_text(f"#!{sys.executable}\n{source}", encoding="utf-8")
+    path.chmod(0o755)
+    return str(path)
+
+
+@pytest.fixture
+def config(tmp_path):
+    return SimpleNamespace(
+        tts_backend="local",
+        tts_audio_encoding="LINEAR16",
+        tts_local_command=[script(tmp_path, "engine", ENGINE)],
+        tts_local_workers=4,
+        tts_local_batch_size=8,
+        tts_local_chunk_bytes=40,
+        tts_local_timeout=30,
+        tts_sample_rate=22050,
+    )
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path):
+    return script(tmp_path, "ffmpeg", FFMPEG)
+
+
+def samples(wav_data):
+    return wav_data[44:]
+
+
+def test_chunks_come_back_in_order(config):
+    backend = LocalTTSBackend(config, "LINEAR16")
+    chunks = [f"chunk number {i}." for i in range(10)]
+    assert [samples(audio).decode() for audio in backend.synthesize_chunks(chunks)] == chunks
+
+
+def test_engine_can_write_to_an_output_file(config):
+    config.tts_local_command = config.tts_local_command + ["--out", "{output}"]
+    backend = LocalTTSBackend(config, "LINEAR16")
+    assert samples(backend.synthesize_chunks(["hello."])[0]) == b"hello."
+
+
+def test_pcm_at_the_engine_rate_skips_ffmpeg(config):
+    backend = LocalTTSBackend(config, "LINEAR16")
+    backend.ffmpeg = None
+    audio = backend.finalize(backend.synthesize_chunks(["hello."])[0])
+    assert wav_sample_rate(audio) == 22050
+
+
+@pytest.mark.parametrize("encoding, sample_rate, codec, rate", [
+    ("MP3", 22050, "libmp3lame", "22050"),
+    ("OGG_OPUS", 22050, "libopus", "48000"),  # Opus cannot encode 22.05 kHz
+    ("OGG_OPUS", 24000, "libopus", "24000"),
+    ("LINEAR16", 16000, "pcm_s16le", "16000"),
+    ("MULAW", 8000, "pcm_mulaw", "8000"),
+])
+def test_ffmpeg_gets_codec_and_sample_rate(config, fake_ffmpeg, encoding, sample_rate, codec, rate):
+    config.tts_sample_rate = sample_rate
+    backend = LocalTTSBackend(config, encoding)
+    backend.ffmpeg = fake_ffmpeg
+    wav = backend.synthesize_chunks(["hello."])[0]
+    result = json.loads(backend.finalize(wav))
+    assert result["args"][result["args"].index("-c:a") + 1] == codec
+    assert result["args"][result["args"].index("-ar") + 1] == rate
+    assert result["input_bytes"] == len(wav)
+
+
+def test_missing_ffmpeg_is_reported(config):
+    backend = LocalTTSBackend(config, "MP3")
+    backend.ffmpeg = None
+    with pytest.raises(RuntimeError, match="ffmpeg is required"):
+        backend.finalize(backend.synthesize_chunks(["hello."])[0])
+
+
+def test_engine_failure_carries_its_stderr(config):
+    backend = LocalTTSBackend(config, "LINEAR16")
+    with pytest.raises(RuntimeError, match="exited with 3: engine crashed"):
+        backend.synthesize_chunks(["this will fail."])
+
+
+def test_missing_engine_is_reported(config):
+    config.tts_local_command = "no-such-tts-engine --voice en"
+    with pytest.raises(RuntimeError, match="not found"):
+        LocalTTSBackend(config, "LINEAR16")
+
+
+def test_unknown_backend_is_rejected(config):
+    config.tts_backend = "cloud9"
+    with pytest.raises(ValueError, match="Unsupported TTS backend"):
+        create_backend(config, "MP3")
+
+
+def test_batch_is_split_into_chunks_and_joined_per_text(config):
+    tts = TextToSpeech(config)
+    texts = ["First sentence here. Second sentence here. Third one.", "Short."]
+    audio = tts.render_batch(texts)
+    assert [samples(item).count(b".") for item in audio] == [3, 1]
+    assert all(item.count(b"RIFF") == 1 for item in audio)
+    assert tts.characters_synthesized > 0
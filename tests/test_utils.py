@@ -0,0 +1,76 @@
+# ABOUTME: Parsing of YouTube's relative upload labels and the channel CSV
+import csv
+from datetime import timedelta
+
+import pytest
+
+from src import utils
+from src.utils import RequestPacer, append_to_csv, parse_relative_time, relative_time_range
+
+
+@pytest.mark.parametrize(
+    "text, earliest, latest",
+    [
+        ("3 hours ago", timedelta(0), timedelta(hours=4, days=1)),
+        ("5 days ago", timedelta(days=4), timedelta(days=7)),
+        ("1 week ago", timedelta(days=6), timedelta(days=15)),
+        ("2 months ago", timedelta(days=55), timedelta(days=94)),
+        ("1 year ago", timedelta(days=364), timedelta(days=733)),
+        ("Streamed 2 years ago", timedelta(days=729), timedelta(days=1099)),
+    ],
+)
+def test_relative_time_range_is_padded(text, earliest, latest):
+    assert relative_time_range(text) == (earliest, latest)
+
+
+def test_relative_time_range_rejects_unknown_text():
+    assert relative_time_range("yesterday") is None
+    assert relative_time_range("") is None
+
+
+def test_parse_relative_time_uses_nominal_units():
+    assert parse_relative_time("3 days ago") == timedelta(days=3)
+    assert parse_relative_time("Premiered 2 months ago") == timedelta(days=60)
+    assert parse_relative_time("1 year ago") == timedelta(days=365)
+    assert parse_relative_time("soon") is None
+
+
+def test_append_to_csv_updates_rows_atomically(tmp_path, monkeypatch):
+    path = tmp_path / "channel_data.csv"
+    row = {"Video URL": "u", "Video ID": "abc", "Upload Date": "1 day ago", "Scrape Date": "s", "Status": "FAILED"}
+    append_to_csv(path, [row])
+    append_to_csv(path, [dict(row, Status="SUCCESS", **{"Transcript File": "t.txt"})])
+    append_to_csv(path, [dict(row, **{"Video ID": "def"})])
+
+    rows = list(csv.DictReader(path.open(encoding="utf-8")))
+    assert [(r["Video ID"], r["Status"], r["Transcript File"]) for r in rows] == [
+        ("abc", "SUCCESS", "t.txt"),
+        ("def", "FAILED", ""),
+    ]
+
+    def crash(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(utils.os, "replace", crash)
+    with pytest.raises(OSError):
+        append_to_csv(path, [dict(row, **{"Video ID": "ghi"})])
+    assert len(list(csv.DictReader(path.open(encoding="utf-8")))) == 2
+    assert [p.name for p in tmp_path.iterdir()] == ["channel_data.csv"]
+
+
+def test_pacer_spaces_requests_across_callers(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(utils.time, "monotonic", lambda: now[0])
+    pacer = RequestPacer(3)
+    # Three workers asking at once get consecutive slots
+    assert [pacer.reserve() for _ in range(3)] == [0.0, 3.0, 6.0]
+    # Time already spent since the last slot counts towards the wait
+    now[0] += 8
+    assert pacer.reserve() == pytest.approx(1.0)
+    now[0] += 20
+    assert pacer.reserve() == 0.0
+
+
+def test_pacer_without_delay_never_waits():
+    pacer = RequestPacer(0)
+    assert [pacer.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]